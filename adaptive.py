@@ -0,0 +1,228 @@
+"""
+Adaptive question selection from each learner's mistakes.
+
+A LearnerProfile counts outstanding errors per bit position (conversion
+quizzes) and per prefix length (subnet and classful quizzes). The next
+question is drawn from a weighted sampler with one slot per bit position or
+prefix length, weighted by its error count, plus an "any" slot of weight
+EXPLORE_WEIGHT that asks a question exactly as the unweighted generators
+would. With no mistakes on record every question is drawn the old way; the
+more often a learner gets a bit or a prefix wrong, the more often it comes
+back. A right answer takes one error off again.
+
+A slot counts at most MAX_ERRORS errors, so a few bad rounds cannot bury
+the "any" slot: one weak prefix gets about half of the questions at most, and
+MAX_ERRORS right answers in a row clear it again.
+
+The weights live in a Fenwick tree (binary indexed tree), so recording an
+attempt and drawing a question both take O(log n) for n <= 32 slots (at
+most six steps), and a learner's history is never rescanned. The trees are
+plain lists of ints and are stored in the quiz session.
+"""
+import random
+
+from classaddress import generate_random_classful_address
+
+BITS = 8
+MIN_PREFIX, MAX_PREFIX = 9, 30  # the classful quizzes ask about /9 to /30
+EXPLORE_WEIGHT = 4
+MAX_ERRORS = 4  # most errors counted per bit position or prefix length
+
+# Classes the quizzes ask about: (default mask, first octets)
+CLASS_RANGES = ((8, range(1, 127)), (16, range(128, 192)), (24, range(192, 224)))
+
+
+class FenwickSampler:
+    """
+    Weighted sampling over slots 0..n-1 with O(log n) updates.
+
+    Args:
+        weights (list): Initial non-negative int weight of every slot.
+        tree (list): A tree returned by to_list(), to continue from.
+    """
+
+    def __init__(self, weights=None, tree=None):
+        if tree is not None:
+            self.tree = list(tree)
+            return
+        # O(n) build: push each node's sum to its parent
+        self.tree = [0] + list(weights)
+        for index in range(1, len(self.tree)):
+            parent = index + (index & -index)
+            if parent < len(self.tree):
+                self.tree[parent] += self.tree[index]
+
+    def __len__(self):
+        return len(self.tree) - 1
+
+    def to_list(self):
+        return list(self.tree)
+
+    def add(self, slot, delta):
+        """
+        Change the weight of a slot by ``delta``.
+        """
+        index = slot + 1
+        while index < len(self.tree):
+            self.tree[index] += delta
+            index += index & -index
+
+    def prefix_sum(self, slot):
+        """
+        Returns:
+            int: Total weight of slots 0..slot - 1.
+        """
+        total = 0
+        while slot > 0:
+            total += self.tree[slot]
+            slot -= slot & -slot
+        return total
+
+    def weight(self, slot):
+        return self.prefix_sum(slot + 1) - self.prefix_sum(slot)
+
+    def total(self):
+        return self.prefix_sum(len(self))
+
+    def sample(self, rng=random):
+        """
+        Draw a slot with probability proportional to its weight.
+
+        Returns:
+            int: The slot.
+
+        Examples:
+            >>> FenwickSampler([0, 0, 5, 0]).sample()
+            2
+        """
+        target = rng.randrange(self.total())
+        index = 0
+        step = 1 << (len(self).bit_length() - 1) if len(self) else 0
+        while step:
+            # descend to the last node whose prefix sum is <= target
+            following = index + step
+            if following < len(self.tree) and self.tree[following] <= target:
+                index = following
+                target -= self.tree[following]
+            step >>= 1
+        return index
+
+
+def _initial_weights(slots):
+    return [0] * slots + [EXPLORE_WEIGHT]
+
+
+class LearnerProfile:
+    """
+    One learner's error counts and the samplers built on them.
+
+    Args:
+        state (dict): What to_dict() returned, to continue from.
+    """
+
+    def __init__(self, state=None):
+        state = state or {}
+        # slot i < BITS is the bit worth 2 ** (7 - i), as in the 128..1 table
+        self.bits = FenwickSampler(_initial_weights(BITS), state.get("bits"))
+        # slot p is prefix length p; slots below MIN_PREFIX stay empty
+        self.prefixes = FenwickSampler(_initial_weights(MAX_PREFIX + 1), state.get("prefixes"))
+
+    def to_dict(self):
+        return {"bits": self.bits.to_list(), "prefixes": self.prefixes.to_list()}
+
+    def record_conversion(self, value, guess):
+        """
+        Record one guess at an 8-bit number.
+
+        Every bit the guess got wrong gains an error, up to MAX_ERRORS; a
+        right guess takes one error off every set bit of the number.
+
+        Args:
+            value (int): The number asked about (0-255).
+            guess (int): The learner's answer as a number. Guesses outside
+                0-255 are not counted.
+        """
+        if not 0 <= guess <= 255:
+            return
+        wrong = value ^ guess
+        for slot in range(BITS):
+            mask = 1 << (BITS - 1 - slot)
+            if wrong & mask:
+                if self.bits.weight(slot) < MAX_ERRORS:
+                    self.bits.add(slot, 1)
+            elif not wrong and value & mask and self.bits.weight(slot):
+                self.bits.add(slot, -1)
+
+    def record_prefix(self, prefix_length, score, total):
+        """
+        Record a graded subnet or classful quiz.
+
+        Each question answered wrong is an error for the prefix, up to
+        MAX_ERRORS; a fully right quiz takes one error off.
+
+        Args:
+            prefix_length (int): The prefix asked about.
+            score (int): Questions answered right.
+            total (int): Questions asked.
+        """
+        if not MIN_PREFIX <= prefix_length <= MAX_PREFIX:
+            return
+        weight = self.prefixes.weight(prefix_length)
+        if score < total:
+            self.prefixes.add(prefix_length, min(MAX_ERRORS, weight + total - score) - weight)
+        elif weight:
+            self.prefixes.add(prefix_length, -1)
+
+    def next_byte(self, rng=random):
+        """
+        Pick the number for the next conversion question.
+
+        Returns:
+            int: 0-255, with a weak bit set if one was drawn.
+        """
+        slot = self.bits.sample(rng)
+        value = rng.randint(0, 255)
+        if slot < BITS:
+            value |= 1 << (BITS - 1 - slot)
+        return value
+
+    def next_prefix(self, rng=random):
+        """
+        Pick the prefix length of the next subnet or classful question.
+
+        Returns:
+            int: MIN_PREFIX to MAX_PREFIX, or None to ask any question.
+        """
+        prefix_length = self.prefixes.sample(rng)
+        return None if prefix_length > MAX_PREFIX else prefix_length
+
+    def next_classful_address(self, rng=random):
+        """
+        Pick the address for the next subnet or classful question.
+
+        Returns:
+            tuple: (ip, default_mask, cidr_prefix), like
+            generate_random_classful_address().
+        """
+        prefix_length = self.next_prefix(rng)
+        if prefix_length is None:
+            return generate_random_classful_address(rng)
+        return classful_address_for_prefix(prefix_length, rng)
+
+
+def classful_address_for_prefix(prefix_length, rng=random):
+    """
+    Draw a class A, B or C address to ask about with a given prefix.
+
+    Args:
+        prefix_length (int): MIN_PREFIX to MAX_PREFIX.
+
+    Returns:
+        tuple: (ip, default_mask, prefix_length), like
+        generate_random_classful_address().
+    """
+    # a class whose default mask is shorter than the prefix
+    default_mask, first_octets = rng.choice(
+        [entry for entry in CLASS_RANGES if entry[0] < prefix_length])
+    ip = f"{rng.choice(first_octets)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}"
+    return ip, default_mask, prefix_length
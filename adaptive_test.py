@@ -0,0 +1,97 @@
+import random
+import unittest
+from collections import Counter
+
+from adaptive import BITS, EXPLORE_WEIGHT, MAX_ERRORS, MAX_PREFIX, FenwickSampler, LearnerProfile
+
+
+class TestFenwickSampler(unittest.TestCase):
+
+    def test_weights_and_updates(self):
+        sampler = FenwickSampler([3, 0, 5, 1, 0, 2])
+        self.assertEqual([sampler.weight(slot) for slot in range(6)], [3, 0, 5, 1, 0, 2])
+        self.assertEqual(sampler.total(), 11)
+        sampler.add(1, 4)
+        sampler.add(2, -5)
+        self.assertEqual([sampler.weight(slot) for slot in range(6)], [3, 4, 0, 1, 0, 2])
+        self.assertEqual(FenwickSampler(tree=sampler.to_list()).total(), 10)
+
+    def test_sample_covers_each_unit_of_weight_once(self):
+        weights = [3, 0, 5, 1, 0, 2, 0]
+        sampler = FenwickSampler(weights)
+
+        class Counting:
+            # hands out every target 0..total-1 in turn
+            def __init__(self):
+                self.next = 0
+
+            def randrange(self, stop):
+                self.next += 1
+                return (self.next - 1) % stop
+
+        rng = Counting()
+        drawn = Counter(sampler.sample(rng) for _ in range(sum(weights)))
+        self.assertEqual(drawn, Counter({slot: weight for slot, weight in enumerate(weights) if weight}))
+
+
+class TestLearnerProfile(unittest.TestCase):
+
+    def test_new_profile_only_explores(self):
+        profile = LearnerProfile()
+        self.assertEqual(profile.bits.total(), EXPLORE_WEIGHT)
+        self.assertEqual(profile.prefixes.total(), EXPLORE_WEIGHT)
+        ip, default_mask, prefix = profile.next_classful_address(random.Random(1))
+        self.assertTrue(default_mask + 1 <= prefix <= 30)
+
+    def test_conversion_errors_by_bit(self):
+        profile = LearnerProfile()
+        profile.record_conversion(0b10100000, 0b10000001)
+        self.assertEqual([profile.bits.weight(slot) for slot in range(BITS)], [0, 0, 1, 0, 0, 0, 0, 1])
+        profile.record_conversion(0b00100000, 0b00100000)
+        self.assertEqual(profile.bits.weight(2), 0)
+        profile.record_conversion(5, 999)
+        self.assertEqual(profile.bits.total(), EXPLORE_WEIGHT + 1)
+
+    def test_weak_prefix_comes_back_more_often(self):
+        profile = LearnerProfile()
+        for _ in range(12):
+            profile.record_prefix(27, 0, 3)
+        rng = random.Random(7)
+        drawn = Counter(profile.next_classful_address(rng)[2] for _ in range(2000))
+        self.assertGreater(drawn[27], 900)
+        profile.record_prefix(27, 3, 3)
+        self.assertEqual(profile.prefixes.weight(27), MAX_ERRORS - 1)
+        profile.record_prefix(MAX_PREFIX + 2, 0, 3)
+        self.assertEqual(profile.prefixes.total(), EXPLORE_WEIGHT + MAX_ERRORS - 1)
+
+    def test_errors_are_capped_so_other_questions_still_come(self):
+        profile = LearnerProfile()
+        for _ in range(10):
+            profile.record_prefix(27, 0, 5)
+            profile.record_conversion(0b00001000, 0)
+        self.assertEqual(profile.prefixes.weight(27), MAX_ERRORS)
+        self.assertEqual(profile.bits.weight(4), MAX_ERRORS)
+        rng = random.Random(5)
+        drawn = Counter(profile.next_prefix(rng) for _ in range(2000))
+        self.assertLess(drawn[27], 1200)
+        for _ in range(MAX_ERRORS):
+            profile.record_prefix(27, 5, 5)
+        self.assertEqual(profile.prefixes.total(), EXPLORE_WEIGHT)
+
+    def test_weak_bit_is_set_more_often(self):
+        profile = LearnerProfile()
+        for _ in range(20):
+            profile.record_conversion(0b00001000, 0)
+        rng = random.Random(3)
+        with_bit = sum(profile.next_byte(rng) & 0b00001000 != 0 for _ in range(2000))
+        self.assertGreater(with_bit, 1400)
+
+    def test_state_round_trip(self):
+        profile = LearnerProfile()
+        profile.record_prefix(20, 1, 3)
+        restored = LearnerProfile(profile.to_dict())
+        self.assertEqual(restored.prefixes.weight(20), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+"""
+Integer-based IPv4 address analysis shared by the quiz modules.
+
+Addresses are handled as 32-bit ints: the class comes from the leading bits
+of the first octet, and the network, broadcast and host range come from
+masking with the prefix. Nothing here builds ipaddress objects, so an
+analysis costs a handful of integer operations.
+
+Everything that depends only on the prefix length (masks, address map)
+comes from PREFIX_TABLE in wildcard_mask. Address strings are only produced
+when asked for, with int_to_ip().
+"""
+from collections import namedtuple
+
+from wildcard_mask import PREFIX_TABLE
+
+AddressClass = namedtuple("AddressClass", "name leading_bits default_prefix native_address_map")
+
+CLASS_A = AddressClass("A", "0", 8, "N.H.H.H")
+CLASS_B = AddressClass("B", "10", 16, "N.N.H.H")
+CLASS_C = AddressClass("C", "110", 24, "N.N.N.H")
+CLASS_D = AddressClass("D", "1110", None, None)  # multicast
+CLASS_E = AddressClass("E", "1111", None, None)  # reserved
+
+# Host-assignable classes the quizzes ask about
+CLASSFUL_CLASSES = (CLASS_A, CLASS_B, CLASS_C)
+
+Analysis = namedtuple(
+    "Analysis",
+    "address prefix address_class network broadcast first_host last_host")
+
+_OCTET_STRINGS = tuple(str(octet) for octet in range(256))
+
+
+def _class_by_leading_bits(first_octet):
+    if first_octet & 0b10000000 == 0:
+        return CLASS_A
+    if first_octet & 0b11000000 == 0b10000000:
+        return CLASS_B
+    if first_octet & 0b11100000 == 0b11000000:
+        return CLASS_C
+    if first_octet & 0b11110000 == 0b11100000:
+        return CLASS_D
+    return CLASS_E
+
+
+# Class of every first octet. 0 (this network) and 127 (loopback) are
+# reserved and have no class.
+CLASS_BY_FIRST_OCTET = tuple(
+    None if first_octet in (0, 127) else _class_by_leading_bits(first_octet)
+    for first_octet in range(256)
+)
+
+
+def ip_to_int(ip):
+    """
+    Convert a dotted decimal IPv4 address to a 32-bit int.
+
+    Args:
+        ip (str): The IP address, e.g. "192.168.1.10".
+
+    Returns:
+        int: The address as an int.
+
+    Raises:
+        ValueError: If the address is not four octets of 0-255.
+
+    Examples:
+        >>> ip_to_int('192.168.1.10')
+        3232235786
+    """
+    octets = ip.split(".")
+    if len(octets) != 4:
+        raise ValueError(f"Invalid IPv4 address: {ip!r}")
+    address = 0
+    for octet in octets:
+        if not octet.isdigit() or len(octet) > 3:
+            raise ValueError(f"Invalid IPv4 address: {ip!r}")
+        value = int(octet)
+        if value > 255:
+            raise ValueError(f"Invalid IPv4 address: {ip!r}")
+        address = (address << 8) | value
+    return address
+
+
+def int_to_ip(address):
+    """
+    Convert a 32-bit int to a dotted decimal IPv4 address.
+
+    Args:
+        address (int): The address as an int.
+
+    Returns:
+        str: The dotted decimal address.
+
+    Examples:
+        >>> int_to_ip(3232235786)
+        '192.168.1.10'
+    """
+    return (f"{_OCTET_STRINGS[address >> 24]}.{_OCTET_STRINGS[(address >> 16) & 0xFF]}."
+            f"{_OCTET_STRINGS[(address >> 8) & 0xFF]}.{_OCTET_STRINGS[address & 0xFF]}")
+
+
+def classify(address):
+    """
+    Determine the class of an address from its leading bits.
+
+    Args:
+        address (int): The address as an int.
+
+    Returns:
+        AddressClass: The class, or None for 0.x.x.x and 127.x.x.x.
+
+    Examples:
+        >>> classify(ip_to_int('172.16.0.1')).name
+        'B'
+    """
+    return CLASS_BY_FIRST_OCTET[address >> 24]
+
+
+def analyze(address, prefix_length):
+    """
+    Derive everything the quizzes ask about an address and prefix.
+
+    Args:
+        address (int): The address as an int.
+        prefix_length (int): The CIDR prefix length (0-32).
+
+    Returns:
+        Analysis: The address class, the PrefixInfo for the prefix (masks
+        and address map), the network and broadcast addresses, and the first
+        and last host (the whole /31 or /32 for those prefixes).
+
+    Raises:
+        ValueError: If the prefix length is outside 0-32.
+
+    Examples:
+        >>> result = analyze(ip_to_int('192.168.1.77'), 26)
+        >>> int_to_ip(result.network), int_to_ip(result.broadcast)
+        ('192.168.1.64', '192.168.1.127')
+        >>> int_to_ip(result.first_host), int_to_ip(result.last_host)
+        ('192.168.1.65', '192.168.1.126')
+        >>> result.prefix.wildcard_mask
+        '0.0.0.63'
+    """
+    if not 0 <= prefix_length <= 32:
+        raise ValueError(f"Invalid prefix length: {prefix_length}")
+    prefix = PREFIX_TABLE[prefix_length]
+    network = address & prefix.mask
+    broadcast = network | (prefix.mask ^ 0xFFFFFFFF)
+    if prefix_length >= 31:
+        first_host, last_host = network, broadcast
+    else:
+        first_host, last_host = network + 1, broadcast - 1
+    return Analysis(address, prefix, CLASS_BY_FIRST_OCTET[address >> 24],
+                    network, broadcast, first_host, last_host)
@@ -0,0 +1,51 @@
+import ipaddress
+import random
+import unittest
+from address_engine import analyze, classify, int_to_ip, ip_to_int, CLASS_A, CLASS_B, CLASS_C, CLASS_D, CLASS_E
+
+class TestAddressEngine(unittest.TestCase):
+
+    def test_round_trip(self):
+        for ip in ["0.0.0.0", "255.255.255.255", "10.1.2.3", "192.168.100.7"]:
+            self.assertEqual(int_to_ip(ip_to_int(ip)), ip)
+
+    def test_invalid_addresses(self):
+        for ip in ["", "1.2.3", "1.2.3.4.5", "256.1.1.1", "a.b.c.d", "1.2.3.-4", "1..2.3", "0001.2.3.4"]:
+            with self.assertRaises(ValueError):
+                ip_to_int(ip)
+
+    def test_classify(self):
+        self.assertIs(classify(ip_to_int("10.0.0.1")), CLASS_A)
+        self.assertIs(classify(ip_to_int("172.16.0.1")), CLASS_B)
+        self.assertIs(classify(ip_to_int("192.168.0.1")), CLASS_C)
+        self.assertIs(classify(ip_to_int("224.0.0.1")), CLASS_D)
+        self.assertIs(classify(ip_to_int("240.0.0.1")), CLASS_E)
+        self.assertIsNone(classify(ip_to_int("127.0.0.1")))
+        self.assertIsNone(classify(ip_to_int("0.1.2.3")))
+
+    def test_analyze_matches_ipaddress(self):
+        rng = random.Random(7)
+        for _ in range(2000):
+            address = rng.getrandbits(32)
+            prefix_length = rng.randint(0, 32)
+            result = analyze(address, prefix_length)
+            network = ipaddress.ip_network((address, prefix_length), strict=False)
+            self.assertEqual(result.network, int(network.network_address))
+            self.assertEqual(result.broadcast, int(network.broadcast_address))
+            self.assertEqual(result.prefix.mask, int(network.netmask))
+            self.assertEqual(result.prefix.wildcard_mask, str(network.hostmask))
+            if prefix_length < 31:
+                hosts = network.hosts()
+                self.assertEqual(result.first_host, int(next(hosts)))
+                self.assertEqual(result.last_host, result.broadcast - 1)
+
+    def test_analyze_small_subnets(self):
+        result = analyze(ip_to_int("10.0.0.5"), 31)
+        self.assertEqual((int_to_ip(result.first_host), int_to_ip(result.last_host)), ("10.0.0.4", "10.0.0.5"))
+        result = analyze(ip_to_int("10.0.0.5"), 32)
+        self.assertEqual(result.first_host, result.last_host)
+        with self.assertRaises(ValueError):
+            analyze(0, 33)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Input validation for classful quiz answers.
+
+Each field is checked with a precompiled pattern or a set lookup: the six
+native address map formats share one compiled regex, and masks are parsed
+to a 32-bit int and looked up in the set of the 33 valid masks instead of
+being regex-matched as a binary string.
+
+validate_field() returns None for a well-formed answer, or one of the
+reason codes below.
+"""
+import re
+
+from wildcard_mask import PREFIX_TABLE
+
+# Reasons an answer is rejected
+NOT_A_CHOICE = "not_a_choice"              # not one of the allowed values
+LOWERCASE = "lowercase"                    # n/h must be written as N/H
+BAD_FORMAT = "bad_format"                  # does not match the expected layout
+OCTET_OUT_OF_RANGE = "octet_out_of_range"  # an octet is outside 0-255
+NOT_CONTIGUOUS = "not_contiguous"          # mask bits are not one run of 1s then 0s
+UNKNOWN_FIELD = "unknown_field"            # no rule for this question
+
+ADDRESS_CLASSES = frozenset(['A', 'B', 'C', 'D', 'E'])
+LEADING_BIT_PATTERNS = frozenset(['0', '10', '110'])
+VALID_SUBNET_MASKS = frozenset(info.mask for info in PREFIX_TABLE)
+VALID_WILDCARD_MASKS = frozenset(info.mask ^ 0xFFFFFFFF for info in PREFIX_TABLE)
+
+# Named (N.N.N.H) or numeric (192.168.1.H) maps for classes C, B and A
+NATIVE_ADDRESS_MAP = re.compile(
+    r'^(?:N\.N\.N\.H|\d+\.\d+\.\d+\.H|N\.N\.H\.H|\d+\.\d+\.H\.H|N\.H\.H\.H|\d+\.H\.H\.H)$')
+
+
+def _validate_mask(value, valid_masks):
+    try:
+        octets = list(map(int, value.split(".")))
+    except ValueError:
+        return BAD_FORMAT
+    if len(octets) != 4:
+        return BAD_FORMAT
+    mask = 0
+    for octet in octets:
+        if not 0 <= octet <= 255:
+            return OCTET_OUT_OF_RANGE
+        mask = (mask << 8) | octet
+    return None if mask in valid_masks else NOT_CONTIGUOUS
+
+
+def _validate_native_address_map(value):
+    if 'n' in value or 'h' in value:
+        return LOWERCASE
+    return None if NATIVE_ADDRESS_MAP.match(value) else BAD_FORMAT
+
+
+_VALIDATORS = {
+    "Address Class": lambda value: None if value in ADDRESS_CLASSES else NOT_A_CHOICE,
+    "Native Address Map": _validate_native_address_map,
+    "Leading Bit Pattern": lambda value: None if value in LEADING_BIT_PATTERNS else NOT_A_CHOICE,
+    "Subnet Mask (SNM)": lambda value: _validate_mask(value, VALID_SUBNET_MASKS),
+    "Wildcard Mask (WCM)": lambda value: _validate_mask(value, VALID_WILDCARD_MASKS),
+}
+
+
+def validate_field(key, value):
+    """
+    Check one answer of the classful quiz.
+
+    Args:
+        key (str): The question, e.g. 'Subnet Mask (SNM)'.
+        value (str): The user's answer.
+
+    Returns:
+        str: None if the answer is well formed, otherwise a reason code.
+
+    Examples:
+        >>> validate_field('Subnet Mask (SNM)', '255.255.255.192')
+        >>> validate_field('Subnet Mask (SNM)', '255.0.255.0')
+        'not_contiguous'
+        >>> validate_field('Native Address Map', 'n.n.n.h')
+        'lowercase'
+    """
+    validator = _VALIDATORS.get(key)
+    if validator is None:
+        return UNKNOWN_FIELD
+    return validator(value)
+
+
+def validate_submission(answers):
+    """
+    Check every answer of a classful quiz submission in one pass.
+
+    Args:
+        answers (dict): Maps each question to the user's answer.
+
+    Returns:
+        dict: Maps each rejected question to its reason code; empty if
+        every answer is well formed.
+
+    Examples:
+        >>> validate_submission({'Address Class': 'C', 'Leading Bit Pattern': '111'})
+        {'Leading Bit Pattern': 'not_a_choice'}
+    """
+    errors = {}
+    for key, value in answers.items():
+        validator = _VALIDATORS.get(key)
+        reason = validator(value) if validator is not None else UNKNOWN_FIELD
+        if reason is not None:
+            errors[key] = reason
+    return errors
@@ -0,0 +1,47 @@
+import unittest
+from answer_validation import (validate_field, validate_submission, BAD_FORMAT, LOWERCASE,
+                               NOT_A_CHOICE, NOT_CONTIGUOUS, OCTET_OUT_OF_RANGE, UNKNOWN_FIELD,
+                               VALID_SUBNET_MASKS, VALID_WILDCARD_MASKS)
+
+class TestAnswerValidation(unittest.TestCase):
+
+    def test_mask_sets(self):
+        self.assertEqual(len(VALID_SUBNET_MASKS), 33)
+        self.assertEqual(len(VALID_WILDCARD_MASKS), 33)
+        self.assertIn(0xFFFFFF00, VALID_SUBNET_MASKS)
+        self.assertIn(0x000000FF, VALID_WILDCARD_MASKS)
+
+    def test_field_reasons(self):
+        self.assertIsNone(validate_field("Address Class", "C"))
+        self.assertEqual(validate_field("Address Class", "c"), NOT_A_CHOICE)
+        self.assertIsNone(validate_field("Native Address Map", "192.168.1.H"))
+        self.assertEqual(validate_field("Native Address Map", "N.n.N.H"), LOWERCASE)
+        self.assertEqual(validate_field("Native Address Map", "N.H.N.H"), BAD_FORMAT)
+        self.assertIsNone(validate_field("Leading Bit Pattern", "110"))
+        self.assertEqual(validate_field("Leading Bit Pattern", "111"), NOT_A_CHOICE)
+        self.assertIsNone(validate_field("Subnet Mask (SNM)", "255.255.255.0"))
+        self.assertIsNone(validate_field("Subnet Mask (SNM)", "0.0.0.0"))
+        self.assertEqual(validate_field("Subnet Mask (SNM)", "0.0.0.255"), NOT_CONTIGUOUS)
+        self.assertEqual(validate_field("Subnet Mask (SNM)", "255.255.255"), BAD_FORMAT)
+        self.assertEqual(validate_field("Subnet Mask (SNM)", "255.x.255.0"), BAD_FORMAT)
+        self.assertEqual(validate_field("Subnet Mask (SNM)", "256.0.0.0"), OCTET_OUT_OF_RANGE)
+        self.assertIsNone(validate_field("Wildcard Mask (WCM)", "0.0.0.255"))
+        self.assertEqual(validate_field("Wildcard Mask (WCM)", "255.255.255.0"), NOT_CONTIGUOUS)
+        self.assertEqual(validate_field("Question?", "x"), UNKNOWN_FIELD)
+
+    def test_submission(self):
+        answers = {
+            "Address Class": "B",
+            "Leading Bit Pattern": "10",
+            "Native Address Map": "n.n.h.h",
+            "Subnet Mask (SNM)": "255.255.0.0",
+            "Wildcard Mask (WCM)": "0.0.255.0",
+        }
+        self.assertEqual(validate_submission(answers),
+                         {"Native Address Map": LOWERCASE, "Wildcard Mask (WCM)": NOT_CONTIGUOUS})
+        answers["Native Address Map"] = "N.N.H.H"
+        answers["Wildcard Mask (WCM)"] = "0.0.255.255"
+        self.assertEqual(validate_submission(answers), {})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Versioned JSON API for the subnet and classful quizzes.
+
+    GET  /api/v1/quiz/<quiz_type>/question?count=N[&seed=S&start=K]
+    POST /api/v1/quiz/<quiz_type>/answer
+
+quiz_type is "classful" or "subnet". Questions are stateless: a question is
+an IP address and a prefix length, and the client sends both back with its
+answers, so no session is kept, nothing is rendered, and any worker can
+grade any submission. A question request returns::
+
+    {"fields": ["Subnet Address Map", ...], "questions": [{"ip": "172.16.5.4", "prefix": 20}]}
+
+With a seed, the questions are numbers start to start + count - 1 of that
+seed's question stream (see question_stream.py), the same ones the quiz
+pages ask in order when QUESTION_SEED is that seed and ADAPTIVE_QUESTIONS
+is off. An exam can be fetched
+in pages, or in parallel, and fetched again identically.
+
+An answer request posts one submission::
+
+    {"ip": "172.16.5.4", "prefix": 20, "answers": {"Subnet Mask": "255.255.240.0", ...}}
+
+or up to MAX_BATCH of them as ``{"submissions": [...]}``, and gets back one
+result per submission, in order, under "results". Graded submissions are
+written to the same result logs as the quiz pages.
+"""
+import random
+from collections import namedtuple
+
+from flask import Blueprint, current_app, jsonify, request
+from werkzeug.exceptions import BadRequest, HTTPException, NotFound
+
+from address_engine import ip_to_int
+from classaddress import generate_random_classful_address
+from grading import (CLASSFUL_FIELDS, SUBNET_FIELDS, classful_answers, classful_log_row, grade_classful,
+                     grade_subnet, subnet_answers, subnet_log_row)
+from question_stream import QuestionStream
+
+# Most questions or submissions handled by one request
+MAX_BATCH = 1000
+
+Quiz = namedtuple("Quiz", "log fields answer_key grade log_row")
+
+QUIZZES = {
+    "classful": Quiz("classful_quiz", CLASSFUL_FIELDS, classful_answers, grade_classful, classful_log_row),
+    "subnet": Quiz("subnet_quiz", SUBNET_FIELDS, subnet_answers, grade_subnet, subnet_log_row),
+}
+
+api = Blueprint("api", __name__, url_prefix="/api/v1")
+
+
+@api.errorhandler(HTTPException)
+def json_error(error):
+    return jsonify(error=error.description), error.code
+
+
+def _quiz(quiz_type):
+    quiz = QUIZZES.get(quiz_type)
+    if quiz is None:
+        raise NotFound(f"unknown quiz type {quiz_type!r}; expected one of {sorted(QUIZZES)}")
+    return quiz
+
+
+def grade_submission(quiz, submission):
+    """
+    Grade one submission of an answer request.
+
+    Args:
+        quiz (Quiz): The quiz from QUIZZES.
+        submission (dict): ip, prefix and answers, as posted.
+
+    Returns:
+        tuple: (result dict for the response, log row or None). The result
+        has score, total, correct (question -> bool) and key (question ->
+        correct answer), plus invalid (question -> reason code) if any answer
+        was malformed, or only an error if the submission itself was.
+    """
+    if not isinstance(submission, dict):
+        return {"error": "a submission must be an object"}, None
+    ip, prefix, answers = submission.get("ip"), submission.get("prefix"), submission.get("answers")
+    if not isinstance(ip, str) or type(prefix) is not int or not isinstance(answers, dict):
+        return {"error": "a submission needs ip (string), prefix (integer) and answers (object)"}, None
+    try:
+        ip_to_int(ip)
+        correct_answers = quiz.answer_key(ip, prefix)
+    except ValueError as error:
+        return {"error": str(error)}, None
+
+    user_answers = {key: str(answers.get(key, "")).strip() for key in quiz.fields}
+    results, score, invalid = quiz.grade(correct_answers, user_answers)
+    result = {
+        "score": score,
+        "total": len(correct_answers),
+        "correct": {item["question"]: item["correct"] for item in results},
+        "key": correct_answers,
+    }
+    if invalid:
+        # like the quiz page, a submission with malformed answers is not recorded
+        result["invalid"] = invalid
+        return result, None
+    return result, quiz.log_row(ip, prefix, correct_answers, user_answers, score)
+
+
+@api.get("/quiz/<quiz_type>/question")
+def question(quiz_type):
+    quiz = _quiz(quiz_type)
+    count = request.args.get("count", 1, type=int)
+    if not 1 <= count <= MAX_BATCH:
+        raise BadRequest(f"count must be between 1 and {MAX_BATCH}")
+    seed = request.args.get("seed")
+    start = request.args.get("start", 0, type=int)
+    if start < 0:
+        raise BadRequest("start must not be negative")
+    stream = QuestionStream(seed) if seed is not None else None
+    questions = []
+    for index in range(start, start + count):
+        rng = stream.rng(quiz.log, index) if stream is not None else random
+        ip, _, prefix = generate_random_classful_address(rng)
+        questions.append({"ip": ip, "prefix": prefix})
+    return jsonify(fields=quiz.fields, questions=questions)
+
+
+@api.post("/quiz/<quiz_type>/answer")
+def answer(quiz_type):
+    quiz = _quiz(quiz_type)
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        raise BadRequest("expected a JSON object")
+    submissions = body["submissions"] if "submissions" in body else [body]
+    if not isinstance(submissions, list) or not 1 <= len(submissions) <= MAX_BATCH:
+        raise BadRequest(f"submissions must be a list of 1 to {MAX_BATCH} objects")
+
+    results, rows = [], []
+    for submission in submissions:
+        result, row = grade_submission(quiz, submission)
+        results.append(result)
+        if row is not None:
+            rows.append(row)
+    if rows:
+        current_app.extensions["result_logs"][quiz.log].extend(rows)
+    return jsonify(results=results)
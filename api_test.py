@@ -0,0 +1,75 @@
+import unittest
+
+from api import MAX_BATCH
+from app_testing import AppTestCase
+from grading import classful_answers, subnet_answers
+
+
+class TestQuizAPI(AppTestCase):
+
+    def test_question(self):
+        body = self.client.get('/api/v1/quiz/subnet/question?count=5').get_json()
+        self.assertEqual(body['fields'], ['Subnet Address Map', 'Subnet Mask', 'Wildcard Mask'])
+        self.assertEqual(len(body['questions']), 5)
+        self.assertEqual(set(body['questions'][0]), {'ip', 'prefix'})
+
+    def test_seeded_questions_jump_ahead(self):
+        url = '/api/v1/quiz/classful/question?seed=final-2024'
+        exam = self.client.get(url + '&count=10').get_json()['questions']
+        self.assertEqual(self.client.get(url + '&count=10').get_json()['questions'], exam)
+        self.assertEqual(self.client.get(url + '&count=3&start=7').get_json()['questions'], exam[7:])
+        self.assertEqual(self.client.get(url + '&count=1&start=-1').status_code, 400)
+
+    def test_question_errors(self):
+        response = self.client.get('/api/v1/quiz/trivia/question')
+        self.assertEqual(response.status_code, 404)
+        self.assertIn('unknown quiz type', response.get_json()['error'])
+        response = self.client.get(f'/api/v1/quiz/classful/question?count={MAX_BATCH + 1}')
+        self.assertEqual(response.status_code, 400)
+
+    def test_answer_single(self):
+        key = classful_answers('172.16.5.4', 20)
+        body = self.client.post('/api/v1/quiz/classful/answer',
+                                json={'ip': '172.16.5.4', 'prefix': 20, 'answers': key}).get_json()
+        self.assertEqual(body['results'][0]['score'], 5)
+        self.assertEqual(body['results'][0]['key'], key)
+        self.assertNotIn('invalid', body['results'][0])
+
+    def test_answer_batch(self):
+        submissions = [
+            {'ip': '10.0.0.1', 'prefix': 12, 'answers': subnet_answers('10.0.0.1', 12)},
+            {'ip': '10.0.0.1', 'prefix': 12, 'answers': {'Subnet Mask': '255.255.0.0'}},
+            {'ip': '10.0.0', 'prefix': 12, 'answers': {}},
+            {'ip': '10.0.0.1', 'prefix': '12', 'answers': {}},
+        ]
+        results = self.client.post('/api/v1/quiz/subnet/answer',
+                                   json={'submissions': submissions}).get_json()['results']
+        self.assertEqual([result.get('score') for result in results], [3, 0, None, None])
+        self.assertIn('error', results[2])
+        self.assertIn('error', results[3])
+        self.app.extensions['result_writer'].flush()
+        self.assertEqual(self.app.extensions['result_store'].count('subnet_quiz'), 2)
+
+    def test_malformed_classful_answers_are_reported_not_logged(self):
+        body = self.client.post('/api/v1/quiz/classful/answer',
+                                json={'ip': '172.16.5.4', 'prefix': 20,
+                                      'answers': {'Address Class': 'b'}}).get_json()
+        self.assertEqual(body['results'][0]['invalid']['Address Class'], 'not_a_choice')
+        self.app.extensions['result_writer'].flush()
+        self.assertEqual(self.app.extensions['result_store'].count('classful_quiz'), 0)
+
+    def test_answer_class_d_address(self):
+        response = self.client.post('/api/v1/quiz/classful/answer',
+                                    json={'ip': '230.1.1.1', 'prefix': 20, 'answers': {}})
+        self.assertIn('error', response.get_json()['results'][0])
+        self.app.extensions['result_writer'].flush()
+        self.assertEqual(self.app.extensions['result_store'].count('classful_quiz'), 0)
+
+    def test_answer_bad_body(self):
+        self.assertEqual(self.client.post('/api/v1/quiz/subnet/answer', data='nope').status_code, 400)
+        self.assertEqual(self.client.post('/api/v1/quiz/subnet/answer',
+                                          json={'submissions': []}).status_code, 400)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,32 +1,296 @@
-from flask import Flask, render_template, request, redirect, url_for, session 
+from flask import Flask, current_app, jsonify, render_template, request, redirect, url_for, session 
+import hmac
 import random
-import pandas as pd
+from contextlib import nullcontext
 #import webview
 from wildcard_mask import calculate_subnet_address_map, prefix_host_bits, prefix_length_to_subnet_mask, prefix_network_bits, get_address_class_and_pattern, load_questions_from_csv, subList, calculate_wildcard_mask, generate_ip_and_prefix
 from classaddress import generate_random_classful_address, calculate_classful_analysis, validate_input 
+from adaptive import LearnerProfile
+from api import api
+from assets import init_assets
+from compression import init_compression
+from grading import classful_log_row, grade_classful, grade_subnet, subnet_log_row
+from result_log import ResultLog
+from result_writer import BatchWriter, QueuedLog
+from result_store import SQLiteResultStore
+from session_store import MemorySessionStore, SQLiteSessionStore, ServerSideSessionInterface, TimedSessionInterface
+from metrics import CONTENT_TYPE, Metrics, RequestTimer
+from profiling import RequestProfiler
+from question_pool import QUESTION_TYPES, QuestionPool
+from question_stream import QuestionStream
+from template_cache import init_templates, render_page
 
 
 headers = ["128", "64", "32", "16", "8", "4", "2", "1"]
-decimal_guess = pd.DataFrame(columns=['Random Binary', 'Correct Decimal', 'User Guess', 'Result'])
-binary_guess = pd.DataFrame(columns=['Random Decimal', 'Correct Binary', 'User Guess', 'Result'])
-wildcardmak_results = pd.DataFrame(columns=['Random Question, Correct Answer', 'User Guess', 'Result'])
-classful_quiz_results = pd.DataFrame(columns=['IP Address', 'CIDR Prefix', 'Address Class', 'Native Address Map', 'Subnet Mask', 'Wildcard Mask', 'User Answers', 'Correct Answers', 'Score'])
 
-app= Flask(__name__)
-app.secret_key = 'theonekey'
-#webview.create_window("Networking Application",app)
+# Result log of each quiz: CSV file name, columns, and the columns that fill the
+# shared SQLite fields. Each submission appends one row; history is never reread or rewritten
+RESULT_LOGS = {
+    'binary_to_decimal': ('binary_to_decimal_results.csv',
+                          ['Random Binary', 'Correct Decimal', 'User Guess', 'Result'],
+                          {'correct_answer': 'Correct Decimal', 'user_answer': 'User Guess', 'result': 'Result'}),
+    'decimal_to_binary': ('decimal_to_binary_results.csv',
+                          ['Random Decimal', 'Correct Binary', 'User Guess', 'Result'],
+                          {'correct_answer': 'Correct Binary', 'user_answer': 'User Guess', 'result': 'Result'}),
+    'subnet_quiz': ('subnet_quiz_results.csv',
+                    ['IP Address', 'Prefix Length', 'Subnet Mask', 'Wildcard Mask', 'User Answers', 'Correct Answers', 'Score'],
+                    {'ip': 'IP Address', 'prefix': 'Prefix Length', 'user_answer': 'User Answers',
+                     'correct_answer': 'Correct Answers', 'result': 'Score'}),
+    'classful_quiz': ('classful_quiz_results.csv',
+                      ['IP Address', 'CIDR Prefix', 'Address Class', 'Native Address Map', 'Leading Bit Pattern', 'Subnet Mask', 'Wildcard Mask', 'User Answers', 'Correct Answers', 'Score'],
+                      {'ip': 'IP Address', 'prefix': 'CIDR Prefix', 'user_answer': 'User Answers',
+                       'correct_answer': 'Correct Answers', 'result': 'Score'}),
+}
+
+
+def _configure(app, config=None):
+    app.secret_key = 'theonekey'
+    # Result logging: fsync policy is "never", "always" or "interval"; a log is
+    # rotated into numbered segments once it reaches RESULT_LOG_MAX_BYTES (0 = off)
+    app.config.setdefault('RESULT_LOG_FSYNC', 'never')
+    app.config.setdefault('RESULT_LOG_MAX_BYTES', 0)
+    # Rows are written by a background thread in batches of RESULT_WRITER_BATCH_SIZE
+    # or every RESULT_WRITER_FLUSH_MS; at most RESULT_WRITER_QUEUE_SIZE rows wait in memory
+    app.config.setdefault('RESULT_WRITER_BATCH_SIZE', 100)
+    app.config.setdefault('RESULT_WRITER_FLUSH_MS', 50)
+    app.config.setdefault('RESULT_WRITER_QUEUE_SIZE', 10000)
+    # RESULT_BACKEND "csv" appends to one CSV per quiz (single worker process only);
+    # "sqlite" stores every quiz in RESULT_DB, safe for many workers and threads
+    app.config.setdefault('RESULT_BACKEND', 'csv')
+    app.config.setdefault('RESULT_DB', 'quiz_results.db')
+    # SESSION_BACKEND "memory" keeps quiz sessions in this process (LRU with TTL),
+    # "sqlite" shares them between workers through SESSION_DB, and "cookie" is
+    # Flask's signed cookie session; only a short session id is sent otherwise
+    app.config.setdefault('SESSION_BACKEND', 'memory')
+    app.config.setdefault('SESSION_DB', 'quiz_sessions.db')
+    app.config.setdefault('SESSION_TTL', 3600)
+    app.config.setdefault('SESSION_MAX_ENTRIES', 10000)
+    # ADAPTIVE_QUESTIONS picks each learner's next question from the bits and
+    # prefix lengths they keep getting wrong; off draws every question uniformly
+    app.config.setdefault('ADAPTIVE_QUESTIONS', True)
+    # QUESTION_POOL_SIZE subnet and classful questions (0 = off) are generated
+    # ahead per prefix length by a background thread, which tops a pool up
+    # once it holds fewer than QUESTION_POOL_LOW_WATER
+    app.config.setdefault('QUESTION_POOL_SIZE', 64)
+    app.config.setdefault('QUESTION_POOL_LOW_WATER', 16)
+    # With QUESTION_SEED set, question k of each quiz is the same in every
+    # session and process (see question_stream.py), for exams and benchmarks;
+    # adaptive selection is off then, so every learner gets the same exam,
+    # and seeded questions are never taken from the pools
+    app.config.setdefault('QUESTION_SEED', None)
+    # METRICS_ENABLED times every request and its phases (question generation,
+    # session load/save, result logging, rendering) and serves them on /metrics
+    app.config.setdefault('METRICS_ENABLED', True)
+    # PROFILE_SAMPLE_RATE of the requests to the PROFILE_ROUTES are profiled
+    # (0 = off) and aggregated into PROFILE_DIR as "collapsed" stacks sampled
+    # every PROFILE_INTERVAL_MS, or as "pstats"; with PROFILE_ADMIN_TOKEN set,
+    # POST /admin/profiling changes the rate without a restart
+    app.config.setdefault('PROFILE_SAMPLE_RATE', 0.0)
+    app.config.setdefault('PROFILE_DIR', 'profiles')
+    app.config.setdefault('PROFILE_FORMAT', 'collapsed')
+    app.config.setdefault('PROFILE_INTERVAL_MS', 1)
+    app.config.setdefault('PROFILE_ROUTES', ['decimal_to_binary', 'binary_to_decimal', 'subnet_quiz_route',
+                                             'classful_quiz'])
+    app.config.setdefault('PROFILE_ADMIN_TOKEN', None)
+    app.config.from_prefixed_env()
+    if config:
+        app.config.update(config)
+
+
+def _init_sessions(app):
+    if app.config['SESSION_BACKEND'] == 'memory':
+        app.session_interface = ServerSideSessionInterface(
+            MemorySessionStore(int(app.config['SESSION_MAX_ENTRIES']), int(app.config['SESSION_TTL'])))
+    elif app.config['SESSION_BACKEND'] == 'sqlite':
+        app.session_interface = ServerSideSessionInterface(
+            SQLiteSessionStore(app.config['SESSION_DB'], int(app.config['SESSION_TTL'])))
+
+
+def _init_results(app):
+    writer = BatchWriter(batch_size=int(app.config['RESULT_WRITER_BATCH_SIZE']),
+                         flush_interval=int(app.config['RESULT_WRITER_FLUSH_MS']) / 1000,
+                         max_queue=int(app.config['RESULT_WRITER_QUEUE_SIZE']))
+    store = SQLiteResultStore(app.config['RESULT_DB']) if app.config['RESULT_BACKEND'] == 'sqlite' else None
+    logs = {}
+    for quiz, (filename, columns, fields) in RESULT_LOGS.items():
+        if store is not None:
+            log = store.table(quiz, columns, fields)
+        else:
+            log = ResultLog(filename, columns,
+                            fsync=app.config['RESULT_LOG_FSYNC'],
+                            max_bytes=int(app.config['RESULT_LOG_MAX_BYTES']))
+        logs[quiz] = QueuedLog(log, writer)
+    app.extensions['result_writer'] = writer
+    app.extensions['result_store'] = store
+    app.extensions['result_logs'] = logs
+
+
+def _init_question_pools(app):
+    seed = app.config['QUESTION_SEED']
+    app.extensions['question_stream'] = QuestionStream(seed) if seed is not None else None
+    size = int(app.config['QUESTION_POOL_SIZE'])
+    if not size:
+        app.extensions['question_pools'] = None
+        return
+    low_water = int(app.config['QUESTION_POOL_LOW_WATER'])
+    app.extensions['question_pools'] = {quiz: QuestionPool(generate, size, low_water)
+                                        for quiz, generate in QUESTION_TYPES.items()}
+
+
+def _init_metrics(app):
+    if not app.config['METRICS_ENABLED']:
+        app.extensions['metrics'] = None
+        return
+    metrics = Metrics()
+    metrics.histogram('netquizzer_request_seconds', 'Time to handle a request.', ('route', 'method'))
+    metrics.counter('netquizzer_requests_total', 'Requests handled.', ('route', 'method', 'status'))
+    metrics.histogram('netquizzer_phase_seconds', 'Time spent in each phase of a request.', ('route', 'phase'))
+    metrics.counter('netquizzer_attempts_total', 'Answers submitted.', ('quiz',))
+    metrics.counter('netquizzer_correct_total', 'Answers that were fully correct.', ('quiz',))
+    metrics.counter('netquizzer_game_over_total', 'Conversion games finished, won or out of tries.', ('quiz',))
+    app.session_interface = TimedSessionInterface(app.session_interface, metrics, 'netquizzer_phase_seconds')
+    app.wsgi_app = RequestTimer(app.wsgi_app, metrics)
+    app.before_request(_record_route)
+    app.add_url_rule('/metrics', view_func=metrics_page)
+    app.extensions['metrics'] = metrics
+
+
+def _record_route():
+    # the session was loaded before routing; record it now that the route is known
+    metrics = current_app.extensions['metrics']
+    route = request.endpoint or 'unmatched'
+    request.environ[RequestTimer.ROUTE_KEY] = route
+    load_time = request.environ.get(TimedSessionInterface.SESSION_LOAD_KEY)
+    if load_time is not None:
+        metrics.observe('netquizzer_phase_seconds', (route, 'session_load'), load_time)
+
+
+def _phase(name):
+    metrics = current_app.extensions['metrics']
+    if metrics is None:
+        return nullcontext()
+    return metrics.timer('netquizzer_phase_seconds', (request.endpoint, name))
+
+
+def _count_attempt(quiz, correct, game_over=False):
+    metrics = current_app.extensions['metrics']
+    if metrics is None:
+        return
+    metrics.inc('netquizzer_attempts_total', (quiz,))
+    if correct:
+        metrics.inc('netquizzer_correct_total', (quiz,))
+    if game_over:
+        metrics.inc('netquizzer_game_over_total', (quiz,))
+
+
+def _init_profiling(app):
+    rate = float(app.config['PROFILE_SAMPLE_RATE'])
+    if not rate and not app.config['PROFILE_ADMIN_TOKEN']:
+        # nothing can turn profiling on, so leave the views unwrapped
+        app.extensions['profiler'] = None
+        return
+    profiler = RequestProfiler(app.config['PROFILE_DIR'], rate, app.config['PROFILE_FORMAT'],
+                               interval=int(app.config['PROFILE_INTERVAL_MS']) / 1000)
+    for endpoint in app.config['PROFILE_ROUTES']:
+        app.view_functions[endpoint] = _profiled(endpoint, app.view_functions[endpoint], profiler)
+    if app.config['PROFILE_ADMIN_TOKEN']:
+        app.add_url_rule('/admin/profiling', view_func=profiling_admin, methods=['GET', 'POST'])
+    app.extensions['profiler'] = profiler
+
+
+def _profiled(endpoint, view, profiler):
+    def profiled_view(**kwargs):
+        if not profiler.should_sample():
+            return view(**kwargs)
+        with profiler.profile(endpoint):
+            return view(**kwargs)
+
+    profiled_view.__name__ = view.__name__
+    return profiled_view
+
+
+def _result_log(quiz):
+    return current_app.extensions['result_logs'][quiz]
+
+
+def _render_page(template_name, **context):
+    with _phase('render'):
+        return render_page(template_name, **context)
+
+
+def _question_rng(quiz):
+    # the random module, or with QUESTION_SEED set the generator of this
+    # session's next question of the quiz
+    stream = current_app.extensions['question_stream']
+    if stream is None:
+        return random
+    indexes = dict(session.get('question_index', {}))
+    index = indexes.get(quiz, 0)
+    indexes[quiz] = index + 1
+    session['question_index'] = indexes
+    return stream.rng(quiz, index)
+
+
+def _next_question(quiz, learner):
+    # (ip, default_mask, prefix_length, answers) of a new subnet or classful question
+    rng = _question_rng(quiz)
+    prefix_length = learner.next_prefix(rng) if learner else None
+    pools = current_app.extensions['question_pools']
+    if pools is None or rng is not random:
+        return QUESTION_TYPES[quiz](prefix_length, rng)
+    return pools[quiz].take(prefix_length)
+
+
+def _learner():
+    # None when adaptive selection is off, as it is for a seeded exam: a
+    # learner's mistakes would change which question k is
+    if not current_app.config['ADAPTIVE_QUESTIONS'] or current_app.extensions['question_stream'] is not None:
+        return None
+    return LearnerProfile(session.get('learner'))
+
+
+def _save_learner(learner):
+    if learner is not None:
+        session['learner'] = learner.to_dict()
 
 
-@app.route('/')
 def main():
-    return render_template('main.html')
+    with _phase('render'):
+        return render_template('main.html')
+
+
+def reference_guide():
+    with _phase('render'):
+        return render_template('referenceguide.html')
+
+
+def metrics_page():
+    return current_app.extensions['metrics'].render(), 200, {'Content-Type': CONTENT_TYPE}
+
+
+def profiling_admin():
+    token = request.headers.get('X-Admin-Token', '')
+    # compared as bytes: compare_digest rejects non-ASCII str
+    if not hmac.compare_digest(token.encode(), str(current_app.config['PROFILE_ADMIN_TOKEN']).encode()):
+        return jsonify(error='invalid admin token'), 403
+    profiler = current_app.extensions['profiler']
+    if request.method == 'POST':
+        body = request.get_json(silent=True) or {}
+        try:
+            profiler.set_rate(body['rate'])
+        except (KeyError, TypeError, ValueError):
+            return jsonify(error='expected {"rate": <0 to 1>}'), 400
+    # each worker process has its own profiler; this reports the one that answered
+    return jsonify(profiler.stats())
 
 
-@app.route("/decimal-to-binary", methods=['GET', 'POST'])
 def decimal_to_binary():
     # Generate a new decimal-binary pair if the request is GET (page load) and not in session
+    learner = _learner()
     if request.method == 'GET' or 'random_binary' not in session:
-        random_decimal = random.randint(0, 255)
+        with _phase('generate'):
+            rng = _question_rng('decimal_to_binary')
+            random_decimal = learner.next_byte(rng) if learner else rng.randint(0, 255)
         random_binary = format(random_decimal, '08b')
         session['random_binary'] = random_binary  # Store binary value in session
         session['random_decimal'] = random_decimal  # Store decimal value in session
@@ -50,6 +314,9 @@ def decimal_to_binary():
             # Ensure user's guess is in binary format
             if not all(bit in '01' for bit in user_guess) or len(user_guess) != 8:
                 raise ValueError("Invalid binary input.")
+            if learner:
+                learner.record_conversion(random_decimal, int(user_guess, 2))
+                _save_learner(learner)
             
             # Validate the guess
             if user_guess == random_binary:
@@ -68,28 +335,31 @@ def decimal_to_binary():
                 session['counter'] += 1
             
             # Log results to CSV
-            binary_guess.loc[len(binary_guess)] = [random_binary, random_decimal, user_guess, result]
-            binary_guess.to_csv('decimal_to_binary_results.csv', index=False)
+            with _phase('log'):
+                _result_log('decimal_to_binary').append([random_decimal, random_binary, user_guess, result])
+            _count_attempt('decimal_to_binary', user_guess == random_binary, session['game_over'])
 
             
         except ValueError:
             result = "Invalid input. Please enter an 8-bit binary number."
 
     # Render template with the random decimal and result message
-    return render_template('decimaltobinary.html', 
-                           random_decimal=random_decimal, 
-                           random_binary=session.get('random_binary'),
-                           result=result, 
-                           correct=correct, 
-                           headers=headers, game_over=session['game_over'],
-                           wrong_guesses=session.get('wrong_guesses', []))
+    return _render_page('decimaltobinary.html', 
+                        random_decimal=random_decimal, 
+                        random_binary=session.get('random_binary'),
+                        result=result, 
+                        correct=correct, 
+                        headers=headers, game_over=session['game_over'],
+                        wrong_guesses=session.get('wrong_guesses', []))
 
 
-@app.route("/binary-to-decimal", methods=['GET', 'POST'])
 def binary_to_decimal():
         # Generate a new decimal-binary pair if the request is GET (page load)
+    learner = _learner()
     if request.method == 'GET' or 'random_decimal' not in session:
-        random_decimal = random.randint(0, 255)
+        with _phase('generate'):
+            rng = _question_rng('binary_to_decimal')
+            random_decimal = learner.next_byte(rng) if learner else rng.randint(0, 255)
         random_binary = format(random_decimal, '08b')
         session['random_decimal'] = random_decimal  # Store decimal value in session
         session['counter'] = 0
@@ -111,6 +381,9 @@ def binary_to_decimal():
         try:
             # Convert user's guess to an integer
             user_guess = int(user_guess)
+            if learner:
+                learner.record_conversion(random_decimal, user_guess)
+                _save_learner(learner)
             # Validate the guess
             
             if user_guess == random_decimal:
@@ -128,36 +401,30 @@ def binary_to_decimal():
                     result = f"Good Effort! Please try again."
             session['counter'] += 1
             
-            decimal_guess.loc[len(decimal_guess)] = [random_binary, random_decimal, user_guess, result]
-            decimal_guess.to_csv('binary_to_decimal_results.csv', index=False)
+            with _phase('log'):
+                _result_log('binary_to_decimal').append([random_binary, random_decimal, user_guess, result])
+            _count_attempt('binary_to_decimal', user_guess == random_decimal, session['game_over'])
         except ValueError:
             result = "Invalid input. Please enter a valid decimal number."   
     
     
     # Render template with the random binary and result message
-    return render_template('binarytodecimal.html', 
-                           random_binary=random_binary,
-                           random_decimal=session.get('random_decimal'),
-                           correct=correct, 
-                           result=result, 
-                           headers=headers, 
-                           game_over=session['game_over'],
-                           wrong_guesses=session.get('wrong_guesses', []))
+    return _render_page('binarytodecimal.html', 
+                        random_binary=random_binary,
+                        random_decimal=session.get('random_decimal'),
+                        correct=correct, 
+                        result=result, 
+                        headers=headers, 
+                        game_over=session['game_over'],
+                        wrong_guesses=session.get('wrong_guesses', []))
   
     
-@app.route('/subnet-quiz', methods=['GET', 'POST'])
 def subnet_quiz_route():
-    global wildcardmak_results  
-
+    learner = _learner()
     if request.method == 'GET' or session.get("question") is None:
         # Generate a random IP address and prefix
-        ip, default_mask, prefix_length = generate_random_classful_address()
-        subnet_mask = prefix_length_to_subnet_mask(prefix_length)
-        answers = {
-            "Subnet Address Map": calculate_subnet_address_map(ip, prefix_length),
-            "Subnet Mask": subnet_mask,
-            "Wildcard Mask": calculate_wildcard_mask(prefix_length)
-        }
+        with _phase('generate'):
+            ip, default_mask, prefix_length, answers = _next_question('subnet_quiz', learner)
 
         question = f"Given the IP address {ip}/{prefix_length}, answer the following:"
 
@@ -176,54 +443,27 @@ def subnet_quiz_route():
         correct_answers = session["answers"]
 
         # Validate user answers and calculate results
-        result = []
-        score = 0
-        
-        for key, correct_answer in correct_answers.items():
-            user_answer = user_answers.get(key, "").strip()
-            
-            # Normalize both answers for comparison
-            normalized_user = user_answer.upper().replace(" ", "")
-            normalized_correct = correct_answer.upper().replace(" ", "")
-            
-            # Compare normalized versions
-            is_correct = normalized_user == normalized_correct
-            
-            if is_correct:
-                score += 1
-                
-            result.append({
-                "question": key,
-                "user_answer": user_answer,
-                "correct_answer": correct_answer,
-                "correct": is_correct
-            })
+        result, score, _ = grade_subnet(correct_answers, user_answers)
+        if learner:
+            learner.record_prefix(session['prefix_length'], score, len(correct_answers))
+            _save_learner(learner)
 
         # Log results
-        wildcardmak_results.loc[len(wildcardmak_results)] = {
-            'IP Address': session['ip'],
-            'Prefix Length': session['prefix_length'],
-            'Subnet Mask': correct_answers.get('Subnet Mask', ''),
-            'Wildcard Mask': correct_answers.get('Wildcard Mask', ''),
-            'User Answers': str(user_answers),
-            'Correct Answers': str(correct_answers),
-            'Score': f"{score}/{len(correct_answers)}"
-        }
-
-        wildcardmak_results.to_csv('subnet_quiz_results.csv', index=False)
+        with _phase('log'):
+            _result_log('subnet_quiz').append(
+                subnet_log_row(session['ip'], session['prefix_length'], correct_answers, user_answers, score))
+        _count_attempt('subnet_quiz', score == len(correct_answers))
 
-    return render_template("wildcardmask.html",
-                         question=session["question"],
-                         answers=session["answers"],
-                         results=result)
+    return _render_page("wildcardmask.html",
+                        question=session["question"],
+                        answers=session["answers"],
+                        results=result)
 
-@app.route("/classful_quiz", methods=["GET", "POST"])
 def classful_quiz():
-    global classful_quiz_results  
-
+    learner = _learner()
     if request.method == "GET" or session.get("question") is None:
-        ip, default_mask, cidr_prefix = generate_random_classful_address()
-        answers = calculate_classful_analysis(ip, default_mask, cidr_prefix)
+        with _phase('generate'):
+            ip, default_mask, cidr_prefix, answers = _next_question('classful_quiz', learner)
 
         question = f"Given the IP address {ip}/{cidr_prefix}, answer the following:"
 
@@ -239,62 +479,68 @@ def classful_quiz():
         }
         correct_answers = session["answers"]
 
-        # Validate user answers
-        result = []
-        score = 0
-        validation_error = False
-        for key, correct_answer in correct_answers.items():
-            user_answer = user_answers.get(key, "")
-            # Check input validation
-            if not validate_input(key, user_answer):
-                validation_error = True
-                result.append({
-                    "question": key,
-                    "user_answer": user_answer,
-                    "correct_answer": correct_answer,
-                    "correct": False,
-                    "validation_error": True
-                })
-                continue
-            is_correct = user_answer == correct_answer
-            if is_correct:
-                score += 1
-            result.append({
-                "question": key,
-                "user_answer": user_answer,
-                "correct_answer": correct_answer,
-                "correct": is_correct
-            })
+        # Malformed answers are marked with a reason and never count as correct
+        result, score, validation_errors = grade_classful(correct_answers, user_answers)
         
         # If there's a validation error, prevent quiz submission
-        if validation_error:
-            return render_template("classfuladdress.html",
-                                   question=session["question"],
-                                   answers=session["answers"],
-                                   results=result,
-                                   validation_error=True)
+        if validation_errors:
+            return _render_page("classfuladdress.html",
+                                question=session["question"],
+                                answers=session["answers"],
+                                results=result,
+                                validation_error=True)
 
-        # Log the results to the CSV
-        classful_quiz_results.loc[len(classful_quiz_results)] = {
-            'IP Address': session['ip'],
-            'CIDR Prefix': session['cidr_prefix'],
-            'Address Class': correct_answers.get('Address Class', ''),
-            'Native Address Map': correct_answers.get('Native Address Map', ''),
-            'Leading Bit Pattern': correct_answers.get('Leading Bit Pattern', ''),
-            'Subnet Mask': correct_answers.get('Subnet Mask (SNM)', ''),
-            'Wildcard Mask': correct_answers.get('Wildcard Mask (WCM)', ''),
-            'User Answers': str(user_answers),
-            'Correct Answers': str(correct_answers),
-            'Score': f"{score}/{len(correct_answers)}"
-        }
+        if learner:
+            learner.record_prefix(session['cidr_prefix'], score, len(correct_answers))
+            _save_learner(learner)
 
-        # Save results to CSV after each quiz
-        classful_quiz_results.to_csv('classful_quiz_results.csv', index=False)
+        # Log the results to the CSV
+        with _phase('log'):
+            _result_log('classful_quiz').append(
+                classful_log_row(session['ip'], session['cidr_prefix'], correct_answers, user_answers, score))
+        _count_attempt('classful_quiz', score == len(correct_answers))
+
+    return _render_page("classfuladdress.html",
+                        question=session["question"],
+                        answers=session["answers"],
+                        results=result)
+
+
+def create_app(config=None):
+    """
+    Build the quiz app.
+
+    Args:
+        config (dict): Settings applied on top of the defaults and the
+            FLASK_* environment variables.
+
+    Returns:
+        Flask: The app with its routes, session store and result logs set up.
+    """
+    app = Flask(__name__)
+    _configure(app, config)
+    init_templates(app)
+    init_assets(app)
+    init_compression(app)
+    _init_sessions(app)
+    _init_results(app)
+    _init_question_pools(app)
+    _init_metrics(app)
+    app.add_url_rule('/', view_func=main)
+    app.add_url_rule('/reference-guide', view_func=reference_guide)
+    app.add_url_rule('/decimal-to-binary', view_func=decimal_to_binary, methods=['GET', 'POST'])
+    app.add_url_rule('/binary-to-decimal', view_func=binary_to_decimal, methods=['GET', 'POST'])
+    app.add_url_rule('/subnet-quiz', view_func=subnet_quiz_route, methods=['GET', 'POST'])
+    app.add_url_rule('/classful_quiz', view_func=classful_quiz, methods=['GET', 'POST'])
+    app.register_blueprint(api)
+    _init_profiling(app)
+    return app
+
+
+app = create_app()
+result_writer = app.extensions['result_writer']
+#webview.create_window("Networking Application",app)
 
-    return render_template("classfuladdress.html",
-                           question=session["question"],
-                           answers=session["answers"],
-                           results=result)
 if __name__ == '__main__':
     app.run(debug=True)
     #webview.start()
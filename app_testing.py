@@ -0,0 +1,58 @@
+"""
+Shared setup for the tests that run the app.
+
+make_app() builds an app with its own throwaway SQLite result database and
+registers the cleanups that stop its background threads and close the
+database, so a test only says what it configures differently.
+"""
+import os
+import tempfile
+import unittest
+
+
+def make_app(test, config=None):
+    """
+    Build an app for one test, cleaned up when the test ends.
+
+    Args:
+        test (unittest.TestCase): The test to register the cleanups with.
+        config (dict): Settings on top of the SQLite result backend.
+
+    Returns:
+        Flask: The app.
+    """
+    from app import create_app
+
+    directory = tempfile.TemporaryDirectory()
+    test.addCleanup(directory.cleanup)
+    app = create_app(dict({'RESULT_BACKEND': 'sqlite', 'RESULT_DB': os.path.join(directory.name, 'results.db')},
+                          **(config or {})))
+    test.addCleanup(close_app, app)
+    return app
+
+
+def close_app(app):
+    """
+    Stop an app's question pools, profiler and result writer and close its
+    stores.
+    """
+    if app.extensions.get('profiler') is not None:
+        app.extensions['profiler'].close()
+    for pool in (app.extensions.get('question_pools') or {}).values():
+        pool.close()
+    app.extensions['result_writer'].close()
+    if app.extensions.get('result_store') is not None:
+        app.extensions['result_store'].close()
+
+
+class AppTestCase(unittest.TestCase):
+    """
+    A test case with ``self.app``, built by make_app() with CONFIG, and
+    ``self.client``, a test client for it.
+    """
+
+    CONFIG = {}
+
+    def setUp(self):
+        self.app = make_app(self, self.CONFIG)
+        self.client = self.app.test_client()
@@ -0,0 +1,476 @@
+"""
+Columnar archive of closed result log segments.
+
+    python archive.py compact subnet_quiz_results.csv [--remove]
+    python archive.py scan subnet_quiz_results.000001.qar --columns "IP Address,Score" --where "Prefix Length>=24"
+
+compact() converts every closed CSV segment of a log (see result_log) that
+has no archive yet into ``<segment>.qar`` next to it, e.g.
+``subnet_quiz_results.000001.qar``. The live file is never touched.
+
+An archive stores rows in groups of ROW_GROUP_SIZE. Within a group each
+column is encoded on its own and compressed with zlib:
+
+- ``int``: every value is a plain integer of at most 64 bits (prefix
+  lengths, decimals), stored as the narrowest fixed-width array that fits;
+- ``ipv4``: every value is a dotted quad, stored as 32-bit ints;
+- ``dict``: anything else (the stringified answer dicts, scores, binary
+  strings with leading zeros), stored as the distinct strings plus an
+  index per row. The answer columns repeat a lot, so this is where most
+  of the size goes away.
+
+A value is only typed when it converts back to the same text, so nothing
+is lost. A footer records each chunk's offset and, for typed chunks, its
+min and max, which lets scan() skip whole groups for a predicate (and a
+``dict`` chunk is skipped when the wanted string is not in its
+dictionary) and decompress only the columns it is asked for. Strings of a
+``dict`` chunk that are integers or addresses are compared as numbers, as
+in a typed chunk, so a predicate means the same in every row group.
+"""
+import csv
+import json
+import operator
+import os
+import struct
+import sys
+import zlib
+from array import array
+
+from address_engine import int_to_ip, ip_to_int
+from result_log import list_segments
+
+ARCHIVE_EXT = ".qar"
+MAGIC = b"NQAR1"
+ROW_GROUP_SIZE = 65536
+
+INT = "int"
+IPV4 = "ipv4"
+DICT = "dict"
+
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+_FOOTER = struct.Struct("<I")
+
+# Narrowest array type codes for signed ints and for dictionary indices
+_INT_TYPES = [("b", 1 << 7), ("h", 1 << 15), ("i", 1 << 31), ("q", 1 << 63)]
+_INDEX_TYPES = [("B", 1 << 8), ("H", 1 << 16), ("I", 1 << 32)]
+
+
+def archive_name(segment):
+    """
+    Build the archive path of a closed CSV segment.
+
+    Examples:
+        >>> archive_name('subnet_quiz_results.000003.csv')
+        'subnet_quiz_results.000003.qar'
+    """
+    return os.path.splitext(segment)[0] + ARCHIVE_EXT
+
+
+def _pack(values, typecode):
+    data = array(typecode, values)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data.tobytes()
+
+
+def _unpack(payload, typecode):
+    data = array(typecode)
+    data.frombytes(payload)
+    if sys.byteorder == "big":
+        data.byteswap()
+    return data
+
+
+def _as_ints(values):
+    try:
+        ints = [int(value) for value in values]
+    except ValueError:
+        return None
+    if any(str(number) != value for number, value in zip(ints, values)):
+        return None
+    return ints
+
+
+def _as_addresses(values):
+    try:
+        addresses = [ip_to_int(value) for value in values]
+    except ValueError:
+        return None
+    if any(int_to_ip(address) != value for address, value in zip(addresses, values)):
+        return None
+    return addresses
+
+
+def _encode_column(values):
+    """
+    Encode one column of a row group.
+
+    Returns:
+        tuple: (chunk metadata without offsets, compressed payload).
+    """
+    ints = _as_ints(values)
+    if ints is not None:
+        low, high = min(ints), max(ints)
+        # integers beyond 64 bits (e.g. a huge guess) are stored as strings
+        typecode = next((code for code, limit in _INT_TYPES if -limit <= low and high < limit), None)
+        if typecode is not None:
+            meta = {"encoding": INT, "type": typecode, "min": low, "max": high}
+            return meta, zlib.compress(_pack(ints, typecode))
+    addresses = _as_addresses(values)
+    if addresses is not None:
+        meta = {"encoding": IPV4, "type": "I", "min": min(addresses), "max": max(addresses)}
+        return meta, zlib.compress(_pack(addresses, "I"))
+    positions = {}
+    indices = [positions.setdefault(value, len(positions)) for value in values]
+    typecode = next(code for code, limit in _INDEX_TYPES if len(positions) <= limit)
+    dictionary = json.dumps(list(positions)).encode("utf-8")
+    payload = _FOOTER.pack(len(dictionary)) + dictionary + _pack(indices, typecode)
+    return {"encoding": DICT, "type": typecode}, zlib.compress(payload)
+
+
+def _decode_column(meta, payload):
+    """
+    Returns:
+        tuple: (values as stored: ints for ``int`` and ``ipv4`` chunks,
+        indices for ``dict`` chunks; the dictionary or None).
+    """
+    payload = zlib.decompress(payload)
+    if meta["encoding"] != DICT:
+        return _unpack(payload, meta["type"]), None
+    length = _FOOTER.unpack_from(payload)[0]
+    start = _FOOTER.size + length
+    dictionary = json.loads(payload[_FOOTER.size:start].decode("utf-8"))
+    return _unpack(payload[start:], meta["type"]), dictionary
+
+
+def write_archive(path, columns, rows):
+    """
+    Write rows to a columnar archive.
+
+    The file is written next to ``path`` and renamed into place, so a
+    reader never sees a half-written archive; if writing fails, the
+    partial file is removed.
+
+    Args:
+        path (str): Archive path.
+        columns (list): Column names.
+        rows (iterable): Rows of strings, in column order.
+
+    Returns:
+        int: Number of rows written.
+    """
+    footer = {"columns": list(columns), "rows": 0, "row_groups": []}
+    temporary = path + ".tmp"
+    try:
+        with open(temporary, "wb") as file:
+            file.write(MAGIC)
+            group = []
+            for row in rows:
+                group.append(row)
+                if len(group) == ROW_GROUP_SIZE:
+                    _write_group(file, footer, group)
+                    group = []
+            if group:
+                _write_group(file, footer, group)
+            encoded = json.dumps(footer).encode("utf-8")
+            file.write(encoded + _FOOTER.pack(len(encoded)) + MAGIC)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return footer["rows"]
+
+
+def _write_group(file, footer, rows):
+    width = len(footer["columns"])
+    chunks = []
+    for index in range(width):
+        meta, payload = _encode_column([row[index] if index < len(row) else "" for row in rows])
+        meta["offset"], meta["length"] = file.tell(), len(payload)
+        file.write(payload)
+        chunks.append(meta)
+    footer["row_groups"].append({"rows": len(rows), "chunks": chunks})
+    footer["rows"] += len(rows)
+
+
+class ArchiveReader:
+    """
+    Read a columnar archive.
+
+    Args:
+        path (str): Archive path.
+
+    Raises:
+        ValueError: If the file is not an archive.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as file:
+            file.seek(0, os.SEEK_END)
+            size = file.tell()
+            tail = _FOOTER.size + len(MAGIC)
+            file.seek(0)
+            if size < len(MAGIC) + tail or file.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"Not a result archive: {path!r}")
+            file.seek(size - tail)
+            end = file.read(tail)
+            if end[_FOOTER.size:] != MAGIC:
+                raise ValueError(f"Truncated result archive: {path!r}")
+            length = _FOOTER.unpack(end[:_FOOTER.size])[0]
+            file.seek(size - tail - length)
+            footer = json.loads(file.read(length).decode("utf-8"))
+        self.columns = footer["columns"]
+        self.rows = footer["rows"]
+        self.row_groups = footer["row_groups"]
+
+    def _predicates(self, where):
+        predicates = []
+        for column, op, value in where or ():
+            if op != "in" and op not in OPERATORS:
+                raise ValueError(f"Unknown operator: {op!r}")
+            predicates.append((self.columns.index(column), op, value))
+        return predicates
+
+    @staticmethod
+    def _typed(meta, value):
+        # the predicate value in the chunk's stored representation
+        if meta["encoding"] == IPV4:
+            return ip_to_int(value) if isinstance(value, str) else value
+        if meta["encoding"] == INT:
+            return int(value)
+        return str(value)
+
+    @classmethod
+    def _typed_values(cls, meta, values):
+        # the predicate values that a typed chunk can hold, as stored; no
+        # row of an int chunk equals "x"
+        typed = []
+        for value in values:
+            try:
+                typed.append(cls._typed(meta, value))
+            except (ValueError, TypeError, AttributeError):
+                pass
+        return typed
+
+    def _dictionary_matches(self, dictionary, op, value):
+        # positions of the dictionary strings a predicate holds for, each
+        # string compared the way a typed chunk holding it would compare it,
+        # so a column compares the same in every row group
+        values = list(value) if op == "in" else [value]
+        wanted = {}
+
+        def typed(encoding):
+            if encoding not in wanted:
+                converted = self._typed_values({"encoding": encoding}, values)
+                wanted[encoding] = converted if len(converted) == len(values) else None
+            return wanted[encoding]
+
+        # a string that is not a number is not ordered against a number
+        ordered = op in ("<", "<=", ">", ">=") and (typed(INT) is not None or typed(IPV4) is not None)
+        matches = set()
+        for position, text in enumerate(dictionary):
+            item, targets = text, typed(DICT)
+            for encoding, convert in ((INT, _as_ints), (IPV4, _as_addresses)):
+                converted = convert([text])
+                if converted is not None and typed(encoding) is not None:
+                    item, targets = converted[0], typed(encoding)
+                    break
+            else:
+                if ordered:
+                    continue
+            if item in targets if op == "in" else OPERATORS[op](item, targets[0]):
+                matches.add(position)
+        return matches
+
+    def _can_skip(self, meta, op, value):
+        if meta["encoding"] == DICT:
+            return False
+        values = self._typed_values(meta, value if op == "in" else [value])
+        low, high = meta["min"], meta["max"]
+        if op == "in":
+            return all(item < low or item > high for item in values)
+        if not values:
+            return op != "!="
+        value = values[0]
+        return {
+            "==": value < low or value > high,
+            "!=": low == high == value,
+            "<": low >= value,
+            "<=": low > value,
+            ">": high <= value,
+            ">=": high < value,
+        }[op]
+
+    def scan(self, columns=None, where=None):
+        """
+        Yield rows, reading only the columns and row groups needed.
+
+        Args:
+            columns (list): Columns to return, in this order. None for all.
+            where (list): Predicates (column, op, value), all of which must
+                hold; op is one of OPERATORS or "in" (value is a
+                collection). ``ipv4`` columns compare as addresses.
+
+        Yields:
+            tuple: Values of the requested columns; ints for ``int``
+            chunks, strings otherwise.
+
+        Examples:
+            >>> reader = ArchiveReader('subnet_quiz_results.000001.qar')  # doctest: +SKIP
+            >>> list(reader.scan(['IP Address'], [('Prefix Length', '>=', 24)]))  # doctest: +SKIP
+            [('192.168.0.1',)]
+        """
+        wanted = [self.columns.index(column) for column in columns] if columns else range(len(self.columns))
+        predicates = self._predicates(where)
+        with open(self.path, "rb") as file:
+            for group in self.row_groups:
+                chunks = group["chunks"]
+                if any(self._can_skip(chunks[index], op, value) for index, op, value in predicates):
+                    continue
+                decoded = {}
+
+                def load(index):
+                    if index not in decoded:
+                        meta = chunks[index]
+                        file.seek(meta["offset"])
+                        decoded[index] = _decode_column(meta, file.read(meta["length"]))
+                    return decoded[index]
+
+                selected = range(group["rows"])
+                for index, op, value in predicates:
+                    meta = chunks[index]
+                    stored, dictionary = load(index)
+                    if dictionary is not None:
+                        # compare each distinct string once, then keep rows by index
+                        matches = self._dictionary_matches(dictionary, op, value)
+                        if not matches:
+                            selected = []
+                            break
+                        selected = [row for row in selected if stored[row] in matches]
+                    elif op == "in":
+                        value = set(self._typed_values(meta, value))
+                        selected = [row for row in selected if stored[row] in value]
+                    elif self._typed_values(meta, [value]):
+                        value, compare = self._typed(meta, value), OPERATORS[op]
+                        selected = [row for row in selected if compare(stored[row], value)]
+                    elif op != "!=":
+                        selected = []
+                if not selected:
+                    continue
+
+                outputs = []
+                for index in wanted:
+                    stored, dictionary = load(index)
+                    encoding = chunks[index]["encoding"]
+                    if encoding == DICT:
+                        outputs.append([dictionary[stored[row]] for row in selected])
+                    elif encoding == IPV4:
+                        outputs.append([int_to_ip(stored[row]) for row in selected])
+                    else:
+                        outputs.append([stored[row] for row in selected])
+                yield from zip(*outputs)
+
+
+def compact(filename, remove=False):
+    """
+    Archive the closed CSV segments of a log that have no archive yet.
+
+    Args:
+        filename (str): Path of the live log, e.g. 'subnet_quiz_results.csv'.
+        remove (bool): Delete each CSV segment once its archive is written
+            and holds the same number of rows.
+
+    Returns:
+        list: Paths of the archives written.
+    """
+    written = []
+    for _, segment in list_segments(filename):
+        target = archive_name(segment)
+        if os.path.exists(target):
+            continue
+        with open(segment, newline="", encoding="utf-8") as file:
+            reader = csv.reader(file)
+            columns = next(reader, None)
+            if columns is None:
+                continue
+            rows = write_archive(target, columns, reader)
+        if remove and ArchiveReader(target).rows == rows:
+            os.remove(segment)
+        written.append(target)
+    return written
+
+
+def log_segments(filename):
+    """
+    List the closed segments of a log, oldest first, each as its CSV file
+    if that still exists and as its archive otherwise.
+
+    Args:
+        filename (str): Path of the live log, e.g. 'subnet_quiz_results.csv'.
+
+    Returns:
+        list: Tuples of (segment number, segment path).
+    """
+    segments = dict(list_segments(os.path.splitext(filename)[0] + ARCHIVE_EXT))
+    segments.update(list_segments(filename))
+    return sorted(segments.items())
+
+
+def scan_log(filename, columns=None, where=None):
+    """
+    Scan every archived segment of a log, oldest first.
+
+    Args:
+        filename (str): Path of the live log, e.g. 'subnet_quiz_results.csv'.
+        columns (list): See ArchiveReader.scan().
+        where (list): See ArchiveReader.scan().
+
+    Yields:
+        tuple: Matching rows.
+    """
+    for _, path in list_segments(os.path.splitext(filename)[0] + ARCHIVE_EXT):
+        yield from ArchiveReader(path).scan(columns, where)
+
+
+def _parse_predicate(text):
+    for op in ("<=", ">=", "==", "!=", "<", ">"):
+        column, found, value = text.partition(op)
+        if found:
+            return column.strip(), op, value.strip()
+    raise ValueError(f"Expected COLUMN<op>VALUE, got {text!r}")
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Archive result log segments or scan archives.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    compact_parser = commands.add_parser("compact", help="archive the closed segments of logs")
+    compact_parser.add_argument("logs", nargs="+")
+    compact_parser.add_argument("--remove", action="store_true", help="delete CSV segments once archived")
+    scan_parser = commands.add_parser("scan", help="print rows of an archive as CSV")
+    scan_parser.add_argument("archive")
+    scan_parser.add_argument("--columns", help="comma-separated columns to print")
+    scan_parser.add_argument("--where", action="append", default=[], help='e.g. "Prefix Length>=24"')
+    args = parser.parse_args()
+
+    if args.command == "compact":
+        for log in args.logs:
+            for path in compact(log, args.remove):
+                print(path)
+    else:
+        reader = ArchiveReader(args.archive)
+        columns = args.columns.split(",") if args.columns else reader.columns
+        writer = csv.writer(sys.stdout)
+        writer.writerow(columns)
+        writer.writerows(reader.scan(columns, [_parse_predicate(text) for text in args.where]))
@@ -0,0 +1,125 @@
+import csv
+import os
+import tempfile
+import unittest
+
+import archive
+from archive import ArchiveReader, archive_name, compact, scan_log, write_archive
+from result_log import ResultLog, list_segments, segment_name
+
+SUBNET_COLUMNS = ['IP Address', 'Prefix Length', 'Subnet Mask', 'User Answers', 'Score']
+
+
+def subnet_row(index):
+    prefix = 8 + index % 23
+    answers = "{'Subnet Mask': '255.255.0.0'}" if index % 3 else "{'Subnet Mask': ''}"
+    return [f'10.{index % 256}.{index // 256 % 256}.1', str(prefix), '255.255.0.0', answers, f'{index % 6}/5']
+
+
+class TestArchive(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'results.qar')
+        self.rows = [subnet_row(index) for index in range(1000)]
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip_keeps_values_and_types(self):
+        rows = self.rows + [['010.0.0.1', '007', '', '{}', '1/5']]
+        self.assertEqual(write_archive(self.path, SUBNET_COLUMNS, rows), 1001)
+        reader = ArchiveReader(self.path)
+        encodings = [chunk['encoding'] for chunk in reader.row_groups[0]['chunks']]
+        self.assertEqual(encodings, ['dict', 'dict', 'dict', 'dict', 'dict'])
+        scanned = list(reader.scan())
+        self.assertEqual([[str(value) for value in row] for row in scanned], rows)
+
+    def test_typed_columns(self):
+        write_archive(self.path, SUBNET_COLUMNS, self.rows)
+        reader = ArchiveReader(self.path)
+        encodings = [chunk['encoding'] for chunk in reader.row_groups[0]['chunks']]
+        self.assertEqual(encodings, ['ipv4', 'int', 'ipv4', 'dict', 'dict'])
+        self.assertEqual(next(reader.scan(['Prefix Length', 'IP Address'])), (8, '10.0.0.1'))
+
+    def test_projection_and_predicates(self):
+        write_archive(self.path, SUBNET_COLUMNS, self.rows)
+        reader = ArchiveReader(self.path)
+        where = [('Prefix Length', '>=', 29), ('Score', 'in', ['5/5', '0/5'])]
+        expected = [(row[0], row[4]) for row in self.rows if int(row[1]) >= 29 and row[4] in ('5/5', '0/5')]
+        self.assertEqual(list(reader.scan(['IP Address', 'Score'], where)), expected)
+        self.assertEqual(list(reader.scan(['Score'], [('IP Address', '==', '10.3.0.1')])), [('3/5',)])
+        self.assertEqual(list(reader.scan(where=[('Score', '==', '9/5')])), [])
+
+    def test_integers_beyond_64_bits_are_kept_as_strings(self):
+        columns = ['Random Binary', 'Correct Decimal', 'User Guess', 'Result']
+        rows = [['00000101', '5', str(10 ** 22), 'Good Effort!'], ['00000101', '5', '5', 'Congratulations!']]
+        write_archive(self.path, columns, rows)
+        reader = ArchiveReader(self.path)
+        self.assertEqual(reader.row_groups[0]['chunks'][2]['encoding'], 'dict')
+        self.assertEqual([[str(value) for value in row] for row in reader.scan()], rows)
+        self.assertEqual(list(reader.scan(['User Guess'], [('User Guess', '>', 10 ** 21)])), [(str(10 ** 22),)])
+
+    def test_failed_write_leaves_no_temporary_file(self):
+        def rows():
+            yield self.rows[0]
+            raise OSError('disk full')
+
+        with self.assertRaises(OSError):
+            write_archive(self.path, SUBNET_COLUMNS, rows())
+        self.assertEqual(os.listdir(self.directory.name), [])
+
+    def test_dict_chunks_compare_numbers_like_int_chunks(self):
+        archive.ROW_GROUP_SIZE, size = 3, archive.ROW_GROUP_SIZE
+        self.addCleanup(setattr, archive, 'ROW_GROUP_SIZE', size)
+        # the second row group holds a non-integer, so its prefixes are dictionary-encoded
+        prefixes = ['3', '24', '30', '3', '24', 'x']
+        write_archive(self.path, ['Prefix Length'], [[prefix] for prefix in prefixes])
+        reader = ArchiveReader(self.path)
+        self.assertEqual([group['chunks'][0]['encoding'] for group in reader.row_groups], ['int', 'dict'])
+        for value in (24, '24'):
+            self.assertEqual(list(reader.scan(where=[('Prefix Length', '>=', value)])), [(24,), (30,), ('24',)])
+        self.assertEqual(list(reader.scan(where=[('Prefix Length', 'in', ['3'])])), [(3,), ('3',)])
+        self.assertEqual(list(reader.scan(where=[('Prefix Length', '==', 'x')])), [('x',)])
+
+    def test_row_groups_are_skipped_by_statistics(self):
+        archive.ROW_GROUP_SIZE, size = 100, archive.ROW_GROUP_SIZE
+        self.addCleanup(setattr, archive, 'ROW_GROUP_SIZE', size)
+        rows = sorted(self.rows, key=lambda row: int(row[1]))
+        write_archive(self.path, SUBNET_COLUMNS, rows)
+        reader = ArchiveReader(self.path)
+        chunks = [group['chunks'][1] for group in reader.row_groups]
+        skipped = [reader._can_skip(chunk, '==', 30) for chunk in chunks]
+        self.assertEqual(skipped.count(False), 1)
+        self.assertEqual(len(list(reader.scan(where=[('Prefix Length', '==', 30)]))), 43)
+
+    def test_not_an_archive(self):
+        with open(self.path, 'wb') as file:
+            file.write(b'IP Address,Score\r\n')
+        with self.assertRaises(ValueError):
+            ArchiveReader(self.path)
+
+    def test_compact_archives_closed_segments_only(self):
+        filename = os.path.join(self.directory.name, 'subnet_quiz_results.csv')
+        log = ResultLog(filename, SUBNET_COLUMNS, max_bytes=4000)
+        log.extend(self.rows[:300])
+        log.append(self.rows[300])
+        log.close()
+        segments = [path for _, path in list_segments(filename)]
+        self.assertEqual(compact(filename, remove=True), [archive_name(path) for path in segments])
+        self.assertEqual(list_segments(filename), [])
+        self.assertEqual(compact(filename), [])
+        with open(filename, newline='') as file:
+            live = list(csv.reader(file))[1:]
+        archived = [[str(value) for value in row] for row in scan_log(filename)]
+        self.assertEqual(archived + live, self.rows[:301])
+
+        # numbers of archived segments are not reused
+        log = ResultLog(filename, SUBNET_COLUMNS)
+        log.append(self.rows[301])
+        log.rotate()
+        self.assertTrue(os.path.exists(segment_name(filename, len(segments) + 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+"""
+ASGI entry point for serving the quiz app from an event loop.
+
+Run with any ASGI server, e.g.:
+
+    uvicorn asgi:application --workers 4
+
+Every request is handed to a bounded thread pool, so the Flask views
+(question generation, template rendering, session access) never run on the
+event loop itself, and result rows are only queued for the background
+result writer. The event loop just accepts connections and moves bytes,
+which lets one process hold many idle or slow clients open.
+
+FLASK_ASGI_THREADS sets the size of the thread pool (default 32). On
+lifespan shutdown, queued result rows are flushed before the server exits.
+"""
+import asyncio
+import io
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from app import app, result_writer
+
+
+class WSGIToASGI:
+    """
+    Serve a WSGI app over ASGI by running it on a thread pool.
+
+    Responses are buffered in the worker thread and sent in one piece,
+    which suits the small HTML pages of the quizzes.
+
+    Args:
+        wsgi_app: The WSGI application.
+        max_threads (int): Size of the thread pool that runs requests.
+        on_shutdown (list): Callables run (off the loop) at lifespan shutdown.
+    """
+
+    def __init__(self, wsgi_app, max_threads=32, on_shutdown=()):
+        self.wsgi_app = wsgi_app
+        self.executor = ThreadPoolExecutor(max_threads, thread_name_prefix="asgi")
+        self.on_shutdown = list(on_shutdown)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            await self.http(scope, receive, send)
+        elif scope["type"] == "lifespan":
+            await self.lifespan(receive, send)
+
+    async def lifespan(self, receive, send):
+        loop = asyncio.get_running_loop()
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                for callback in self.on_shutdown:
+                    await loop.run_in_executor(self.executor, callback)
+                self.executor.shutdown(wait=True)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def http(self, scope, receive, send):
+        body = []
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            body.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                break
+
+        environ = self.build_environ(scope, b"".join(body))
+        loop = asyncio.get_running_loop()
+        status, headers, content = await loop.run_in_executor(self.executor, self.run_wsgi, environ)
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": content})
+
+    def build_environ(self, scope, body):
+        """
+        Translate an ASGI HTTP scope into a WSGI environ (PEP 3333).
+        """
+        server = scope.get("server") or ("localhost", 80)
+        client = scope.get("client") or ("", 0)
+        environ = {
+            "REQUEST_METHOD": scope["method"],
+            "SCRIPT_NAME": scope.get("root_path", "").encode("utf-8").decode("latin-1"),
+            "PATH_INFO": scope["path"].encode("utf-8").decode("latin-1"),
+            "QUERY_STRING": scope.get("query_string", b"").decode("latin-1"),
+            "SERVER_NAME": server[0],
+            "SERVER_PORT": str(server[1]),
+            "SERVER_PROTOCOL": f"HTTP/{scope.get('http_version', '1.1')}",
+            "REMOTE_ADDR": client[0],
+            "REMOTE_PORT": str(client[1]),
+            "wsgi.version": (1, 0),
+            "wsgi.url_scheme": scope.get("scheme", "http"),
+            "wsgi.input": io.BytesIO(body),
+            "wsgi.errors": sys.stderr,
+            "wsgi.multithread": True,
+            "wsgi.multiprocess": True,
+            "wsgi.run_once": False,
+        }
+        for name, value in scope.get("headers", []):
+            name = name.decode("latin-1").upper().replace("-", "_")
+            value = value.decode("latin-1")
+            if name == "CONTENT_TYPE" or name == "CONTENT_LENGTH":
+                key = name
+            else:
+                key = f"HTTP_{name}"
+            if key in environ:
+                # HTTP/2 may split Cookie into several fields (RFC 9113 8.2.3)
+                separator = "; " if key == "HTTP_COOKIE" else ","
+                value = f"{environ[key]}{separator}{value}"
+            environ[key] = value
+        return environ
+
+    def run_wsgi(self, environ):
+        """
+        Run the WSGI app in a worker thread and buffer its response.
+
+        Returns:
+            tuple: (status code, ASGI header list, body bytes).
+        """
+        response = {}
+
+        def start_response(status, headers, exc_info=None):
+            response["status"] = int(status.split(" ", 1)[0])
+            response["headers"] = [(name.lower().encode("latin-1"), value.encode("latin-1"))
+                                   for name, value in headers]
+
+        chunks = self.wsgi_app(environ, start_response)
+        try:
+            content = b"".join(chunks)
+        finally:
+            if hasattr(chunks, "close"):
+                chunks.close()
+        return response["status"], response["headers"], content
+
+
+app.config.setdefault('ASGI_THREADS', 32)
+application = WSGIToASGI(app, max_threads=int(app.config['ASGI_THREADS']),
+                         on_shutdown=[result_writer.close])
@@ -0,0 +1,79 @@
+import asyncio
+import unittest
+from flask import Flask, request
+from asgi import WSGIToASGI
+
+
+def make_app():
+    app = Flask(__name__)
+
+    @app.route('/echo', methods=['GET', 'POST'])
+    def echo():
+        return f"{request.method} {request.args.get('q', '')} {request.form.get('name', '')} {request.headers.get('X-Test', '')}"
+
+    @app.route('/cookies')
+    def cookies():
+        return " ".join(f"{name}={value}" for name, value in sorted(request.cookies.items()))
+
+    return app
+
+
+def call(application, scope, body=b""):
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(application(scope, receive, send))
+    return sent
+
+
+class TestWSGIToASGI(unittest.TestCase):
+
+    def test_http_request(self):
+        application = WSGIToASGI(make_app(), max_threads=2)
+        scope = {
+            "type": "http", "method": "POST", "path": "/echo", "query_string": b"q=1",
+            "headers": [(b"content-type", b"application/x-www-form-urlencoded"),
+                        (b"content-length", b"9"), (b"x-test", b"a"), (b"x-test", b"b")],
+        }
+        sent = call(application, scope, b"name=quiz")
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertEqual(sent[1]["body"], b"POST 1 quiz a,b")
+
+    def test_repeated_cookie_headers(self):
+        application = WSGIToASGI(make_app(), max_threads=1)
+        scope = {
+            "type": "http", "method": "GET", "path": "/cookies",
+            "headers": [(b"cookie", b"session=abc"), (b"cookie", b"other=x")],
+        }
+        sent = call(application, scope)
+        self.assertEqual(sent[1]["body"], b"other=x session=abc")
+
+    def test_not_found(self):
+        application = WSGIToASGI(make_app(), max_threads=1)
+        sent = call(application, {"type": "http", "method": "GET", "path": "/missing", "headers": []})
+        self.assertEqual(sent[0]["status"], 404)
+
+    def test_lifespan_shutdown_runs_callbacks(self):
+        flushed = []
+        application = WSGIToASGI(make_app(), max_threads=1, on_shutdown=[lambda: flushed.append(True)])
+        messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message["type"])
+
+        asyncio.run(application({"type": "lifespan"}, receive, send))
+        self.assertEqual(sent, ["lifespan.startup.complete", "lifespan.shutdown.complete"])
+        self.assertEqual(flushed, [True])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,211 @@
+"""
+Static asset pipeline: fingerprinted URLs, long-lived caching, compression.
+
+    python assets.py build     # write downscaled and WebP image variants (needs Pillow)
+
+init_assets() reads every file under the static folder once at startup and
+names it by its content, so ``url_for('static', filename='css/main.css')``
+becomes ``/static/css/main.1a2b3c4d5e.css``. A fingerprinted URL never
+changes meaning, so it is served with ``Cache-Control: immutable`` and a
+one-year max-age and browsers stop revalidating assets on every quiz
+submit. Editing a file changes its URL on the next start.
+
+Text assets (CSS, JS, SVG) are compressed once with gzip, and with brotli
+when the ``brotli`` package is installed, and sent in the best encoding the
+browser accepts. Images use the variants written by ``build`` when they
+exist: the PNG downscaled to the largest size the pages show it at, and a
+WebP copy sent to browsers that list ``image/webp`` in their Accept header.
+
+Files not in the manifest (added after startup, or unknown names) are
+served by Flask's default static view.
+"""
+import gzip
+import hashlib
+import mimetypes
+import os
+from collections import namedtuple
+
+from flask import current_app, request
+
+VARIANTS_DIR = "variants"
+MAX_AGE = 365 * 24 * 3600
+COMPRESSIBLE = (".css", ".js", ".svg", ".html", ".txt")
+COMPRESS_MIN_BYTES = 256
+
+# Widest an image is ever shown, in CSS pixels, times 2 for high-DPI screens.
+# The header logo is 51px; the trojans are at most 30% of a 1440px page.
+IMAGE_WIDTHS = {"images/logo.png": 102}
+DEFAULT_IMAGE_WIDTH = 864
+
+Asset = namedtuple("Asset", "filename url_name mimetype body gzip brotli webp")
+# assets by fingerprinted name, and fingerprinted names by file name
+Manifest = namedtuple("Manifest", "assets names")
+
+
+def _fingerprinted(filename, digest):
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.{digest[:10]}{ext}"
+
+
+def _read(path):
+    with open(path, "rb") as file:
+        return file.read()
+
+
+def _brotli(data):
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli.compress(data, quality=11)
+
+
+def variant_paths(static_folder, filename):
+    """
+    Paths of the image variants of a static file.
+
+    Returns:
+        tuple: (downscaled copy, WebP copy), in the variants folder.
+
+    Examples:
+        >>> variant_paths('static', 'images/logo.png')
+        ('static/variants/images/logo.png', 'static/variants/images/logo.webp')
+    """
+    base = os.path.join(static_folder, VARIANTS_DIR, filename)
+    return base, os.path.splitext(base)[0] + ".webp"
+
+
+def build_manifest(static_folder):
+    """
+    Fingerprint and pre-compress every static file.
+
+    Args:
+        static_folder (str): The app's static folder.
+
+    Returns:
+        Manifest: The assets and their fingerprinted names.
+    """
+    assets = {}
+    names = {}
+    for directory, subdirectories, files in os.walk(static_folder):
+        if os.path.abspath(directory) == os.path.abspath(static_folder):
+            subdirectories[:] = [name for name in subdirectories if name != VARIANTS_DIR]
+        for name in files:
+            path = os.path.join(directory, name)
+            filename = os.path.relpath(path, static_folder).replace(os.sep, "/")
+            resized, webp = variant_paths(static_folder, filename)
+            body = _read(resized if os.path.exists(resized) else path)
+            webp_body = _read(webp) if os.path.exists(webp) else None
+            digest = hashlib.sha256(body + (webp_body or b"")).hexdigest()
+            compressed = brotli_body = None
+            if filename.endswith(COMPRESSIBLE) and len(body) >= COMPRESS_MIN_BYTES:
+                compressed = gzip.compress(body, compresslevel=9, mtime=0)
+                brotli_body = _brotli(body)
+            mimetype = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+            url_name = _fingerprinted(filename, digest)
+            assets[url_name] = Asset(filename, url_name, mimetype, body, compressed, brotli_body, webp_body)
+            names[filename] = url_name
+    return Manifest(assets, names)
+
+
+def init_assets(app):
+    """
+    Serve an app's static files through the pipeline.
+
+    Args:
+        app (Flask): The app. Its static route must already exist.
+    """
+    app.config.setdefault('ASSET_PIPELINE', True)
+    if not app.config['ASSET_PIPELINE'] or not app.has_static_folder:
+        app.extensions['assets'] = None
+        return
+    manifest = build_manifest(app.static_folder)
+    app.extensions['assets'] = manifest
+    names = manifest.names
+
+    def fingerprint_static_url(endpoint, values):
+        if endpoint == 'static' and values.get('filename') in names:
+            values['filename'] = names[values['filename']]
+
+    app.url_defaults(fingerprint_static_url)
+    app.view_functions['static'] = serve_asset
+
+
+def serve_asset(filename):
+    """
+    Serve a fingerprinted asset, in the best form the browser accepts.
+    """
+    asset = current_app.extensions['assets'].assets.get(filename)
+    if asset is None:
+        return current_app.send_static_file(filename)
+    body, mimetype, encoding = asset.body, asset.mimetype, None
+    vary = ['Accept-Encoding']
+    if asset.webp is not None:
+        vary = ['Accept']
+        if 'image/webp' in request.headers.get('Accept', ''):
+            body, mimetype = asset.webp, 'image/webp'
+    elif asset.brotli is not None and request.accept_encodings.quality('br'):
+        body, encoding = asset.brotli, 'br'
+    elif asset.gzip is not None and request.accept_encodings.quality('gzip'):
+        body, encoding = asset.gzip, 'gzip'
+    response = current_app.response_class(body, mimetype=mimetype)
+    if encoding:
+        response.content_encoding = encoding
+    response.vary.update(vary)
+    response.cache_control.public = True
+    response.cache_control.max_age = MAX_AGE
+    response.cache_control.immutable = True
+    response.set_etag(f"{asset.url_name}-{encoding or mimetype}")
+    return response.make_conditional(request)
+
+
+def build_variants(static_folder, widths=None, default_width=DEFAULT_IMAGE_WIDTH):
+    """
+    Write downscaled (or just re-encoded) PNG and WebP copies of the
+    static images. A PNG copy that is not smaller is not kept.
+
+    Args:
+        static_folder (str): The app's static folder.
+        widths (dict): Largest width per image; others get default_width.
+
+    Returns:
+        list: (filename, original bytes, PNG bytes served, WebP bytes).
+    """
+    from PIL import Image
+
+    widths = IMAGE_WIDTHS if widths is None else widths
+    written = []
+    for directory, subdirectories, files in os.walk(static_folder):
+        if os.path.abspath(directory) == os.path.abspath(static_folder):
+            subdirectories[:] = [name for name in subdirectories if name != VARIANTS_DIR]
+        for name in files:
+            if not name.lower().endswith((".png", ".jpg", ".jpeg")):
+                continue
+            path = os.path.join(directory, name)
+            filename = os.path.relpath(path, static_folder).replace(os.sep, "/")
+            resized, webp = variant_paths(static_folder, filename)
+            os.makedirs(os.path.dirname(resized), exist_ok=True)
+            with Image.open(path) as image:
+                width = widths.get(filename, default_width)
+                if image.width > width:
+                    image = image.resize((width, round(image.height * width / image.width)), Image.LANCZOS)
+                image.save(resized, optimize=True)
+                image.save(webp, "WEBP", quality=85, method=6)
+            if os.path.getsize(resized) >= os.path.getsize(path):
+                # neither downscaling nor re-encoding helped
+                os.remove(resized)
+            size = os.path.getsize(resized if os.path.exists(resized) else path)
+            written.append((filename, os.path.getsize(path), size, os.path.getsize(webp)))
+    return written
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build static asset variants.")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("--static", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "static"))
+    args = parser.parse_args()
+
+    for filename, original, resized, webp in build_variants(args.static):
+        print(f"{filename:<32} {original:>9} B -> {resized:>9} B PNG, {webp:>9} B WebP")
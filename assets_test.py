@@ -0,0 +1,76 @@
+import os
+import gzip
+import tempfile
+import unittest
+
+from flask import Flask, url_for
+
+from assets import VARIANTS_DIR, init_assets
+
+CSS = 'body { color: #222; }\n' * 40
+
+
+class TestAssets(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        static = self.directory.name
+        os.makedirs(os.path.join(static, 'css'))
+        os.makedirs(os.path.join(static, 'images'))
+        os.makedirs(os.path.join(static, VARIANTS_DIR, 'images'))
+        with open(os.path.join(static, 'css', 'main.css'), 'w') as file:
+            file.write(CSS)
+        with open(os.path.join(static, 'images', 'logo.png'), 'wb') as file:
+            file.write(b'original png')
+        with open(os.path.join(static, VARIANTS_DIR, 'images', 'logo.png'), 'wb') as file:
+            file.write(b'small png')
+        with open(os.path.join(static, VARIANTS_DIR, 'images', 'logo.webp'), 'wb') as file:
+            file.write(b'webp')
+        self.app = Flask(__name__, static_folder=static, static_url_path='/static')
+        init_assets(self.app)
+        self.client = self.app.test_client()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def url(self, filename):
+        with self.app.test_request_context():
+            return url_for('static', filename=filename)
+
+    def test_urls_are_fingerprinted_and_immutable(self):
+        url = self.url('css/main.css')
+        self.assertRegex(url, r'^/static/css/main\.[0-9a-f]{10}\.css$')
+        response = self.client.get(url)
+        self.assertEqual(response.get_data(as_text=True), CSS)
+        self.assertIn('immutable', response.headers['Cache-Control'])
+        self.assertIn('max-age=31536000', response.headers['Cache-Control'])
+        self.assertEqual(self.client.get(url, headers={'If-None-Match': response.headers['ETag']}).status_code, 304)
+
+    def test_compressed_text(self):
+        response = self.client.get(self.url('css/main.css'), headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.get_data()).decode(), CSS)
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+
+    def test_image_variants(self):
+        url = self.url('images/logo.png')
+        self.assertEqual(self.client.get(url).get_data(), b'small png')
+        response = self.client.get(url, headers={'Accept': 'image/avif,image/webp,*/*'})
+        self.assertEqual(response.get_data(), b'webp')
+        self.assertEqual(response.mimetype, 'image/webp')
+        self.assertIn('Accept', response.headers['Vary'])
+
+    def test_unknown_files_use_the_default_view(self):
+        self.assertEqual(self.client.get('/static/css/main.css').get_data(as_text=True), CSS)
+        self.assertEqual(self.client.get('/static/css/missing.css').status_code, 404)
+
+    def test_disabled(self):
+        app = Flask(__name__, static_folder=self.directory.name, static_url_path='/static')
+        app.config['ASSET_PIPELINE'] = False
+        init_assets(app)
+        with app.test_request_context():
+            self.assertEqual(url_for('static', filename='css/main.css'), '/static/css/main.css')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,229 @@
+"""
+Batch grading of offline exam submissions.
+
+    python batch_grading.py classful answers.csv graded.csv --workers 8
+
+Reads submissions from a CSV or JSON Lines file, grades each one with the
+same logic as the quiz pages (grading.py), and writes one scored row per
+submission, in input order, to a CSV or JSON Lines file (chosen by file
+extension). A CSV input has an "IP Address" and a "CIDR Prefix" column plus
+one column per question, e.g. "Subnet Mask (SNM)" (question_batch.py
+writes this layout); a JSONL input has one API-style object per line::
+
+    {"ip": "172.16.5.4", "prefix": 20, "answers": {"Address Class": "B", ...}}
+
+The input is streamed: the parent process reads blocks of ``chunk_size``
+lines and a process pool parses, grades and formats them, with at most two
+blocks per worker in flight, so memory stays flat however large the file.
+Records must not contain line breaks.
+
+Answer keys depend only on the prefix (subnet quiz) or the first octet and
+the prefix (classful quiz), so each worker builds every key at most once.
+"""
+import csv
+import io
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+from address_engine import ip_to_int
+from grading import CLASSFUL_FIELDS, SUBNET_FIELDS, classful_answers, grade_classful, grade_subnet, subnet_answers
+
+# quiz -> (questions, answer key, grader, what the answer key depends on)
+QUIZZES = {
+    "classful": (CLASSFUL_FIELDS, classful_answers, grade_classful, lambda address, prefix: (address >> 24, prefix)),
+    "subnet": (SUBNET_FIELDS, subnet_answers, grade_subnet, lambda address, prefix: prefix),
+}
+
+OUTPUT_COLUMNS = ["IP Address", "CIDR Prefix", "Score", "Total", "Incorrect", "Invalid", "Error"]
+
+# Answer keys built so far in this process, by (quiz, key parts)
+_answer_keys = {}
+
+
+def grade_record(quiz, ip, prefix, answers):
+    """
+    Grade one submission.
+
+    Args:
+        quiz (str): "classful" or "subnet".
+        ip (str): The question's IP address.
+        prefix (int): The question's prefix length.
+        answers (dict): The user's answer to each question.
+
+    Returns:
+        dict: ip, prefix, score, total, incorrect (questions answered
+        wrong, in order) and invalid (question -> reason code); or ip,
+        prefix and error if the question itself is malformed.
+
+    Examples:
+        >>> grade_record('subnet', '10.1.2.3', 12, {'Subnet Mask': '255.240.0.0'})['score']
+        1
+    """
+    fields, answer_key, grade, key_parts = QUIZZES[quiz]
+    try:
+        token = (quiz, key_parts(ip_to_int(ip), prefix))
+        correct_answers = _answer_keys.get(token)
+        if correct_answers is None:
+            correct_answers = _answer_keys[token] = answer_key(ip, prefix)
+    except (ValueError, TypeError) as error:
+        return {"ip": ip, "prefix": prefix, "error": str(error)}
+    user_answers = {key: str(answers.get(key, "")).strip() for key in fields}
+    results, score, invalid = grade(correct_answers, user_answers)
+    return {
+        "ip": ip,
+        "prefix": prefix,
+        "score": score,
+        "total": len(correct_answers),
+        "incorrect": [result["question"] for result in results if not result["correct"]],
+        "invalid": invalid,
+    }
+
+
+def _read_csv(header, lines):
+    for row in csv.reader(lines):
+        if not row:
+            continue
+        if len(row) != len(header):
+            yield None, None, None, f"expected {len(header)} columns, got {len(row)}"
+            continue
+        record = dict(zip(header, row))
+        prefix = record.get("CIDR Prefix", "")
+        yield (record.get("IP Address", ""), int(prefix) if prefix.isdigit() else prefix, record,
+               None if prefix.isdigit() else f"Invalid prefix length: {prefix!r}")
+
+
+def _read_jsonl(lines):
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as error:
+            yield None, None, None, f"invalid JSON: {error}"
+            continue
+        if not isinstance(record, dict):
+            yield None, None, None, "a submission must be an object"
+            continue
+        ip, prefix, answers = record.get("ip"), record.get("prefix"), record.get("answers")
+        if not isinstance(ip, str) or type(prefix) is not int or not isinstance(answers, dict):
+            yield ip, prefix, None, "a submission needs ip (string), prefix (integer) and answers (object)"
+            continue
+        yield ip, prefix, answers, None
+
+
+def grade_chunk(quiz, header, output_format, lines):
+    """
+    Parse, grade and format a block of input lines (runs in a worker).
+
+    Args:
+        quiz (str): "classful" or "subnet".
+        header (list): CSV column names, or None for JSON Lines input.
+        output_format (str): "csv" or "jsonl".
+        lines (list): Input lines.
+
+    Returns:
+        tuple: (output text, number of rows, number of rows with an error).
+    """
+    records = _read_csv(header, lines) if header is not None else _read_jsonl(lines)
+    out = io.StringIO()
+    writer = csv.writer(out) if output_format == "csv" else None
+    dumps = json.JSONEncoder(separators=(",", ":")).encode
+    rows = errors = 0
+    for ip, prefix, answers, error in records:
+        graded = {"ip": ip, "prefix": prefix, "error": error} if error else grade_record(quiz, ip, prefix, answers)
+        rows += 1
+        if "error" in graded:
+            errors += 1
+        if writer is None:
+            out.write(dumps(graded) + "\n")
+        elif "error" in graded:
+            writer.writerow([ip, prefix, "", "", "", "", graded["error"]])
+        else:
+            writer.writerow([ip, prefix, graded["score"], graded["total"], "; ".join(graded["incorrect"]),
+                             "; ".join(f"{key}={reason}" for key, reason in graded["invalid"].items()), ""])
+    return out.getvalue(), rows, errors
+
+
+def file_format(filename):
+    """
+    Returns:
+        str: "jsonl" for .jsonl/.ndjson files, otherwise "csv".
+    """
+    return "jsonl" if filename.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def _in_order(executor, function, blocks, window):
+    pending = deque()
+    for block in blocks:
+        pending.append(executor.submit(function, block))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def grade_file(quiz, source, destination, workers=None, chunk_size=20000):
+    """
+    Grade every submission in a file and write the scored rows.
+
+    Args:
+        quiz (str): "classful" or "subnet".
+        source (str): Input CSV or JSONL file.
+        destination (str): Output CSV or JSONL file.
+        workers (int): Worker processes; None for one per CPU, 1 to grade
+            in this process.
+        chunk_size (int): Input lines per block handed to a worker.
+
+    Returns:
+        dict: rows, errors and seconds.
+    """
+    if quiz not in QUIZZES:
+        raise ValueError(f"unknown quiz {quiz!r}; expected one of {sorted(QUIZZES)}")
+    began = time.perf_counter()
+    output_format = file_format(destination)
+    rows = errors = 0
+    with open(source, newline="", encoding="utf-8-sig") as infile, \
+            open(destination, "w", newline="", encoding="utf-8") as outfile:
+        header = next(csv.reader([infile.readline()]), []) if file_format(source) == "csv" else None
+        if output_format == "csv":
+            csv.writer(outfile).writerow(OUTPUT_COLUMNS)
+        blocks = iter(lambda: list(islice(infile, chunk_size)), [])
+        function = partial(grade_chunk, quiz, header, output_format)
+
+        if workers == 1:
+            results = map(function, blocks)
+            executor = None
+        else:
+            workers = workers or os.cpu_count() or 1
+            executor = ProcessPoolExecutor(workers)
+            results = _in_order(executor, function, blocks, 2 * workers)
+        try:
+            for text, block_rows, block_errors in results:
+                outfile.write(text)
+                rows += block_rows
+                errors += block_errors
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+    return {"rows": rows, "errors": errors, "seconds": time.perf_counter() - began}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Grade offline quiz submissions in bulk.")
+    parser.add_argument("quiz", choices=sorted(QUIZZES))
+    parser.add_argument("source", help="submissions, .csv or .jsonl")
+    parser.add_argument("destination", help="scored output, .csv or .jsonl")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=20000)
+    args = parser.parse_args()
+
+    stats = grade_file(args.quiz, args.source, args.destination, args.workers, args.chunk_size)
+    print(f"graded {stats['rows']} rows ({stats['errors']} errors) in {stats['seconds']:.1f} s, "
+          f"{stats['rows'] / stats['seconds']:.0f} rows/s")
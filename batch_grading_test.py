@@ -0,0 +1,92 @@
+import csv
+import json
+import os
+import tempfile
+import unittest
+
+from batch_grading import OUTPUT_COLUMNS, grade_chunk, grade_file, grade_record
+from grading import CLASSFUL_FIELDS, classful_answers
+
+
+class TestBatchGrading(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def write_csv(self, name, rows):
+        with open(self.path(name), 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(['IP Address', 'CIDR Prefix', *CLASSFUL_FIELDS])
+            writer.writerows(rows)
+
+    def test_grade_record(self):
+        key = classful_answers('172.16.5.4', 20)
+        self.assertEqual(grade_record('classful', '172.16.5.4', 20, key)['score'], 5)
+        graded = grade_record('classful', '172.16.5.4', 20, dict(key, **{'Address Class': 'b'}))
+        self.assertEqual((graded['score'], graded['incorrect'], graded['invalid']),
+                         (4, ['Address Class'], {'Address Class': 'not_a_choice'}))
+        self.assertIn('error', grade_record('classful', '172.16.5', 20, key))
+        self.assertIn('error', grade_record('classful', '230.1.1.1', 20, {}))
+        self.assertIn('error', grade_record('subnet', '172.16.5.4', 40, {}))
+
+    def test_grade_file_csv_matches_in_process_and_pool(self):
+        rows = []
+        for index in range(250):
+            ip, prefix = f"10.0.{index}.1", 9 + index % 20
+            key = classful_answers(ip, prefix)
+            answers = [key[field] for field in CLASSFUL_FIELDS]
+            if index % 3 == 0:
+                answers[0] = 'B'
+            rows.append([ip, prefix, *answers])
+        rows.append(['10.0.0.1', 'x', '', '', '', '', ''])
+        self.write_csv('in.csv', rows)
+
+        single = grade_file('classful', self.path('in.csv'), self.path('single.csv'), workers=1, chunk_size=40)
+        pooled = grade_file('classful', self.path('in.csv'), self.path('pooled.csv'), workers=2, chunk_size=40)
+        self.assertEqual((single['rows'], single['errors']), (251, 1))
+        self.assertEqual((pooled['rows'], pooled['errors']), (251, 1))
+        with open(self.path('single.csv'), newline='') as file:
+            graded = list(csv.reader(file))
+        with open(self.path('pooled.csv'), newline='') as file:
+            self.assertEqual(list(csv.reader(file)), graded)
+        self.assertEqual(graded[0], OUTPUT_COLUMNS)
+        self.assertEqual(graded[1][2:5], ['4', '5', 'Address Class'])
+        self.assertEqual(graded[2][2:5], ['5', '5', ''])
+        self.assertTrue(graded[-1][-1])
+
+    def test_jsonl(self):
+        lines = [json.dumps({'ip': '10.1.2.3', 'prefix': 12, 'answers': {'Subnet Mask': '255.240.0.0'}}),
+                 'not json']
+        text, rows, errors = grade_chunk('subnet', None, 'jsonl', [line + '\n' for line in lines])
+        graded = [json.loads(line) for line in text.splitlines()]
+        self.assertEqual((rows, errors), (2, 1))
+        self.assertEqual(graded[0]['incorrect'], ['Subnet Address Map', 'Wildcard Mask'])
+        self.assertIn('error', graded[1])
+
+    def test_jsonl_bad_records_do_not_stop_the_file(self):
+        lines = [{'answers': {}}, {'ip': 7, 'prefix': 12, 'answers': {}},
+                 {'ip': '10.1.2.3', 'prefix': True, 'answers': {}}, {'ip': '10.1.2.3', 'prefix': '12', 'answers': {}}, [],
+                 {'ip': '10.1.2.3', 'prefix': 12, 'answers': {'Subnet Mask': '255.240.0.0'}}]
+        with open(self.path('in.jsonl'), 'w') as file:
+            file.writelines(json.dumps(line) + '\n' for line in lines)
+        stats = grade_file('subnet', self.path('in.jsonl'), self.path('out.jsonl'), workers=1)
+        self.assertEqual((stats['rows'], stats['errors']), (6, 5))
+        with open(self.path('out.jsonl')) as file:
+            graded = [json.loads(line) for line in file]
+        self.assertTrue(all('error' in row for row in graded[:5]))
+        self.assertEqual(graded[2]['prefix'], True)
+        self.assertEqual(graded[5]['score'], 1)
+
+    def test_unknown_quiz(self):
+        with self.assertRaises(ValueError):
+            grade_file('trivia', self.path('in.csv'), self.path('out.csv'))
+
+
+if __name__ == '__main__':
+    unittest.main()
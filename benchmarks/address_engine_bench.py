@@ -0,0 +1,62 @@
+"""
+Classful analysis throughput: ipaddress-based vs. the integer engine.
+
+Run from the repository root:
+
+    python -m benchmarks.address_engine_bench [count]
+
+"before" is the original calculate_classful_analysis, kept here for
+comparison. "after" is the current one, which parses the address once and
+serves everything else from tables. "engine" is address_engine.analyze on
+addresses that are already ints, the form bulk callers use.
+"""
+import ipaddress
+import random
+import sys
+import time
+
+from address_engine import analyze, ip_to_int
+from classaddress import calculate_classful_analysis, generate_random_classful_address
+
+
+def legacy_classful_analysis(ip, default_mask, cidr_prefix):
+    network = ipaddress.ip_network(f"{ip}/{cidr_prefix}", strict=False)
+    first_octet = int(ip.split('.')[0])
+    if 1 <= first_octet <= 126:
+        leading_bit_pattern, native_address_map, address_class = "0", "N.H.H.H", "A"
+    elif 128 <= first_octet <= 191:
+        leading_bit_pattern, native_address_map, address_class = "10", "N.N.H.H", "B"
+    elif 192 <= first_octet <= 223:
+        leading_bit_pattern, native_address_map, address_class = "110", "N.N.N.H", "C"
+    else:
+        leading_bit_pattern, native_address_map, address_class = "Unknown", "Invalid Address Class", "Invalid"
+    return {
+        "Address Class": address_class,
+        "Leading Bit Pattern": leading_bit_pattern,
+        "Native Address Map": native_address_map,
+        "Subnet Mask (SNM)": str(network.netmask),
+        "Wildcard Mask (WCM)": str(network.hostmask)
+    }
+
+
+def rate(label, function, questions):
+    began = time.perf_counter()
+    for question in questions:
+        function(*question)
+    elapsed = time.perf_counter() - began
+    print(f"{label:<8} {len(questions) / elapsed / 1e6:>8.2f} M analyses/s")
+    return elapsed
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    random.seed(1)
+    questions = [generate_random_classful_address() for _ in range(count)]
+    for question in questions[:1000]:
+        assert legacy_classful_analysis(*question) == calculate_classful_analysis(*question)
+    int_questions = [(ip_to_int(ip), prefix) for ip, _, prefix in questions]
+
+    before = rate("before", legacy_classful_analysis, questions)
+    after = rate("after", calculate_classful_analysis, questions)
+    engine = rate("engine", analyze, int_questions)
+    print(f"speedup: after {before / after:.1f}x, engine {before / engine:.1f}x")
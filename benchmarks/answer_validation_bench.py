@@ -0,0 +1,106 @@
+"""
+Classful answer validation: inline regexes vs. the precompiled validator.
+
+Run from the repository root:
+
+    python -m benchmarks.answer_validation_bench [answers]
+
+Builds a corpus of real answers (from calculate_classful_analysis) and
+fuzzed ones (case changes, random octets, truncation, junk), checks that
+the old and new validators agree on every answer, and times both. The
+original validate_input is kept here for comparison.
+"""
+import random
+import re
+import sys
+import time
+
+from answer_validation import validate_submission
+from classaddress import calculate_classful_analysis, generate_random_classful_address, validate_input
+
+
+def legacy_validate_input(key, value):
+    if key == "Address Class":
+        return value in ['A', 'B', 'C', 'D', 'E']
+    elif key == "Native Address Map":
+        if 'n' in value or 'h' in value:
+            return False
+        return (re.match(r'^N\.N\.N\.H$', value) is not None) or \
+               (re.match(r'^\d+\.\d+\.\d+\.H$', value) is not None) or \
+               (re.match(r'^N\.N\.H\.H$', value) is not None) or \
+               (re.match(r'^\d+\.\d+\.H\.H$', value) is not None) or \
+               (re.match(r'^N\.H\.H\.H$', value) is not None) or \
+               (re.match(r'^\d+\.H\.H\.H$', value) is not None)
+    elif key == "Leading Bit Pattern":
+        return value in ['0', '10', '110']
+    elif key == "Subnet Mask (SNM)" or key == "Wildcard Mask (WCM)":
+        try:
+            octets = list(map(int, value.split(".")))
+            if len(octets) != 4 or not all(0 <= octet <= 255 for octet in octets):
+                return False
+            mask_binary = "".join(f"{octet:08b}" for octet in octets)
+            if key == "Subnet Mask (SNM)":
+                return re.match(r"^1*0*$", mask_binary) is not None
+            else:
+                return re.match(r"^0*1*$", mask_binary) is not None
+        except ValueError:
+            return False
+    return False
+
+
+def fuzz(value, rng):
+    choice = rng.randrange(6)
+    if choice == 0:
+        return value.lower()
+    if choice == 1:
+        return value[:rng.randrange(len(value) + 1)]
+    if choice == 2:
+        return ".".join(str(rng.randint(0, 300)) for _ in range(4))
+    if choice == 3:
+        return value.replace("N", str(rng.randint(0, 255)), 2)
+    if choice == 4:
+        return "".join(rng.choice("0123456789.NHnh AB") for _ in range(rng.randint(1, 15)))
+    return value + rng.choice(["", ".", "0", " "])
+
+
+def build_corpus(count, rng):
+    submissions = []
+    answers = 0
+    while answers < count:
+        ip, default_mask, cidr_prefix = generate_random_classful_address()
+        submission = calculate_classful_analysis(ip, default_mask, cidr_prefix)
+        if rng.random() < 0.5:
+            submission = {key: fuzz(value, rng) for key, value in submission.items()}
+        submissions.append(submission)
+        answers += len(submission)
+    return submissions
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = random.Random(3)
+    random.seed(3)
+    submissions = build_corpus(count, rng)
+    pairs = [(key, value) for submission in submissions for key, value in submission.items()]
+    for key, value in pairs:
+        assert legacy_validate_input(key, value) == validate_input(key, value), (key, value)
+    rejected = sum(not validate_input(key, value) for key, value in pairs)
+    print(f"{len(pairs)} answers, {rejected} rejected; old and new validators agree on all")
+
+    began = time.perf_counter()
+    for key, value in pairs:
+        legacy_validate_input(key, value)
+    before = time.perf_counter() - began
+
+    began = time.perf_counter()
+    for key, value in pairs:
+        validate_input(key, value)
+    after = time.perf_counter() - began
+
+    began = time.perf_counter()
+    for submission in submissions:
+        validate_submission(submission)
+    batched = time.perf_counter() - began
+
+    for label, elapsed in (("before", before), ("after", after), ("submission", batched)):
+        print(f"{label:<11} {elapsed / len(pairs) * 1e9:>8.0f} ns/answer  {before / elapsed:>5.1f}x")
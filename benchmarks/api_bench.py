@@ -0,0 +1,78 @@
+"""
+Grading throughput: the classful quiz page vs. the JSON API.
+
+Run from the repository root:
+
+    python -m benchmarks.api_bench [submissions]
+
+Grades the same number of classful submissions three ways through the test
+client (so only the app's own cost is measured, not the network):
+
+    html          GET a question page, POST the form, render the result page
+    api           POST one JSON submission per request
+    api batch     POST MAX_BATCH submissions per request
+
+and prints requests/second, graded submissions/second and response bytes per
+submission. Results go to a throwaway SQLite database.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from api import MAX_BATCH
+from app import create_app
+from classaddress import generate_random_classful_address
+from grading import classful_answers
+
+
+def make_submissions(count):
+    submissions = []
+    for _ in range(count):
+        ip, _, prefix = generate_random_classful_address()
+        submissions.append({'ip': ip, 'prefix': prefix, 'answers': classful_answers(ip, prefix)})
+    return submissions
+
+
+def bench_html(client, submissions):
+    requests = size = 0
+    for submission in submissions:
+        client.get('/classful_quiz')
+        response = client.post('/classful_quiz', data=submission['answers'])
+        requests += 2
+        size += len(response.data)
+    return requests, size
+
+
+def bench_api(client, submissions):
+    requests = size = 0
+    for submission in submissions:
+        response = client.post('/api/v1/quiz/classful/answer', json=submission)
+        requests += 1
+        size += len(response.data)
+    return requests, size
+
+
+def bench_api_batch(client, submissions):
+    requests = size = 0
+    for start in range(0, len(submissions), MAX_BATCH):
+        response = client.post('/api/v1/quiz/classful/answer',
+                               json={'submissions': submissions[start:start + MAX_BATCH]})
+        requests += 1
+        size += len(response.data)
+    return requests, size
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    submissions = make_submissions(count)
+    with tempfile.TemporaryDirectory() as directory:
+        app = create_app({'RESULT_BACKEND': 'sqlite', 'RESULT_DB': os.path.join(directory, 'results.db')})
+        for name, bench in [('html', bench_html), ('api', bench_api), ('api batch', bench_api_batch)]:
+            client = app.test_client()
+            began = time.perf_counter()
+            requests, size = bench(client, submissions)
+            elapsed = time.perf_counter() - began
+            print(f"{name:<10} {requests / elapsed:>9.0f} requests/s {count / elapsed:>9.0f} submissions/s "
+                  f"{size / count:>7.0f} B/submission")
+        app.extensions['result_writer'].close()
@@ -0,0 +1,97 @@
+"""
+Result archive vs. CSV segments: size on disk and scan speed.
+
+Run from the repository root:
+
+    python -m benchmarks.archive_bench [rows]
+
+Writes ``rows`` subnet quiz attempts (default 1,000,000) to a CSV log with
+the columns app.py uses, the answer dicts stringified as the app logs them,
+compacts it with archive.compact(), and times three scans of each format:
+every column, two columns, and two columns of /24-and-longer prefixes only.
+"""
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+from archive import compact, scan_log
+from grading import SUBNET_FIELDS, subnet_answers
+from result_log import ResultLog, list_segments
+
+COLUMNS = ['IP Address', 'Prefix Length', 'Subnet Mask', 'Wildcard Mask', 'User Answers', 'Correct Answers',
+           'Score']
+
+
+def write_log(filename, total):
+    rng = random.Random(0)
+    log = ResultLog(filename, COLUMNS, max_bytes=64 * 1024 * 1024)
+    batch = []
+    for _ in range(total):
+        ip = f"{rng.randint(1, 223)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}"
+        prefix = rng.randint(8, 30)
+        correct = subnet_answers(ip, prefix)
+        # most students get most answers right
+        user = {key: correct[key] if rng.random() < 0.8 else "" for key in SUBNET_FIELDS}
+        score = sum(user[key] == correct[key] for key in SUBNET_FIELDS)
+        batch.append([ip, prefix, correct['Subnet Mask'], correct['Wildcard Mask'], str(user), str(correct),
+                      f"{score}/{len(SUBNET_FIELDS)}"])
+        if len(batch) == 10000:
+            log.extend(batch)
+            batch = []
+    log.extend(batch)
+    log.rotate()
+
+
+def scan_csv(paths, columns, min_prefix=None):
+    rows = 0
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as file:
+            reader = csv.reader(file)
+            header = next(reader)
+            indices = [header.index(column) for column in columns]
+            prefix_index = header.index('Prefix Length')
+            for row in reader:
+                if min_prefix is not None and int(row[prefix_index]) < min_prefix:
+                    continue
+                [row[index] for index in indices]
+                rows += 1
+    return rows
+
+
+def timed(function, *args):
+    began = time.perf_counter()
+    rows = function(*args)
+    return rows, time.perf_counter() - began
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "subnet_quiz_results.csv")
+        write_log(filename, total)
+        segments = [path for _, path in list_segments(filename)]
+        csv_bytes = sum(os.path.getsize(path) for path in segments)
+
+        began = time.perf_counter()
+        archives = compact(filename)
+        compact_seconds = time.perf_counter() - began
+        archive_bytes = sum(os.path.getsize(path) for path in archives)
+        print(f"{total} rows: CSV {csv_bytes / 1e6:.1f} MB, archive {archive_bytes / 1e6:.1f} MB "
+              f"({csv_bytes / archive_bytes:.1f}x smaller), compacted in {compact_seconds:.1f} s")
+
+        projection = ['IP Address', 'Score']
+        scans = [
+            ("all columns", COLUMNS, None),
+            ("2 columns", projection, None),
+            ("2 columns, prefix >= 24", projection, 24),
+        ]
+        print(f"{'scan':<26} {'rows':>9} {'CSV s':>8} {'archive s':>10}")
+        for label, columns, min_prefix in scans:
+            rows, csv_seconds = timed(scan_csv, segments, columns, min_prefix)
+            where = [('Prefix Length', '>=', min_prefix)] if min_prefix else None
+            archived, archive_seconds = timed(lambda: sum(1 for _ in scan_log(filename, columns, where)))
+            assert archived == rows
+            print(f"{label:<26} {rows:>9} {csv_seconds:>8.2f} {archive_seconds:>10.2f}")
@@ -0,0 +1,89 @@
+"""
+Bytes transferred per quiz round, with and without the asset pipeline.
+
+Run from the repository root:
+
+    python -m benchmarks.asset_bench [--rounds 3]
+
+A simulated browser with an HTTP cache opens the main page and plays each
+quiz (one GET and three answer POSTs, full pages), loading every asset the
+pages reference. Fresh cached assets are not requested; stale ones are
+revalidated with If-None-Match / If-Modified-Since. The browser accepts
+gzip, brotli and WebP. Bytes count response headers and bodies.
+"""
+import argparse
+import os
+import re
+import tempfile
+import time
+
+from app import create_app
+
+ASSET_URL = re.compile(r'(?:src|href)="(/static/[^"]+)"')
+QUIZZES = ['/decimal-to-binary', '/binary-to-decimal', '/subnet-quiz', '/classful_quiz']
+ACCEPT_ENCODING = 'gzip, deflate, br'
+ACCEPT_IMAGE = 'image/avif,image/webp,*/*'
+
+
+class Browser:
+    def __init__(self, client):
+        self.client = client
+        self.cache = {}
+        self.requests = 0
+        self.bytes = 0
+
+    def _count(self, response):
+        self.requests += 1
+        headers = sum(len(name) + len(value) + 4 for name, value in response.headers.items())
+        self.bytes += headers + len(response.get_data())
+
+    def page(self, url, data=None):
+        response = self.client.post(url, data=data) if data else self.client.get(url)
+        self._count(response)
+        for asset in ASSET_URL.findall(response.get_data(as_text=True)):
+            self.asset(asset)
+
+    def asset(self, url):
+        cached = self.cache.get(url)
+        if cached is not None and cached['fresh_until'] > time.time():
+            return
+        headers = {'Accept-Encoding': ACCEPT_ENCODING, 'Accept': ACCEPT_IMAGE}
+        if cached is not None:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        response = self.client.get(url, headers=headers)
+        self._count(response)
+        max_age = response.cache_control.max_age or 0
+        self.cache[url] = {'etag': response.headers.get('ETag'),
+                           'last_modified': response.headers.get('Last-Modified'),
+                           'fresh_until': time.time() + max_age}
+
+
+def play_round(browser):
+    browser.page('/')
+    for quiz in QUIZZES:
+        browser.page(quiz)
+        for _ in range(3):
+            browser.page(quiz, data={'user_guess': '0'})
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark bytes per quiz round.")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'pipeline':<10} {'round':>5} {'requests':>9} {'KB':>9}")
+        for enabled in (False, True):
+            app = create_app({'ASSET_PIPELINE': enabled, 'RESULT_BACKEND': 'sqlite',
+                              'RESULT_DB': os.path.join(directory, f'results-{enabled}.db')})
+            browser = Browser(app.test_client())
+            for number in range(1, args.rounds + 1):
+                requests, sent = browser.requests, browser.bytes
+                play_round(browser)
+                print(f"{'on' if enabled else 'off':<10} {number:>5} {browser.requests - requests:>9} "
+                      f"{(browser.bytes - sent) / 1024:>9.1f}")
+            app.extensions['result_writer'].close()
+            app.extensions['result_store'].close()
@@ -0,0 +1,53 @@
+"""
+Batch grading throughput and memory on a large exam upload.
+
+Run from the repository root (needs NumPy to generate the input):
+
+    python -m benchmarks.batch_grading_bench [--rows 10000000] [--workers 1,8]
+
+Writes ``rows`` classful submissions to a temporary CSV with
+question_batch.py (the answer columns hold the correct answers), grades the
+file with batch_grading.grade_file() once per worker count, and prints
+rows/second and the peak resident memory of the parent and of the largest
+worker, which should not grow with the number of rows.
+"""
+import argparse
+import csv
+import os
+import resource
+import tempfile
+import time
+
+import numpy as np
+
+from batch_grading import grade_file
+from question_batch import COLUMNS, generate_batch, iter_chunks
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch grading.")
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--workers", default=f"1,{os.cpu_count()}")
+    parser.add_argument("--chunk-size", type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "answers.csv")
+        began = time.perf_counter()
+        rng = np.random.default_rng(0)
+        with open(source, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(COLUMNS)
+            # generate in slices so the input never has to fit in memory
+            for start in range(0, args.rows, 1_000_000):
+                for rows in iter_chunks(generate_batch(min(1_000_000, args.rows - start), rng)):
+                    writer.writerows(rows)
+        print(f"wrote {args.rows} rows ({os.path.getsize(source) / 1e6:.0f} MB) "
+              f"in {time.perf_counter() - began:.1f} s")
+
+        for workers in sorted({int(count) for count in args.workers.split(",")}):
+            destination = os.path.join(directory, "graded.csv")
+            stats = grade_file("classful", source, destination, workers, args.chunk_size)
+            parent = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+            print(f"{workers:>3} workers  {stats['rows'] / stats['seconds']:>9.0f} rows/s  "
+                  f"{stats['seconds']:>7.1f} s  peak RSS parent {parent:.0f} MB, worker {children:.0f} MB")
@@ -0,0 +1,68 @@
+"""
+Bytes on the wire and CPU time per page, with and without compression.
+
+Run from the repository root:
+
+    python -m benchmarks.compression_bench [requests_per_page]
+
+Each page is requested ``requests_per_page`` times (default 500) through the
+test client by a browser that accepts no compression, gzip only, and gzip
+and brotli, with compression switched off and on (ETags stay on). Then a
+browser with a copy of the page sends its ETag back: static pages come back
+as an empty 304, quiz pages, which hold a new question, in full. Bytes
+count response headers and bodies; CPU is process time per request.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from app import create_app
+
+PAGES = [
+    ('main', 'GET', '/', None),
+    ('reference_guide', 'GET', '/reference-guide', None),
+    ('classful_quiz', 'GET', '/classful_quiz', None),
+    ('classful_quiz POST', 'POST', '/classful_quiz', {'Address Class': 'A'}),
+    ('subnet_quiz', 'GET', '/subnet-quiz', None),
+    ('decimal_to_binary', 'GET', '/decimal-to-binary', None),
+]
+BROWSERS = [('identity', None), ('gzip', 'gzip, deflate'), ('gzip, br', 'gzip, deflate, br')]
+
+
+def wire_bytes(response):
+    headers = sum(len(name) + len(value) + 4 for name, value in response.headers.items())
+    return headers + len(response.get_data())
+
+
+def bench_page(client, method, url, data, headers, count):
+    sent = 0
+    began = time.process_time()
+    for _ in range(count):
+        if method == 'POST':
+            client.get(url)
+        response = client.open(url, method=method, data=data, headers=headers)
+        sent += wire_bytes(response)
+    return sent / count, (time.process_time() - began) / count
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'page':<20} {'compression':<12} {'accepts':<10} {'bytes':>8} {'CPU us':>8}")
+        for enabled in (False, True):
+            app = create_app({'COMPRESSION_ENABLED': enabled, 'RESULT_BACKEND': 'sqlite',
+                              'RESULT_DB': os.path.join(directory, f'results-{enabled}.db')})
+            client = app.test_client()
+            for name, method, url, data in PAGES:
+                for browser, accept in BROWSERS:
+                    headers = {'Accept-Encoding': accept} if accept else {}
+                    bench_page(client, method, url, data, headers, 20)  # warm up
+                    sent, cpu = bench_page(client, method, url, data, headers, count)
+                    print(f"{name:<20} {'on' if enabled else 'off':<12} {browser:<10} {sent:>8.0f} {cpu * 1e6:>8.0f}")
+                etag = client.get(url).headers.get('ETag')
+                if method == 'GET' and etag:
+                    sent, cpu = bench_page(client, method, url, data, {'If-None-Match': etag}, count)
+                    print(f"{name:<20} {'on' if enabled else 'off':<12} {'revalidate':<10} {sent:>8.0f} {cpu * 1e6:>8.0f}")
+            app.extensions['result_writer'].close()
+            app.extensions['result_store'].close()
@@ -0,0 +1,55 @@
+"""
+Throughput and tail latency of serve.py per worker/thread configuration.
+
+Run from the repository root:
+
+    python -m benchmarks.launcher_bench [--configs 1x1,1x8,2x8,4x8] [--students 500] [--rounds 3]
+
+Each configuration is WORKERSxTHREADS. For every one, serve.py is started
+on a free port with SQLite results and sessions in a temporary directory,
+benchmarks.loadgen plays the quizzes against it with the same students and
+rounds, and one report line is printed. Configurations run one after
+another on the same machine, so compare lines from the same run only.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+
+from benchmarks.loadgen import format_report, run
+from benchmarks.serving_bench import ROOT, free_port, serve, wait_for_port
+
+
+def parse_configs(text):
+    configs = []
+    for item in text.split(","):
+        workers, _, threads = item.partition("x")
+        configs.append((int(workers), int(threads)))
+    return configs
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test serve.py per worker/thread configuration.")
+    parser.add_argument("--configs", default="1x1,1x8,2x8,4x8")
+    parser.add_argument("--students", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--no-preload", action="store_true")
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs, {args.students} students x {args.rounds} rounds")
+    for workers, threads in parse_configs(args.configs):
+        port = free_port()
+        command = [sys.executable, os.path.join(ROOT, "serve.py"), "--bind", f"127.0.0.1:{port}",
+                   "--workers", str(workers), "--threads", str(threads)]
+        if args.no_preload:
+            command.append("--no-preload")
+        with tempfile.TemporaryDirectory() as directory:
+            server = serve(command, directory, threads)
+            try:
+                wait_for_port(port)
+                stats = asyncio.run(run(f"http://127.0.0.1:{port}", args.students, args.rounds))
+                print(format_report(f"{workers} workers x {threads} threads", stats))
+            finally:
+                server.terminate()
+                server.wait(30)
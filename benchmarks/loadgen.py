@@ -0,0 +1,163 @@
+"""
+Standard-library HTTP load generator that plays the quizzes like students.
+
+Run from the repository root against a running server:
+
+    python -m benchmarks.loadgen http://127.0.0.1:8000 --students 1000 --rounds 5
+
+Each simulated student holds one keep-alive connection, keeps its session
+cookie, and plays ``rounds`` rounds of the classful quiz (GET a question,
+POST answers) and the binary-to-decimal quiz (GET, POST a guess). All
+students start together. Reports requests/second and latency percentiles.
+"""
+import argparse
+import asyncio
+import time
+from urllib.parse import urlencode, urlsplit
+
+CLASSFUL_ANSWERS = urlencode({
+    'Address Class': 'B', 'Leading Bit Pattern': '10', 'Native Address Map': 'N.N.H.H',
+    'Subnet Mask (SNM)': '255.255.255.0', 'Wildcard Mask (WCM)': '0.0.0.255'}).encode()
+BINARY_GUESS = urlencode({'user_guess': '42'}).encode()
+
+
+class Connection:
+    """
+    Minimal HTTP/1.1 keep-alive client connection with a cookie jar.
+    """
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self.reader = self.writer = None
+        self.cookies = {}
+
+    async def request(self, method, path, body=b""):
+        """
+        Send a request and read the whole response.
+
+        Returns:
+            tuple: (status code, body bytes).
+        """
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host}:{self.port}", "Accept-Encoding: identity"]
+        if self.cookies:
+            lines.append("Cookie: " + "; ".join(f"{name}={value}" for name, value in self.cookies.items()))
+        if body:
+            lines.append("Content-Type: application/x-www-form-urlencoded")
+        lines.append(f"Content-Length: {len(body)}")
+        self.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionError("server closed the connection")
+        status = int(status_line.split()[1])
+        headers = {}
+        while True:
+            line = (await self.reader.readline()).decode("latin-1").rstrip("\r\n")
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            name, value = name.strip().lower(), value.strip()
+            if name == "set-cookie":
+                cookie_name, _, cookie_value = value.split(";", 1)[0].partition("=")
+                self.cookies[cookie_name] = cookie_value
+            headers[name] = value
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await self.reader.readline()
+                    break
+                chunks.append(await self.reader.readexactly(size))
+                await self.reader.readline()
+            content = b"".join(chunks)
+        else:
+            content = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        return status, content
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            self.reader = self.writer = None
+
+
+async def student(host, port, rounds, start, latencies, errors):
+    connection = Connection(host, port)
+    await start.wait()
+    steps = [("GET", "/classful_quiz", b""), ("POST", "/classful_quiz", CLASSFUL_ANSWERS),
+             ("GET", "/binary-to-decimal", b""), ("POST", "/binary-to-decimal", BINARY_GUESS)]
+    try:
+        for _ in range(rounds):
+            for method, path, body in steps:
+                began = time.perf_counter()
+                try:
+                    status, _ = await connection.request(method, path, body)
+                except (OSError, asyncio.IncompleteReadError, ValueError, IndexError):
+                    connection.close()
+                    errors.append(path)
+                    continue
+                latencies.append(time.perf_counter() - began)
+                if status != 200:
+                    errors.append(status)
+    finally:
+        connection.close()
+
+
+async def run(url, students, rounds):
+    """
+    Run a load test.
+
+    Args:
+        url (str): Base URL of the server, e.g. http://127.0.0.1:8000.
+        students (int): Number of concurrent simulated students.
+        rounds (int): Quiz rounds each student plays.
+
+    Returns:
+        dict: requests, errors, seconds, rps, and p50/p90/p99/max latency in ms.
+    """
+    parts = urlsplit(url)
+    latencies, errors = [], []
+    start = asyncio.Event()
+    tasks = [asyncio.create_task(student(parts.hostname, parts.port or 80, rounds, start, latencies, errors))
+             for _ in range(students)]
+    await asyncio.sleep(0)
+    began = time.perf_counter()
+    start.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - began
+    latencies.sort()
+
+    def percentile(fraction):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000 if latencies else 0.0
+
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "seconds": elapsed,
+        "rps": len(latencies) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(0.50),
+        "p90_ms": percentile(0.90),
+        "p99_ms": percentile(0.99),
+        "max_ms": latencies[-1] * 1000 if latencies else 0.0,
+    }
+
+
+def format_report(label, stats):
+    return (f"{label:<24} {stats['rps']:>9.0f} req/s  p50 {stats['p50_ms']:>8.1f} ms  "
+            f"p99 {stats['p99_ms']:>8.1f} ms  max {stats['max_ms']:>8.1f} ms  "
+            f"({stats['requests']} requests, {stats['errors']} errors)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate students playing the quizzes.")
+    parser.add_argument("url")
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    print(format_report(args.url, asyncio.run(run(args.url, args.students, args.rounds))))
@@ -0,0 +1,71 @@
+"""
+Cost of the built-in metrics.
+
+Run from the repository root:
+
+    python -m benchmarks.metrics_bench [requests]
+
+Times the recording primitives on their own, then serves ``requests``
+(default 2,000) quiz rounds of each quiz through the test client with
+METRICS_ENABLED on and off. Exits non-zero if instrumentation adds more
+than MAX_OVERHEAD_US microseconds to a request.
+"""
+import os
+import sys
+import tempfile
+import time
+import timeit
+
+from metrics import Metrics
+
+MAX_OVERHEAD_US = 100
+
+ROUTES = ['/decimal-to-binary', '/binary-to-decimal', '/subnet-quiz', '/classful_quiz']
+
+
+def bench_primitives():
+    metrics = Metrics()
+    metrics.histogram('phase_seconds', 'Phases.', ('route', 'phase'))
+    metrics.counter('attempts_total', 'Attempts.', ('quiz',))
+    labels = ('classful_quiz', 'render')
+
+    def timed_block():
+        with metrics.timer('phase_seconds', labels):
+            pass
+
+    for label, function in [("counter inc", lambda: metrics.inc('attempts_total', ('classful_quiz',))),
+                            ("histogram observe", lambda: metrics.observe('phase_seconds', labels, 0.001)),
+                            ("timed block", timed_block)]:
+        seconds = min(timeit.repeat(function, number=100_000, repeat=3)) / 100_000
+        print(f"{label:<20} {seconds * 1e6:>6.2f} us")
+
+
+def bench_requests(directory, count, enabled):
+    from app import create_app
+
+    app = create_app({'METRICS_ENABLED': enabled, 'RESULT_BACKEND': 'sqlite',
+                      'RESULT_DB': os.path.join(directory, f'results-{enabled}.db')})
+    client = app.test_client()
+    began = time.perf_counter()
+    for index in range(count):
+        route = ROUTES[index % len(ROUTES)]
+        client.get(route)
+        client.post(route, data={'user_guess': '0'})
+    elapsed = time.perf_counter() - began
+    app.extensions['result_writer'].close()
+    app.extensions['result_store'].close()
+    return elapsed / (count * 2)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    bench_primitives()
+    with tempfile.TemporaryDirectory() as directory:
+        bench_requests(directory, 200, True)  # warm up templates and caches
+        off = bench_requests(directory, count, False)
+        on = bench_requests(directory, count, True)
+    overhead = (on - off) * 1e6
+    print(f"per request: {off * 1e6:.0f} us without metrics, {on * 1e6:.0f} us with, overhead {overhead:.1f} us")
+    if overhead > MAX_OVERHEAD_US:
+        print(f"over the {MAX_OVERHEAD_US} us budget")
+        sys.exit(1)
@@ -0,0 +1,86 @@
+"""
+Per-call cost of the prefix-length answers, before and after PREFIX_TABLE.
+
+Run from the repository root:
+
+    python -m benchmarks.prefix_table_bench
+
+The "before" column runs the original string-building implementations,
+kept here for comparison; "after" calls the functions in wildcard_mask,
+which serve from the table built at import.
+"""
+import ipaddress
+import timeit
+
+import wildcard_mask
+from classaddress import calculate_classful_analysis
+
+
+def legacy_subnet_address_map(ip, prefix_length):
+    sam_octets = []
+    for i in range(0, 32, 8):
+        network_bits = max(0, min(8, prefix_length - i))
+        host_bits = 8 - network_bits
+        if network_bits == 8:
+            sam_octets.append('N')
+        elif host_bits == 8:
+            sam_octets.append('H')
+        elif host_bits > network_bits:
+            sam_octets.append('H')
+        else:
+            sam_octets.append('S')
+    return '.'.join(sam_octets)
+
+
+def legacy_subnet_mask(prefix_length):
+    mask = (0xFFFFFFFF >> (32 - prefix_length)) << (32 - prefix_length)
+    octets = [(mask >> (24 - i * 8)) & 0xFF for i in range(4)]
+    return '.'.join(str(octet) for octet in octets)
+
+
+def legacy_wildcard_mask(prefix_length):
+    subnet_mask = legacy_subnet_mask(prefix_length)
+    return '.'.join(str(255 - int(octet)) for octet in subnet_mask.split('.'))
+
+
+def legacy_network_bits(prefix_length):
+    return str(prefix_length)
+
+
+def legacy_host_bits(prefix_length):
+    return str(32 - prefix_length)
+
+
+def legacy_classful_masks(ip, cidr_prefix):
+    # Only the ip_network part of the old calculate_classful_analysis
+    network = ipaddress.ip_network(f"{ip}/{cidr_prefix}", strict=False)
+    return str(network.netmask), str(network.hostmask)
+
+
+ALL_PREFIXES = range(33)
+CLASS_A_PREFIXES = range(9, 31)
+
+CASES = [
+    ("prefix_length_to_subnet_mask", ALL_PREFIXES, legacy_subnet_mask, wildcard_mask.prefix_length_to_subnet_mask),
+    ("calculate_wildcard_mask", ALL_PREFIXES, legacy_wildcard_mask, wildcard_mask.calculate_wildcard_mask),
+    ("calculate_subnet_address_map", ALL_PREFIXES, lambda p: legacy_subnet_address_map("10.1.2.3", p),
+     lambda p: wildcard_mask.calculate_subnet_address_map("10.1.2.3", p)),
+    ("prefix_network_bits", ALL_PREFIXES, legacy_network_bits, wildcard_mask.prefix_network_bits),
+    ("prefix_host_bits", ALL_PREFIXES, legacy_host_bits, wildcard_mask.prefix_host_bits),
+    ("classful analysis", CLASS_A_PREFIXES, lambda p: legacy_classful_masks("10.1.2.3", p),
+     lambda p: calculate_classful_analysis("10.1.2.3", 8, p)),
+]
+
+
+def per_call(function, prefixes, number=20000):
+    loops = number // len(prefixes)
+    timer = timeit.Timer(lambda: [function(p) for p in prefixes])
+    best = min(timer.repeat(repeat=5, number=loops))
+    return best / (loops * len(prefixes)) * 1e9
+
+
+if __name__ == "__main__":
+    print(f"{'function':<30} {'before ns':>10} {'after ns':>10} {'speedup':>8}")
+    for name, prefixes, before, after in CASES:
+        before_ns, after_ns = per_call(before, prefixes), per_call(after, prefixes)
+        print(f"{name:<30} {before_ns:>10.0f} {after_ns:>10.0f} {before_ns / after_ns:>7.1f}x")
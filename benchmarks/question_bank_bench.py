@@ -0,0 +1,70 @@
+"""
+Subnet quiz question generation: reparsing questions.csv vs. QuestionBank.
+
+Run from the repository root:
+
+    python -m benchmarks.question_bank_bench [templates] [questions]
+
+Builds a bank of ``templates`` question templates (default 10,000) from
+the six in questions.csv, then times generating ``questions`` questions
+with the original load-and-match code (kept here for comparison) and with
+generate_question_from_csv, which uses the cached, compiled bank.
+"""
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+from wildcard_mask import (calculate_wildcard_mask, generate_question_from_csv, get_address_class_and_pattern,
+                           load_questions_from_csv, prefix_host_bits, prefix_length_to_subnet_mask,
+                           prefix_network_bits, subList)
+
+
+def legacy_generate_question_from_csv(filename):
+    questions = load_questions_from_csv(filename)
+    ip, prefix_length = random.choice(subList)
+    selected_question = random.choice(questions)
+    sub_func = prefix_length_to_subnet_mask(prefix_length)
+    question_with_subnet = selected_question["question"].replace("{ip}", ip).replace(
+        "{prefix_length}", str(prefix_length)).replace("{subnet_mask}", sub_func)
+    if "Address Class" in question_with_subnet:
+        correct_answer = f"{get_address_class_and_pattern(ip)[0]} / {get_address_class_and_pattern(ip)[1]}"
+    elif "the prefix length" in question_with_subnet:
+        correct_answer = str(prefix_length)
+    elif "wildcard mask" in question_with_subnet:
+        correct_answer = calculate_wildcard_mask(prefix_length)
+    elif "the subnet mask" in question_with_subnet:
+        correct_answer = prefix_length_to_subnet_mask(prefix_length)
+    elif "network bits" in question_with_subnet:
+        correct_answer = prefix_network_bits(prefix_length)
+    elif "host bits" in question_with_subnet:
+        correct_answer = prefix_host_bits(prefix_length)
+    else:
+        correct_answer = "Unknown"
+    return {"question": question_with_subnet, "answer": correct_answer}
+
+
+def timed(label, count, function, filename):
+    began = time.perf_counter()
+    for _ in range(count):
+        function(filename)
+    elapsed = time.perf_counter() - began
+    print(f"{label:<8} {elapsed / count * 1e6:>10.1f} us/question")
+    return elapsed
+
+
+if __name__ == "__main__":
+    templates = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    questions = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000
+    base = [question["question"].lstrip("﻿") for question in load_questions_from_csv("questions.csv")]
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "bank.csv")
+        with open(filename, "w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            for i in range(templates):
+                writer.writerow([f"(Q{i}) {base[i % len(base)]}"])
+        before = timed("before", questions, legacy_generate_question_from_csv, filename)
+        after = timed("after", questions, generate_question_from_csv, filename)
+        print(f"{templates} templates: {before / after:.0f}x faster")
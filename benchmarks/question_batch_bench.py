@@ -0,0 +1,48 @@
+"""
+Questions per second: one-at-a-time generation vs. the NumPy batch API.
+
+Run from the repository root:
+
+    python -m benchmarks.question_batch_bench [count]
+
+Times generating ``count`` questions with answers (default 10**6) both
+ways, then streaming the batch to CSV and JSON Lines in a temporary file.
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from classaddress import calculate_classful_analysis, generate_random_classful_address
+from question_batch import generate_batch, write_csv, write_jsonl
+
+
+def timed(label, count, function):
+    began = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - began
+    print(f"{label:<28} {elapsed:>7.2f} s  {count / elapsed:>12,.0f} questions/s")
+
+
+def scalar(count):
+    for _ in range(count):
+        ip, default_mask, cidr_prefix = generate_random_classful_address()
+        calculate_classful_analysis(ip, default_mask, cidr_prefix)
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    rng = np.random.default_rng(0)
+    timed("scalar generate + analyze", count, lambda: scalar(count))
+    timed("batch generate", count, lambda: generate_batch(count, rng))
+    batch = generate_batch(count, rng)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "questions")
+        with open(path + ".csv", "w", newline="", encoding="utf-8") as file:
+            timed("batch export csv", count, lambda: write_csv(batch, file))
+        with open(path + ".jsonl", "w", encoding="utf-8") as file:
+            timed("batch export jsonl", count, lambda: write_jsonl(batch, file))
+        print(f"csv {os.path.getsize(path + '.csv') / 1e6:.0f} MB, "
+              f"jsonl {os.path.getsize(path + '.jsonl') / 1e6:.0f} MB")
@@ -0,0 +1,84 @@
+"""
+GET latency of the subnet and classful quizzes, with and without the
+question pool.
+
+Run from the repository root:
+
+    python -m benchmarks.question_pool_bench [--requests 3000] [--size 64] [--low-water 16]
+
+Each quiz page is loaded ``--requests`` times through the test client, one
+after another, with QUESTION_POOL_SIZE 0 and with the given pool size. A
+learner with mistakes on /20, /26 and /28 is included, so the adaptive
+per-prefix pools are exercised too. p50 and p99 are of whole requests;
+"generate" is the mean time of the generate phase, from the app's metrics.
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from adaptive import LearnerProfile
+from app import create_app
+
+ROUTES = [('subnet_quiz_route', '/subnet-quiz'), ('classful_quiz', '/classful_quiz')]
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def struggling_learner():
+    profile = LearnerProfile()
+    for prefix_length in (20, 26, 28):
+        profile.record_prefix(prefix_length, 1, 3)
+    return profile.to_dict()
+
+
+def bench(directory, size, low_water, requests, learner):
+    app = create_app({'QUESTION_POOL_SIZE': size, 'QUESTION_POOL_LOW_WATER': low_water,
+                      'RESULT_BACKEND': 'sqlite',
+                      'RESULT_DB': os.path.join(directory, f'results-{size}-{learner is not None}.db')})
+    client = app.test_client()
+    if learner is not None:
+        with client.session_transaction() as session:
+            session['learner'] = learner
+    for _, url in ROUTES:  # warm up templates, and the pools' threads
+        for _ in range(50):
+            client.get(url)
+    time.sleep(0.1)
+    metrics = app.extensions['metrics']
+    results = []
+    for route, url in ROUTES:
+        count, total = metrics.value('netquizzer_phase_seconds', (route, 'generate'))
+        latencies = []
+        for _ in range(requests):
+            began = time.perf_counter()
+            client.get(url)
+            latencies.append(time.perf_counter() - began)
+        after_count, after_total = metrics.value('netquizzer_phase_seconds', (route, 'generate'))
+        latencies.sort()
+        results.append((url, percentile(latencies, 0.5), percentile(latencies, 0.99),
+                        (after_total - total) / (after_count - count)))
+    pools = app.extensions['question_pools']
+    if pools is not None:
+        for pool in pools.values():
+            pool.close()
+    app.extensions['result_writer'].close()
+    app.extensions['result_store'].close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark quiz GET latency with the question pool.")
+    parser.add_argument("--requests", type=int, default=3000)
+    parser.add_argument("--size", type=int, default=64)
+    parser.add_argument("--low-water", type=int, default=16)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        print(f"{'learner':<10} {'pool':<6} {'route':<16} {'p50 us':>8} {'p99 us':>8} {'generate us':>12}")
+        for learner in (None, struggling_learner()):
+            for size in (0, args.size):
+                for url, p50, p99, generate in bench(directory, size, args.low_water, args.requests, learner):
+                    print(f"{'new' if learner is None else 'weak':<10} {size or 'off':<6} {url:<16} "
+                          f"{p50 * 1e6:>8.0f} {p99 * 1e6:>8.0f} {generate * 1e6:>12.1f}")
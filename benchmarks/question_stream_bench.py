@@ -0,0 +1,63 @@
+"""
+Cost of seeded question streams.
+
+Run from the repository root:
+
+    python -m benchmarks.question_stream_bench [--questions 20000] [--processes 4]
+
+Prints the time to draw one classful question with the global random
+module and from a QuestionStream, the time to get question k for growing k
+(constant: nothing before k is generated), and generates an exam of
+``--questions`` questions in one process and split across ``--processes``
+worker processes, checking that both give the same exam. The split only
+runs faster with as many free cores as processes.
+"""
+import argparse
+import time
+import timeit
+from concurrent.futures import ProcessPoolExecutor
+
+from classaddress import generate_random_classful_address
+from question_stream import QuestionStream
+
+SEED = "benchmark"
+QUIZ = "classful_quiz"
+
+
+def exam_part(bounds):
+    start, stop = bounds
+    stream = QuestionStream(SEED)
+    return [generate_random_classful_address(stream.rng(QUIZ, index)) for index in range(start, stop)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark seeded question streams.")
+    parser.add_argument("--questions", type=int, default=20000)
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+
+    stream = QuestionStream(SEED)
+    number = 20000
+    unseeded = min(timeit.repeat(generate_random_classful_address, number=number, repeat=3)) / number
+    counter = iter(range(10 ** 9))
+    seeded = min(timeit.repeat(lambda: generate_random_classful_address(stream.rng(QUIZ, next(counter))),
+                               number=number, repeat=3)) / number
+    print(f"per question: {unseeded * 1e6:.1f} us with random, {seeded * 1e6:.1f} us from a stream")
+
+    for index in (0, 10 ** 3, 10 ** 6, 10 ** 12):
+        seconds = min(timeit.repeat(lambda: generate_random_classful_address(stream.rng(QUIZ, index)),
+                                    number=1000, repeat=3)) / 1000
+        print(f"question {index:>14,}: {seconds * 1e6:.1f} us")
+
+    began = time.perf_counter()
+    sequential = exam_part((0, args.questions))
+    one = time.perf_counter() - began
+    step = -(-args.questions // args.processes)
+    parts = [(start, min(start + step, args.questions)) for start in range(0, args.questions, step)]
+    with ProcessPoolExecutor(args.processes) as executor:
+        executor.submit(exam_part, (0, 1)).result()  # start the workers
+        began = time.perf_counter()
+        parallel = [question for part in executor.map(exam_part, parts) for question in part]
+        many = time.perf_counter() - began
+    print(f"{args.questions} questions: {one:.2f} s in 1 process, {many:.2f} s in {args.processes}, "
+          f"identical: {parallel == sequential}")
@@ -0,0 +1,108 @@
+"""
+Rendering time and response bytes per quiz route, with and without the
+template caches.
+
+Run from the repository root:
+
+    python -m benchmarks.render_bench [requests_per_route]
+
+Each route is requested through the test client in three setups:
+
+    uncached   fragment cache off, full page on every response
+    fragments  head, header and bit table rendered once and reused
+    partial    fragments, and POSTs ask for the content block only
+
+and the mean time per request and mean response size are printed. The cost
+of loading every template in a new process is measured with an empty and a
+warm bytecode cache.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+
+from app import create_app
+from template_cache import PARTIAL_HEADER
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CLASSFUL_GUESS = {'Address Class': 'A', 'Leading Bit Pattern': '0', 'Native Address Map': 'N.H.H.H',
+                  'Subnet Mask (SNM)': '255.0.0.0', 'Wildcard Mask (WCM)': '0.255.255.255'}
+SUBNET_GUESS = {'Subnet Address Map': 'N.H.H.H', 'Subnet Mask': '255.0.0.0', 'Wildcard Mask': '0.255.255.255'}
+REQUESTS = [
+    ('GET', '/decimal-to-binary', None),
+    ('POST', '/decimal-to-binary', {'user_guess': '00000000'}),
+    ('GET', '/binary-to-decimal', None),
+    ('POST', '/binary-to-decimal', {'user_guess': '999'}),
+    ('GET', '/subnet-quiz', None),
+    ('POST', '/subnet-quiz', SUBNET_GUESS),
+    ('GET', '/classful_quiz', None),
+    ('POST', '/classful_quiz', CLASSFUL_GUESS),
+]
+SETUPS = [
+    ('uncached', {'TEMPLATE_FRAGMENT_CACHE': False}, False),
+    ('fragments', {}, False),
+    ('partial', {}, True),
+]
+
+
+def bench_routes(config, partial, count):
+    """
+    Returns:
+        dict: (method, path) -> (mean seconds per request, mean bytes).
+    """
+    app = create_app(config)
+    client = app.test_client()
+    headers = {PARTIAL_HEADER: '1'} if partial else {}
+    results = {}
+    for method, path, data in REQUESTS:
+        # a POST answers the question of the GET before it
+        client.get(path)
+        elapsed = size = 0
+        for _ in range(count):
+            if method == 'POST':
+                client.get(path)
+            began = time.perf_counter()
+            response = client.open(path, method=method, data=data, headers=headers)
+            elapsed += time.perf_counter() - began
+            size += len(response.data)
+        results[method, path] = (elapsed / count, size / count)
+    app.extensions['result_writer'].close()
+    return results
+
+
+def bench_template_load(cache_dir):
+    """
+    Returns:
+        float: Seconds to load every template in a new environment.
+    """
+    environment = Environment(loader=FileSystemLoader(os.path.join(ROOT, 'templates')),
+                              bytecode_cache=FileSystemBytecodeCache(cache_dir) if cache_dir else None)
+    began = time.perf_counter()
+    for name in environment.list_templates():
+        environment.get_template(name)
+    return time.perf_counter() - began
+
+
+if __name__ == '__main__':
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.TemporaryDirectory() as directory:
+        base = {'RESULT_BACKEND': 'sqlite', 'RESULT_DB': os.path.join(directory, 'results.db'),
+                'SESSION_BACKEND': 'memory'}
+        runs = {name: bench_routes(dict(base, **config), partial, count) for name, config, partial in SETUPS}
+
+        print(f"{'route':<26}" + "".join(f"{name:>22}" for name, _, _ in SETUPS))
+        for method, path, _ in REQUESTS:
+            cells = "".join(f"{runs[name][method, path][0] * 1e6:>11.0f} us {runs[name][method, path][1]:>6.0f} B"
+                            for name, _, _ in SETUPS)
+            print(f"{method + ' ' + path:<26}{cells}")
+
+        cache_dir = os.path.join(directory, 'bytecode')
+        os.mkdir(cache_dir)
+        no_cache = bench_template_load(None)
+        bench_template_load(cache_dir)
+        warm = bench_template_load(cache_dir)
+        print(f"\nload all templates: no bytecode cache {no_cache * 1000:.1f} ms, "
+              f"warm bytecode cache {warm * 1000:.1f} ms")
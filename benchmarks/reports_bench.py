@@ -0,0 +1,49 @@
+"""
+Report cost over a growing subnet quiz log: full scan vs. incremental update.
+
+Run from the repository root:
+
+    python -m benchmarks.reports_bench [total_rows]
+
+Rows are appended in ten steps. After each step the full scan rereads the
+whole log while the incremental run starts from the saved state, so its
+time should track the rows added, not the rows in the log. Peak memory
+(ru_maxrss) should not grow with the log either.
+"""
+import os
+import resource
+import sys
+import tempfile
+import time
+
+from reports import update_report
+from result_log import ResultLog
+
+COLUMNS = ['IP Address', 'Prefix Length', 'Subnet Mask', 'Wildcard Mask', 'User Answers', 'Correct Answers',
+           'Score']
+
+
+def bench_reports(directory, total, window):
+    filename = os.path.join(directory, "subnet_quiz_results.csv")
+    log = ResultLog(filename, COLUMNS, max_bytes=64 * 1024 * 1024)
+    state = None
+    print(f"{'rows logged':>12} {'full scan s':>12} {'incremental s':>14} {'peak RSS MB':>12}")
+    for start in range(0, total, window):
+        log.extend([f'10.{index % 256}.0.1', 8 + index % 23, '255.255.0.0', '0.0.255.255', '{}', '{}',
+                    f'{index % 6}/5'] for index in range(start, start + window))
+        began = time.perf_counter()
+        update_report(filename)
+        full = time.perf_counter() - began
+        began = time.perf_counter()
+        state = update_report(filename, state)
+        incremental = time.perf_counter() - began
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"{start + window:>12} {full:>12.3f} {incremental:>14.3f} {peak:>12.1f}")
+    log.close()
+    assert state["attempts"] == total
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        bench_reports(directory, total, window=max(1, total // 10))
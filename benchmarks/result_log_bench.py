@@ -0,0 +1,57 @@
+"""
+Per-attempt logging cost: append-only ResultLog vs. the old DataFrame rewrite.
+
+Run from the repository root:
+
+    python -m benchmarks.result_log_bench [total_rows]
+
+The ResultLog column reports the mean latency of each window of appended
+rows; it should stay flat up to the full 1M rows. The DataFrame rewrite
+is only run for the first few thousand rows because it grows with history.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from result_log import ResultLog
+
+COLUMNS = ['Random Binary', 'Correct Decimal', 'User Guess', 'Result']
+ROW = ['01011111', 95, '01011110', 'Good Effort! Please try again.']
+
+
+def bench_result_log(directory, total, window):
+    log = ResultLog(os.path.join(directory, "results.csv"), COLUMNS, max_bytes=64 * 1024 * 1024)
+    print(f"{'rows logged':>12} {'ResultLog us/append':>20}")
+    for start in range(0, total, window):
+        began = time.perf_counter()
+        for _ in range(window):
+            log.append(ROW)
+        elapsed = time.perf_counter() - began
+        print(f"{start + window:>12} {elapsed / window * 1e6:>20.2f}")
+    log.close()
+
+
+def bench_dataframe(directory, total, window):
+    try:
+        import pandas as pd
+    except ImportError:
+        print("pandas not installed, skipping DataFrame baseline")
+        return
+    filename = os.path.join(directory, "legacy.csv")
+    frame = pd.DataFrame(columns=COLUMNS)
+    print(f"{'rows logged':>12} {'DataFrame us/append':>20}")
+    for start in range(0, total, window):
+        began = time.perf_counter()
+        for _ in range(window):
+            frame.loc[len(frame)] = ROW
+            frame.to_csv(filename, index=False)
+        elapsed = time.perf_counter() - began
+        print(f"{start + window:>12} {elapsed / window * 1e6:>20.2f}")
+
+
+if __name__ == "__main__":
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as directory:
+        bench_result_log(directory, total, window=max(1, total // 10))
+        bench_dataframe(directory, 4000, window=500)
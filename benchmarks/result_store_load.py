@@ -0,0 +1,66 @@
+"""
+Lost-row check for the SQLite result backend under many workers.
+
+Run from the repository root:
+
+    python -m benchmarks.result_store_load [workers] [clients] [submissions]
+
+Starts ``workers`` processes, each importing the app with the sqlite
+backend, and runs ``clients`` threads per process that each submit
+``submissions`` binary-to-decimal answers through the real route. Once every
+worker has shut down cleanly the database must hold exactly one row per
+submission.
+"""
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+
+
+def worker(directory, clients, submissions):
+    os.chdir(directory)
+    os.environ["FLASK_RESULT_BACKEND"] = "sqlite"
+    os.environ["FLASK_RESULT_DB"] = os.path.join(directory, "load.db")
+    from app import app, result_writer
+
+    def client():
+        test_client = app.test_client()
+        test_client.get("/binary-to-decimal")
+        for i in range(submissions):
+            test_client.post("/binary-to-decimal", data={"user_guess": str(i % 256)})
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result_writer.close()
+    stats = result_writer.stats()
+    if stats["dropped"] or stats["errors"]:
+        raise SystemExit(f"writer lost rows: {stats}")
+
+
+if __name__ == "__main__":
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    clients = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    submissions = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    with tempfile.TemporaryDirectory() as directory:
+        context = multiprocessing.get_context("spawn")
+        began = time.perf_counter()
+        processes = [context.Process(target=worker, args=(directory, clients, submissions)) for _ in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - began
+
+        from result_store import SQLiteResultStore
+        expected = workers * clients * submissions
+        stored = SQLiteResultStore(os.path.join(directory, "load.db")).count("binary_to_decimal")
+        print(f"{workers} workers x {clients} clients x {submissions} submissions in {elapsed:.1f}s")
+        print(f"expected {expected} rows, stored {stored}, lost {expected - stored}")
+        failed = [process.exitcode for process in processes if process.exitcode]
+        if failed or stored != expected:
+            raise SystemExit(1)
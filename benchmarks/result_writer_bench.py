@@ -0,0 +1,69 @@
+"""
+Request-side cost of logging a result during a classroom burst.
+
+Run from the repository root:
+
+    python -m benchmarks.result_writer_bench [students] [attempts_each]
+
+Each simulated student is a thread that logs its attempts as fast as it
+can. The same burst is run once with synchronous ResultLog appends and once
+through a BatchWriter, with fsync after every write so disk cost is visible.
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from result_log import ResultLog, FSYNC_ALWAYS
+from result_writer import BatchWriter, QueuedLog
+
+COLUMNS = ['IP Address', 'CIDR Prefix', 'Score']
+ROW = ['192.168.1.0', 28, '4/5']
+
+
+def burst(log, students, attempts):
+    latencies = []
+    lock = threading.Lock()
+    start = threading.Barrier(students)
+
+    def student():
+        mine = []
+        start.wait()
+        for _ in range(attempts):
+            began = time.perf_counter()
+            log.append(ROW)
+            mine.append(time.perf_counter() - began)
+        with lock:
+            latencies.extend(mine)
+
+    threads = [threading.Thread(target=student) for _ in range(students)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    latencies.sort()
+    return latencies
+
+
+def report(name, latencies):
+    p50 = latencies[len(latencies) // 2] * 1e6
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+    print(f"{name:<12} p50 {p50:>10.1f} us   p99 {p99:>10.1f} us   max {latencies[-1] * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    students = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    attempts = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    with tempfile.TemporaryDirectory() as directory:
+        sync_log = ResultLog(os.path.join(directory, "sync.csv"), COLUMNS, fsync=FSYNC_ALWAYS)
+        report("synchronous", burst(sync_log, students, attempts))
+        sync_log.close()
+
+        writer = BatchWriter()
+        queued_log = QueuedLog(ResultLog(os.path.join(directory, "queued.csv"), COLUMNS, fsync=FSYNC_ALWAYS), writer)
+        latencies = burst(queued_log, students, attempts)
+        queued_log.close()
+        report("batched", latencies)
+        print("writer stats:", writer.stats())
+        writer.close()
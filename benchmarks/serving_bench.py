@@ -0,0 +1,95 @@
+"""
+WSGI vs. ASGI serving under a classroom of simulated students.
+
+Run from the repository root (needs gunicorn and uvicorn installed):
+
+    python -m benchmarks.serving_bench [--students 1000] [--rounds 3] [--workers 2]
+
+Starts the app under gunicorn (WSGI, threaded workers) and under uvicorn
+(ASGI, asgi:application), each with the same number of worker processes and
+request threads, plays the quizzes against each with benchmarks.loadgen,
+and prints requests/second and tail latency side by side. Results and
+sessions go to SQLite files in a temporary directory so every worker
+shares them.
+"""
+import argparse
+import asyncio
+import importlib.util
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.loadgen import format_report, run
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"server did not start on port {port}")
+
+
+def serve(command, directory, threads):
+    env = dict(os.environ,
+               PYTHONPATH=ROOT,
+               FLASK_RESULT_BACKEND="sqlite",
+               FLASK_RESULT_DB=os.path.join(directory, "results.db"),
+               FLASK_SESSION_BACKEND="sqlite",
+               FLASK_SESSION_DB=os.path.join(directory, "sessions.db"),
+               FLASK_ASGI_THREADS=str(threads))
+    return subprocess.Popen(command, cwd=directory, env=env,
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def commands(port, workers, threads):
+    bind = f"127.0.0.1:{port}"
+    return {
+        "wsgi (gunicorn gthread)": (
+            "gunicorn",
+            [sys.executable, "-m", "gunicorn", "app:app", "-b", bind, "-w", str(workers),
+             "-k", "gthread", "--threads", str(threads), "--backlog", "4096"]),
+        "asgi (uvicorn)": (
+            "uvicorn",
+            [sys.executable, "-m", "uvicorn", "asgi:application", "--host", "127.0.0.1",
+             "--port", str(port), "--workers", str(workers), "--backlog", "4096",
+             "--no-access-log"]),
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare WSGI and ASGI serving modes.")
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--threads", type=int, default=32)
+    args = parser.parse_args()
+
+    port = free_port()
+    for label, (module, command) in commands(port, args.workers, args.threads).items():
+        if importlib.util.find_spec(module) is None:
+            print(f"{label:<24} skipped: {module} is not installed")
+            continue
+        with tempfile.TemporaryDirectory() as directory:
+            server = serve(command, directory, args.threads)
+            try:
+                wait_for_port(port)
+                stats = asyncio.run(run(f"http://127.0.0.1:{port}", args.students, args.rounds))
+                print(format_report(label, stats))
+            finally:
+                server.terminate()
+                server.wait(30)
@@ -0,0 +1,92 @@
+"""
+Session size and overhead: signed cookie sessions vs. server-side sessions.
+
+Run from the repository root:
+
+    python -m benchmarks.session_bench [rounds]
+
+Plays every quiz through the test client with each session backend and
+reports the cookie bytes the browser sends back per request, Set-Cookie
+bytes per response, and mean time per request. The cost of signing and
+verifying the cookie session (HMAC + serialization) is measured on its own.
+"""
+import os
+import sys
+import tempfile
+import time
+
+from flask.sessions import SecureCookieSessionInterface
+
+from app import app, result_writer
+from session_store import MemorySessionStore, SQLiteSessionStore, ServerSideSessionInterface
+
+CLASSFUL_GUESS = {'Address Class': 'A', 'Leading Bit Pattern': '0', 'Native Address Map': 'N.H.H.H',
+                  'Subnet Mask (SNM)': '255.0.0.0', 'Wildcard Mask (WCM)': '0.255.255.255'}
+SUBNET_GUESS = {'Subnet Address Map': 'N.H.H.H', 'Subnet Mask': '255.0.0.0', 'Wildcard Mask': '0.255.255.255'}
+
+
+def play_round(client):
+    """
+    One pass through every quiz: a question plus wrong answers.
+
+    Yields:
+        Response: Each response in turn.
+    """
+    yield client.get('/decimal-to-binary')
+    for _ in range(3):
+        yield client.post('/decimal-to-binary', data={'user_guess': '00000000'})
+    yield client.get('/binary-to-decimal')
+    for _ in range(3):
+        yield client.post('/binary-to-decimal', data={'user_guess': '999'})
+    yield client.get('/subnet-quiz')
+    yield client.post('/subnet-quiz', data=SUBNET_GUESS)
+    yield client.get('/classful_quiz')
+    yield client.post('/classful_quiz', data=CLASSFUL_GUESS)
+
+
+def bench(name, interface, rounds):
+    app.session_interface = interface
+    client = app.test_client()
+    cookie_bytes = set_cookie_bytes = requests = 0
+    began = time.perf_counter()
+    for _ in range(rounds):
+        for response in play_round(client):
+            requests += 1
+            cookie = client.get_cookie(app.config['SESSION_COOKIE_NAME'])
+            cookie_bytes += len(cookie.value) if cookie else 0
+            set_cookie_bytes += sum(len(value) for value in response.headers.getlist('Set-Cookie'))
+    elapsed = time.perf_counter() - began
+    print(f"{name:<8} cookie {cookie_bytes / requests:>7.0f} B/request   "
+          f"set-cookie {set_cookie_bytes / requests:>7.0f} B/response   "
+          f"{elapsed / requests * 1e6:>8.0f} us/request")
+
+
+def bench_signing(iterations=20000):
+    serializer = SecureCookieSessionInterface().get_signing_serializer(app)
+    client = app.test_client()
+    app.session_interface = SecureCookieSessionInterface()
+    for _ in play_round(client):
+        pass
+    with client.session_transaction() as session:
+        data = dict(session)
+    began = time.perf_counter()
+    for _ in range(iterations):
+        token = serializer.dumps(data)
+    signed = time.perf_counter() - began
+    began = time.perf_counter()
+    for _ in range(iterations):
+        serializer.loads(token)
+    verified = time.perf_counter() - began
+    print(f"cookie session of {len(token)} B: sign {signed / iterations * 1e6:.1f} us, "
+          f"verify {verified / iterations * 1e6:.1f} us per request")
+
+
+if __name__ == "__main__":
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)  # keep result logs out of the repository
+        bench("cookie", SecureCookieSessionInterface(), rounds)
+        bench("memory", ServerSideSessionInterface(MemorySessionStore()), rounds)
+        bench("sqlite", ServerSideSessionInterface(SQLiteSessionStore(os.path.join(directory, 'sessions.db'))), rounds)
+        bench_signing()
+        result_writer.close()
@@ -0,0 +1,83 @@
+"""
+Time-to-import of the web app, measured with ``python -X importtime``.
+
+Run from the repository root:
+
+    python -m benchmarks.startup_bench [--runs N] [--update]
+
+Imports ``app`` in fresh interpreters, reports the median cumulative import
+time and the slowest modules, and fails if the time exceeds the budget in
+startup_budget.json or if any module listed there as forbidden (such as
+pandas) was imported. ``--update`` rewrites the budget from this machine's
+measurement plus the recorded headroom.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+BUDGET_FILE = os.path.join(os.path.dirname(__file__), "startup_budget.json")
+
+
+def measure(module):
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        dict: (self, cumulative) import time in microseconds per module.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True).stderr
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # column header
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--update", action="store_true")
+    args = parser.parse_args()
+
+    with open(BUDGET_FILE, encoding="utf-8") as file:
+        budget = json.load(file)
+    module = budget["module"]
+
+    runs = [measure(module) for _ in range(args.runs)]
+    total = statistics.median(run[module][1] for run in runs)
+    print(f"import {module}: {total / 1000:.1f} ms median of {args.runs} runs "
+          f"(budget {budget['max_import_ms']} ms)")
+    print("slowest modules (self time):")
+    for name, (self_us, _) in sorted(runs[-1].items(), key=lambda item: -item[1][0])[:10]:
+        print(f"  {self_us / 1000:>7.1f} ms  {name}")
+
+    if args.update:
+        budget["max_import_ms"] = round(total / 1000 * budget["headroom"])
+        with open(BUDGET_FILE, "w", encoding="utf-8") as file:
+            json.dump(budget, file, indent=4)
+            file.write("\n")
+        print(f"budget updated to {budget['max_import_ms']} ms")
+        return 0
+
+    failed = False
+    forbidden = sorted({name for run in runs for name in run if name.split(".")[0] in budget["forbidden_modules"]})
+    if forbidden:
+        print("forbidden modules imported at startup:", ", ".join(forbidden))
+        failed = True
+    if total / 1000 > budget["max_import_ms"]:
+        print("startup time is over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
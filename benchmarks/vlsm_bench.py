@@ -0,0 +1,55 @@
+"""
+Throughput of the VLSM planner.
+
+Run from the repository root:
+
+    python -m benchmarks.vlsm_bench [problems]
+
+Draws ``problems`` (default 20,000) random practice problems with a fixed
+seed, then times planning them all, planning and describing every subnet
+(the strings a practice page shows), and checking a correct student plan
+for each. Exits non-zero if planning runs below MIN_SUBNETS_PER_SECOND.
+"""
+import random
+import sys
+import time
+
+from subnet_planner import check_plan, describe, plan, random_problem
+
+MIN_SUBNETS_PER_SECOND = 20_000
+
+
+def timed(function, problems):
+    began = time.perf_counter()
+    results = [function(block, hosts) for block, hosts in problems]
+    return time.perf_counter() - began, results
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    rng = random.Random(25)
+    problems = [random_problem(rng) for _ in range(count)]
+    subnets = sum(len(hosts) for _, hosts in problems)
+
+    planned, plans = timed(plan, problems)
+    described, _ = timed(lambda block, hosts: [describe(subnet) for subnet in plan(block, hosts)], problems)
+    answers = []
+    for (block, hosts), subnets_of_plan in zip(problems, plans):
+        answer = [None] * len(hosts)
+        for subnet in subnets_of_plan:
+            row = describe(subnet)
+            answer[subnet.index] = row['Network Address'] + row['Prefix']
+        answers.append(answer)
+    began = time.perf_counter()
+    for (block, hosts), answer in zip(problems, answers):
+        check_plan(block, hosts, answer)
+    checked = time.perf_counter() - began
+
+    rate = subnets / planned
+    print(f"{count} problems, {subnets} subnets")
+    print(f"plan:             {rate:>10,.0f} subnets/s  {count / planned:>9,.0f} problems/s")
+    print(f"plan + describe:  {subnets / described:>10,.0f} subnets/s  {count / described:>9,.0f} problems/s")
+    print(f"check a plan:     {subnets / checked:>10,.0f} subnets/s  {count / checked:>9,.0f} problems/s")
+    if rate < MIN_SUBNETS_PER_SECOND:
+        print(f"below {MIN_SUBNETS_PER_SECOND:,} subnets/s")
+        sys.exit(1)
@@ -4,13 +4,17 @@ This file generates an classful address and calculates it based on certain quest
 @author: amyxg
 """
 import random
-import ipaddress
-import re
+from wildcard_mask import prefix_info
+from address_engine import CLASSFUL_CLASSES, classify, ip_to_int
+from answer_validation import validate_field
 
-def generate_random_classful_address():
+def generate_random_classful_address(rng=random):
     """
     Generate a random Class A, B, or C IP address with a subnet mask.
     Excludes invalid first octets: 0, 127, and 240-255.
+
+    Args:
+        rng (random.Random): Source of randomness; the random module by default.
     
     Returns:
         tuple: 
@@ -31,27 +35,27 @@ def generate_random_classful_address():
         True
     """
     # Choose random str of A, B, or C
-    address_class = random.choice(['A', 'B', 'C'])
+    address_class = rng.choice(['A', 'B', 'C'])
     
     if address_class == 'A':  # Class A = range of 1.0.0.0 to 126.255.255.255
-        first_octet = random.randint(1, 126)
+        first_octet = rng.randint(1, 126)
         # Skip 127 as it's reserved for loopback
         default_mask = 8
     elif address_class == 'B':  # Class B = range of 128.0.0.0 to 191.255.255.255
-        first_octet = random.randint(128, 191)
+        first_octet = rng.randint(128, 191)
         default_mask = 16
     else:  # Class C = range of 192.0.0.0 to 223.255.255.255
-        first_octet = random.randint(192, 223)
+        first_octet = rng.randint(192, 223)
         default_mask = 24
         
     # Generate remaining octets
-    remaining_octets = [random.randint(0, 255) for _ in range(3)]
+    remaining_octets = [rng.randint(0, 255) for _ in range(3)]
     
     # Construct the IP address
     ip = f"{first_octet}.{remaining_octets[0]}.{remaining_octets[1]}.{remaining_octets[2]}"
     
     # Used for subnetting, cidr_prefix is a number between the default mask (e.g., /8, /16, /24) and /30
-    cidr_prefix = random.randint(default_mask + 1, 30)
+    cidr_prefix = rng.randint(default_mask + 1, 30)
     
     return ip, default_mask, cidr_prefix
 
@@ -75,26 +79,15 @@ def calculate_classful_analysis(ip, default_mask, cidr_prefix):
         >>> result['Address Class']
         'C'
     """
-    # Convert the IP and CIDR prefix into a network object
-    network = ipaddress.ip_network(f"{ip}/{cidr_prefix}", strict=False)
-
-    # Split the IP into octets
-    octets = ip.split('.')
+    address = ip_to_int(ip)
+    masks = prefix_info(cidr_prefix)
 
-    # Determine address class and native address map
-    first_octet = int(octets[0])
-    if 1 <= first_octet <= 126:  # Class A
-        leading_bit_pattern = "0"
-        native_address_map = f"N.H.H.H"
-        address_class = "A"
-    elif 128 <= first_octet <= 191:  # Class B
-        leading_bit_pattern = "10"
-        native_address_map = f"N.N.H.H"
-        address_class = "B"
-    elif 192 <= first_octet <= 223:  # Class C
-        leading_bit_pattern = "110"
-        native_address_map = f"N.N.N.H"
-        address_class = "C"
+    # Determine address class and native address map from the leading bits
+    address_class = classify(address)
+    if address_class in CLASSFUL_CLASSES:
+        leading_bit_pattern = address_class.leading_bits
+        native_address_map = address_class.native_address_map
+        address_class = address_class.name
     else:
         leading_bit_pattern = "Unknown"
         native_address_map = "Invalid Address Class"
@@ -104,8 +97,8 @@ def calculate_classful_analysis(ip, default_mask, cidr_prefix):
         "Address Class": address_class,
         "Leading Bit Pattern": leading_bit_pattern,
         "Native Address Map": native_address_map,
-        "Subnet Mask (SNM)": str(network.netmask),
-        "Wildcard Mask (WCM)": str(network.hostmask)
+        "Subnet Mask (SNM)": masks.subnet_mask,
+        "Wildcard Mask (WCM)": masks.wildcard_mask
     }
 
 def validate_input(key, value):
@@ -129,41 +122,8 @@ def validate_input(key, value):
         >>> validate_input('Native Address Map', 'n.n.n.h')
         False
     """
-    if key == "Address Class":
-        # Must be one of A, B, C, D, or E (case-sensitive)
-        return value in ['A', 'B', 'C', 'D', 'E']
-    
-    elif key == "Native Address Map":
-        # Check if any lowercase n or h is present
-        if 'n' in value or 'h' in value:
-            return False
-            
-        # Must match format like N.N.N.H for class C (case-sensitive)
-        return (re.match(r'^N\.N\.N\.H$', value) is not None) or \
-               (re.match(r'^\d+\.\d+\.\d+\.H$', value) is not None) or \
-               (re.match(r'^N\.N\.H\.H$', value) is not None) or \
-               (re.match(r'^\d+\.\d+\.H\.H$', value) is not None) or \
-               (re.match(r'^N\.H\.H\.H$', value) is not None) or \
-               (re.match(r'^\d+\.H\.H\.H$', value) is not None)
-    
-    elif key == "Leading Bit Pattern":
-        # Must be one of the valid binary patterns: 0, 10, or 110
-        return value in ['0', '10', '110']
-    
-    elif key == "Subnet Mask (SNM)" or key == "Wildcard Mask (WCM)":
-        try:
-            octets = list(map(int, value.split(".")))
-            if len(octets) != 4 or not all(0 <= octet <= 255 for octet in octets):
-                return False
-            mask_binary = "".join(f"{octet:08b}" for octet in octets)
-            if key == "Subnet Mask (SNM)":
-                return re.match(r"^1*0*$", mask_binary) is not None
-            else:  # Wildcard Mask
-                return re.match(r"^0*1*$", mask_binary) is not None
-        except ValueError:
-            return False
-            
-    return False
+    # Patterns are precompiled and masks are checked against the 33 valid ones
+    return validate_field(key, value) is None
 
 if __name__ == "__main__":
     import doctest
@@ -0,0 +1,172 @@
+"""
+Compression and conditional GETs for the app's pages.
+
+init_compression() adds an after_request hook. On a successful GET it
+tags the response with a weak ETag, a hash of the uncompressed body, so a
+browser that sends the same ETag back in If-None-Match gets an empty 304
+instead of the page. The tag is weak because the gzip and brotli copies of a
+page share it.
+
+Then it compresses HTML, JSON and plain-text bodies of at least
+COMPRESSION_MIN_BYTES, using brotli when the ``brotli`` package is installed
+and the browser accepts it, and gzip otherwise. Quiz pages change on every
+request, so they are compressed with fast settings (COMPRESSION_LEVEL,
+COMPRESSION_BROTLI_QUALITY). Pages that are the same for every visitor,
+the COMPRESSION_CACHED_ENDPOINTS, are compressed once at the highest
+settings and the compressed copy is reused while their ETag stays the same.
+
+Responses that are already encoded, streamed or sent from a file (the
+static assets) are left alone.
+"""
+import hashlib
+import zlib
+
+from flask import current_app, request
+
+COMPRESSIBLE_TYPES = ("text/html", "text/plain", "application/json")
+GZIP_WBITS = 31  # zlib.MAX_WBITS | 16: gzip header and trailer
+CACHED_GZIP_LEVEL = 9
+CACHED_BROTLI_QUALITY = 11
+
+
+def _brotli_module():
+    try:
+        import brotli
+    except ImportError:
+        return None
+    return brotli
+
+
+def gzip_compress(data, level):
+    """
+    Compress data in the gzip format.
+
+    Unlike gzip.compress(), the header has no timestamp, so equal input
+    gives equal output.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    return compressor.compress(data) + compressor.flush()
+
+
+class Compressor:
+    """
+    Compress response bodies for one app, and cache the compressed copies
+    of its static pages.
+
+    Args:
+        min_bytes (int): Smaller bodies are sent as they are.
+        level (int): gzip level for pages that change on every request.
+        brotli_quality (int): brotli quality for the same pages.
+        cached_endpoints (iterable): Endpoints whose pages are the same for
+            every visitor.
+    """
+
+    def __init__(self, min_bytes=1024, level=6, brotli_quality=4, cached_endpoints=()):
+        self.min_bytes = min_bytes
+        self.level = level
+        self.brotli_quality = brotli_quality
+        self.cached_endpoints = frozenset(cached_endpoints)
+        self.brotli = _brotli_module()
+        # endpoint -> (etag, {encoding: body}); only the newest version is kept
+        self._cache = {}
+
+    def encodings(self):
+        """
+        Returns:
+            tuple: The content codings this compressor can produce, best first.
+        """
+        return ("br", "gzip") if self.brotli is not None else ("gzip",)
+
+    def compress(self, data, encoding, cached=False):
+        """
+        Compress data with "br" or "gzip", at the highest settings if cached.
+        """
+        if encoding == "br":
+            return self.brotli.compress(data, quality=CACHED_BROTLI_QUALITY if cached else self.brotli_quality)
+        return gzip_compress(data, CACHED_GZIP_LEVEL if cached else self.level)
+
+    def cached(self, endpoint, etag, data, encoding):
+        """
+        The compressed copy of a static page, compressing it on first use.
+
+        Two threads may both compress a page the first time; the results
+        are identical and the later one wins.
+        """
+        entry = self._cache.get(endpoint)
+        if entry is None or entry[0] != etag:
+            entry = self._cache[endpoint] = (etag, {})
+        body = entry[1].get(encoding)
+        if body is None:
+            body = entry[1][encoding] = self.compress(data, encoding, cached=True)
+        return body
+
+
+def init_compression(app):
+    """
+    Compress an app's responses and answer its conditional GETs.
+
+    Args:
+        app (Flask): The app.
+    """
+    app.config.setdefault('COMPRESSION_ENABLED', True)
+    app.config.setdefault('COMPRESSION_MIN_BYTES', 1024)
+    app.config.setdefault('COMPRESSION_LEVEL', 6)
+    app.config.setdefault('COMPRESSION_BROTLI_QUALITY', 4)
+    app.config.setdefault('COMPRESSION_CACHED_ENDPOINTS', ['main', 'reference_guide'])
+    app.config.setdefault('CONDITIONAL_GET', True)
+    if app.config['COMPRESSION_ENABLED']:
+        app.extensions['compressor'] = Compressor(int(app.config['COMPRESSION_MIN_BYTES']),
+                                                  int(app.config['COMPRESSION_LEVEL']),
+                                                  int(app.config['COMPRESSION_BROTLI_QUALITY']),
+                                                  app.config['COMPRESSION_CACHED_ENDPOINTS'])
+    else:
+        app.extensions['compressor'] = None
+    if app.extensions['compressor'] is not None or app.config['CONDITIONAL_GET']:
+        app.after_request(compress_response)
+
+
+def _negotiate(compressor):
+    for encoding in compressor.encodings():
+        if request.accept_encodings.quality(encoding):
+            return encoding
+    return None
+
+
+def compress_response(response):
+    """
+    Tag, conditionally answer and compress a response (an after_request
+    hook).
+    """
+    if (response.status_code != 200 or response.direct_passthrough or response.is_streamed
+            or "Content-Encoding" in response.headers or response.mimetype not in COMPRESSIBLE_TYPES):
+        return response
+    data = response.get_data()
+    compressor = current_app.extensions['compressor']
+    if compressor is not None and len(data) < compressor.min_bytes:
+        compressor = None
+    if compressor is not None:
+        response.vary.add("Accept-Encoding")
+    etag = None
+    if request.method in ("GET", "HEAD") and current_app.config['CONDITIONAL_GET']:
+        etag = hashlib.sha1(data).hexdigest()
+        # set directly: the parsed ETag and Cache-Control helpers cost more than the hash
+        response.headers["ETag"] = f'W/"{etag}"'
+        if "Cache-Control" not in response.headers:
+            # cache the page, but ask the server before each reuse
+            response.headers["Cache-Control"] = "no-cache"
+        if "If-None-Match" in request.headers:
+            response.make_conditional(request)
+            if response.status_code == 304:
+                return response
+    if compressor is None:
+        return response
+    encoding = _negotiate(compressor)
+    if encoding is None:
+        return response
+    if etag is not None and request.endpoint in compressor.cached_endpoints:
+        body = compressor.cached(request.endpoint, etag, data, encoding)
+    else:
+        body = compressor.compress(data, encoding)
+    response.set_data(body)
+    response.content_encoding = encoding
+    return response
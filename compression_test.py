@@ -0,0 +1,88 @@
+import gzip
+import unittest
+
+from app_testing import AppTestCase, make_app
+from compression import Compressor, gzip_compress
+
+
+class TestCompressor(unittest.TestCase):
+
+    def test_gzip_is_deterministic(self):
+        data = b'<p>subnet</p>' * 200
+        self.assertEqual(gzip_compress(data, 6), gzip_compress(data, 6))
+        self.assertEqual(gzip.decompress(gzip_compress(data, 6)), data)
+
+    def test_cached_copy_follows_etag(self):
+        compressor = Compressor(cached_endpoints=['main'])
+        first = compressor.cached('main', 'a', b'first page' * 200, 'gzip')
+        self.assertIs(compressor.cached('main', 'a', b'ignored', 'gzip'), first)
+        second = compressor.cached('main', 'b', b'second page' * 200, 'gzip')
+        self.assertEqual(gzip.decompress(second), b'second page' * 200)
+
+
+class TestCompressedResponses(AppTestCase):
+
+    def test_gzip_quiz_page(self):
+        plain = self.client.get('/classful_quiz')
+        response = self.client.get('/classful_quiz', headers={'Accept-Encoding': 'gzip'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        self.assertIsNone(plain.content_encoding)
+        html = gzip.decompress(response.data)
+        self.assertIn(b'Address Class', html)
+        self.assertLess(len(response.data), len(html) / 2)
+        self.assertEqual(int(response.headers['Content-Length']), len(response.data))
+
+    def test_brotli_preferred(self):
+        compressor = self.app.extensions['compressor']
+        if compressor.brotli is None:
+            self.skipTest('brotli is not installed')
+        response = self.client.get('/', headers={'Accept-Encoding': 'gzip, br'})
+        self.assertEqual(response.headers['Content-Encoding'], 'br')
+        self.assertEqual(compressor.brotli.decompress(response.data), self.client.get('/').data)
+
+    def test_static_page_conditional_get(self):
+        first = self.client.get('/reference-guide', headers={'Accept-Encoding': 'gzip'})
+        etag = first.headers['ETag']
+        self.assertTrue(etag.startswith('W/'))
+        self.assertTrue(first.cache_control.no_cache)
+        again = self.client.get('/reference-guide', headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+        self.assertEqual(again.status_code, 304)
+        self.assertEqual(again.data, b'')
+        # the identity copy has the same weak tag
+        self.assertEqual(self.client.get('/reference-guide', headers={'If-None-Match': etag}).status_code, 304)
+        cached = self.app.extensions['compressor']._cache['reference_guide']
+        self.assertEqual(cached[1]['gzip'], first.data)
+
+    def test_new_question_is_not_304(self):
+        etag = self.client.get('/subnet-quiz').headers['ETag']
+        etags = {self.client.get('/subnet-quiz', headers={'If-None-Match': etag}).status_code for _ in range(5)}
+        self.assertEqual(etags, {200})
+
+    def test_post_is_compressed_without_etag(self):
+        self.client.get('/binary-to-decimal')
+        response = self.client.post('/binary-to-decimal', data={'user_guess': '0'},
+                                    headers={'Accept-Encoding': 'gzip'})
+        self.assertNotIn('ETag', response.headers)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+
+    def test_small_response_sent_as_is(self):
+        self.app.extensions['compressor'].min_bytes = 1 << 20
+        response = self.client.get('/', headers={'Accept-Encoding': 'gzip'})
+        self.assertIsNone(response.content_encoding)
+        self.assertNotIn('Vary', response.headers)
+        self.assertIn('ETag', response.headers)
+
+    def test_static_assets_untouched(self):
+        response = self.client.get('/static/images/logo.png', headers={'Accept-Encoding': 'gzip'})
+        self.assertIsNone(response.content_encoding)
+
+    def test_disabled(self):
+        app = make_app(self, {'COMPRESSION_ENABLED': False, 'CONDITIONAL_GET': False})
+        response = app.test_client().get('/', headers={'Accept-Encoding': 'gzip'})
+        self.assertIsNone(response.content_encoding)
+        self.assertNotIn('ETag', response.headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+"""
+Export quiz results to pandas DataFrames for reporting.
+
+pandas is only imported when one of these functions is called, so the web
+app never pays for it at startup.
+"""
+import os
+
+from archive import ARCHIVE_EXT, ArchiveReader, log_segments
+
+
+def results_frame(filename):
+    """
+    Load a CSV result log, including its rotated segments, into a DataFrame.
+
+    A segment archived by archive.py is read from its ``.qar`` file once
+    the CSV segment is gone.
+
+    Args:
+        filename (str): Path of the live log, e.g. 'subnet_quiz_results.csv'.
+
+    Returns:
+        pandas.DataFrame: Every logged row, oldest first.
+    """
+    import pandas as pd
+
+    paths = [path for _, path in log_segments(filename)]
+    if os.path.exists(filename):
+        paths.append(filename)
+    if not paths:
+        return pd.DataFrame()
+    return pd.concat([_archive_frame(path) if path.endswith(ARCHIVE_EXT) else pd.read_csv(path, dtype=str)
+                      for path in paths], ignore_index=True)
+
+
+def _archive_frame(path):
+    import pandas as pd
+
+    reader = ArchiveReader(path)
+    # the strings the CSV file held, with empty fields missing as read_csv has them
+    rows = [[str(value) if value != "" else None for value in row] for row in reader.scan()]
+    return pd.DataFrame(rows, columns=reader.columns, dtype=object)
+
+
+def store_frame(store, quiz):
+    """
+    Load one quiz's rows from a SQLiteResultStore into a DataFrame.
+
+    Args:
+        store (SQLiteResultStore): The results database.
+        quiz (str): Quiz name, e.g. 'classful_quiz'.
+
+    Returns:
+        pandas.DataFrame: Every stored row, oldest first.
+    """
+    import pandas as pd
+
+    return pd.DataFrame.from_records(list(store.rows(quiz)))
+
+
+if __name__ == "__main__":
+    import sys
+
+    for name in sys.argv[1:]:
+        frame = results_frame(name)
+        print(f"{name}: {len(frame)} rows")
+        print(frame.tail())
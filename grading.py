@@ -0,0 +1,178 @@
+"""
+Answer keys and grading for the subnet and classful quizzes.
+
+A question is an IP address and a prefix length; everything else follows
+from those two. The quiz pages, the JSON API and batch grading all build
+answer keys and grade answers through these functions, so a submission
+gets the same score whichever way it arrives.
+"""
+from collections import namedtuple
+
+from classaddress import calculate_classful_analysis
+from address_engine import classify, ip_to_int
+from answer_validation import validate_submission
+from wildcard_mask import calculate_subnet_address_map, calculate_wildcard_mask, prefix_length_to_subnet_mask
+
+SUBNET_FIELDS = ("Subnet Address Map", "Subnet Mask", "Wildcard Mask")
+CLASSFUL_FIELDS = ("Address Class", "Leading Bit Pattern", "Native Address Map",
+                   "Subnet Mask (SNM)", "Wildcard Mask (WCM)")
+
+# results: one dict per question; score: number correct;
+# invalid: question -> reason code for malformed answers
+Grade = namedtuple("Grade", "results score invalid")
+
+
+def subnet_answers(ip, prefix_length):
+    """
+    Build the answer key of a subnet quiz question.
+
+    Args:
+        ip (str): The IP address.
+        prefix_length (int): The prefix length (0-32).
+
+    Returns:
+        dict: Maps each of SUBNET_FIELDS to its correct answer.
+
+    Examples:
+        >>> subnet_answers('172.16.5.4', 20)['Wildcard Mask']
+        '0.0.15.255'
+    """
+    return {
+        "Subnet Address Map": calculate_subnet_address_map(ip, prefix_length),
+        "Subnet Mask": prefix_length_to_subnet_mask(prefix_length),
+        "Wildcard Mask": calculate_wildcard_mask(prefix_length),
+    }
+
+
+def classful_answers(ip, prefix_length):
+    """
+    Build the answer key of a classful quiz question.
+
+    Args:
+        ip (str): The IP address.
+        prefix_length (int): The CIDR prefix (0-32).
+
+    Returns:
+        dict: Maps each of CLASSFUL_FIELDS to its correct answer.
+
+    Raises:
+        ValueError: If the IP address is malformed or not a class A, B or C
+            address.
+
+    Examples:
+        >>> classful_answers('172.16.5.4', 20)['Address Class']
+        'B'
+    """
+    address_class = classify(ip_to_int(ip))
+    if address_class is None or address_class.default_prefix is None:
+        raise ValueError("not a class A, B or C address")
+    return calculate_classful_analysis(ip, address_class.default_prefix, prefix_length)
+
+
+def _result(key, user_answer, correct_answer, correct):
+    return {
+        "question": key,
+        "user_answer": user_answer,
+        "correct_answer": correct_answer,
+        "correct": correct
+    }
+
+
+def grade_subnet(correct_answers, user_answers):
+    """
+    Grade subnet quiz answers. Case and spaces are ignored.
+
+    Args:
+        correct_answers (dict): The answer key from subnet_answers().
+        user_answers (dict): The user's answers; missing ones count as wrong.
+
+    Returns:
+        Grade: Per-question results and the score; invalid is always empty.
+
+    Examples:
+        >>> grade_subnet({'Subnet Mask': '255.255.0.0'}, {'Subnet Mask': ' 255.255.0.0 '}).score
+        1
+    """
+    results = []
+    score = 0
+    for key, correct_answer in correct_answers.items():
+        user_answer = user_answers.get(key, "").strip()
+        # Normalize both answers for comparison
+        is_correct = user_answer.upper().replace(" ", "") == correct_answer.upper().replace(" ", "")
+        if is_correct:
+            score += 1
+        results.append(_result(key, user_answer, correct_answer, is_correct))
+    return Grade(results, score, {})
+
+
+def grade_classful(correct_answers, user_answers):
+    """
+    Grade classful quiz answers. Answers must match exactly; malformed
+    answers are marked with a reason code and never count as correct.
+
+    Args:
+        correct_answers (dict): The answer key from classful_answers().
+        user_answers (dict): The user's answers; missing ones count as wrong.
+
+    Returns:
+        Grade: Per-question results, the score, and the malformed answers.
+
+    Examples:
+        >>> grade = grade_classful({'Address Class': 'B', 'Leading Bit Pattern': '10'},
+        ...                        {'Address Class': 'b', 'Leading Bit Pattern': '10'})
+        >>> grade.score, grade.invalid
+        (1, {'Address Class': 'not_a_choice'})
+    """
+    user_answers = {key: user_answers.get(key, "") for key in correct_answers}
+    # Validate all user answers in one pass; maps each bad field to a reason
+    invalid = validate_submission(user_answers)
+    results = []
+    score = 0
+    for key, correct_answer in correct_answers.items():
+        user_answer = user_answers[key]
+        if key in invalid:
+            result = _result(key, user_answer, correct_answer, False)
+            result["validation_error"] = True
+            result["validation_reason"] = invalid[key]
+            results.append(result)
+            continue
+        is_correct = user_answer == correct_answer
+        if is_correct:
+            score += 1
+        results.append(_result(key, user_answer, correct_answer, is_correct))
+    return Grade(results, score, invalid)
+
+
+def subnet_log_row(ip, prefix_length, correct_answers, user_answers, score):
+    """
+    Returns:
+        dict: A row for the subnet quiz result log.
+    """
+    return {
+        'IP Address': ip,
+        'Prefix Length': prefix_length,
+        'Subnet Mask': correct_answers.get('Subnet Mask', ''),
+        'Wildcard Mask': correct_answers.get('Wildcard Mask', ''),
+        'User Answers': str(user_answers),
+        'Correct Answers': str(correct_answers),
+        'Score': f"{score}/{len(correct_answers)}"
+    }
+
+
+def classful_log_row(ip, prefix_length, correct_answers, user_answers, score):
+    """
+    Returns:
+        dict: A row for the classful quiz result log.
+    """
+    return {
+        'IP Address': ip,
+        'CIDR Prefix': prefix_length,
+        'Address Class': correct_answers.get('Address Class', ''),
+        'Native Address Map': correct_answers.get('Native Address Map', ''),
+        'Leading Bit Pattern': correct_answers.get('Leading Bit Pattern', ''),
+        'Subnet Mask': correct_answers.get('Subnet Mask (SNM)', ''),
+        'Wildcard Mask': correct_answers.get('Wildcard Mask (WCM)', ''),
+        'User Answers': str(user_answers),
+        'Correct Answers': str(correct_answers),
+        'Score': f"{score}/{len(correct_answers)}"
+    }
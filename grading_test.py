@@ -0,0 +1,50 @@
+import unittest
+
+from grading import (CLASSFUL_FIELDS, SUBNET_FIELDS, classful_answers, classful_log_row, grade_classful,
+                     grade_subnet, subnet_answers)
+
+
+class TestGrading(unittest.TestCase):
+
+    def test_answer_keys(self):
+        self.assertEqual(subnet_answers('172.16.5.4', 20),
+                         {'Subnet Address Map': 'N.N.S.H', 'Subnet Mask': '255.255.240.0',
+                          'Wildcard Mask': '0.0.15.255'})
+        key = classful_answers('10.1.2.3', 12)
+        self.assertEqual(tuple(key), CLASSFUL_FIELDS)
+        self.assertEqual((key['Address Class'], key['Leading Bit Pattern'], key['Subnet Mask (SNM)']),
+                         ('A', '0', '255.240.0.0'))
+        with self.assertRaises(ValueError):
+            classful_answers('10.1.2', 12)
+        with self.assertRaises(ValueError):
+            classful_answers('230.1.1.1', 20)
+        with self.assertRaises(ValueError):
+            subnet_answers('10.1.2.3', 33)
+
+    def test_grade_subnet_ignores_case_and_spaces(self):
+        key = subnet_answers('172.16.5.4', 20)
+        grade = grade_subnet(key, {'Subnet Address Map': 'n.n.s.h', 'Subnet Mask': '255. 255.240.0'})
+        self.assertEqual(grade.score, 2)
+        self.assertEqual([result['correct'] for result in grade.results], [True, True, False])
+        self.assertEqual(tuple(result['question'] for result in grade.results), SUBNET_FIELDS)
+        self.assertEqual(grade.invalid, {})
+
+    def test_grade_classful_marks_malformed_answers(self):
+        key = classful_answers('192.168.1.10', 26)
+        answers = dict(key)
+        answers['Subnet Mask (SNM)'] = '255.0.255.0'
+        grade = grade_classful(key, answers)
+        self.assertEqual(grade.score, 4)
+        self.assertEqual(grade.invalid, {'Subnet Mask (SNM)': 'not_contiguous'})
+        flagged = [result for result in grade.results if result.get('validation_error')]
+        self.assertEqual([result['validation_reason'] for result in flagged], ['not_contiguous'])
+        self.assertEqual(grade_classful(key, key).score, len(key))
+
+    def test_log_row(self):
+        key = classful_answers('192.168.1.10', 26)
+        row = classful_log_row('192.168.1.10', 26, key, {}, 3)
+        self.assertEqual((row['CIDR Prefix'], row['Address Class'], row['Score']), (26, 'C', '3/5'))
+
+
+if __name__ == '__main__':
+    unittest.main()
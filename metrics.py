@@ -0,0 +1,250 @@
+"""
+In-process metrics in the Prometheus text format.
+
+A Metrics registry holds counters and histograms, each a family of series
+told apart by label values. Recording is a dict lookup, a bisect over the
+bucket bounds and an increment under a per-series lock, about a microsecond;
+render() builds the text served on /metrics.
+
+    metrics = Metrics()
+    metrics.histogram("netquizzer_phase_seconds", "Time per phase.", ("route", "phase"))
+    with metrics.timer("netquizzer_phase_seconds", ("classful_quiz", "render")):
+        ...
+    metrics.render()
+
+Series are created on first use. Label values must come from a small set
+(route names, quiz names), never from user input.
+"""
+import threading
+import time
+from bisect import bisect_left
+
+# Upper bounds in seconds, from 50 us to 2.5 s
+LATENCY_BUCKETS = (0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25,
+                   0.5, 1.0, 2.5)
+
+COUNTER = "counter"
+HISTOGRAM = "histogram"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _Counter:
+    __slots__ = ("lock", "value")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.value = 0
+
+    def add(self, amount):
+        with self.lock:
+            self.value += amount
+
+
+class _Histogram:
+    __slots__ = ("lock", "buckets", "counts", "sum")
+
+    def __init__(self, buckets):
+        self.lock = threading.Lock()
+        self.buckets = buckets
+        # one slot per bucket plus +Inf; not cumulative until rendered
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+
+    def add(self, value):
+        index = bisect_left(self.buckets, value)
+        with self.lock:
+            self.counts[index] += 1
+            self.sum += value
+
+
+class _Family:
+    __slots__ = ("kind", "help", "labels", "buckets", "series", "lock")
+
+    def __init__(self, kind, help, labels, buckets):
+        self.kind = kind
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets) if buckets else None
+        self.series = {}
+        self.lock = threading.Lock()
+
+    def child(self, values):
+        series = self.series.get(values)
+        if series is None:
+            if len(values) != len(self.labels):
+                raise ValueError(f"Expected labels {self.labels}, got {values!r}")
+            with self.lock:
+                series = self.series.get(values)
+                if series is None:
+                    series = _Histogram(self.buckets) if self.kind == HISTOGRAM else _Counter()
+                    self.series[values] = series
+        return series
+
+
+class _Timer:
+    __slots__ = ("series", "started")
+
+    def __init__(self, series):
+        self.series = series
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.series.add(time.perf_counter() - self.started)
+        return False
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_text(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metrics:
+    """
+    Registry of counter and histogram families.
+    """
+
+    def __init__(self):
+        self._families = {}
+
+    def counter(self, name, help, labels=()):
+        """
+        Register a counter family.
+
+        Args:
+            name (str): Metric name, e.g. 'netquizzer_attempts_total'.
+            help (str): One-line description.
+            labels (tuple): Label names.
+        """
+        self._families[name] = _Family(COUNTER, help, labels, None)
+
+    def histogram(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        """
+        Register a histogram family.
+
+        Args:
+            name (str): Metric name, e.g. 'netquizzer_request_seconds'.
+            help (str): One-line description.
+            labels (tuple): Label names.
+            buckets (tuple): Increasing bucket upper bounds.
+        """
+        self._families[name] = _Family(HISTOGRAM, help, labels, buckets)
+
+    def inc(self, name, labels=(), amount=1):
+        """
+        Add to a counter.
+
+        Args:
+            name (str): A registered counter.
+            labels (tuple): Label values, in the family's label order.
+            amount (int): How much to add.
+        """
+        self._families[name].child(labels).add(amount)
+
+    def observe(self, name, labels, value):
+        """
+        Record one value in a histogram.
+        """
+        self._families[name].child(labels).add(value)
+
+    def timer(self, name, labels=()):
+        """
+        Time a block into a histogram.
+
+        Returns:
+            A context manager recording the block's wall time in seconds.
+        """
+        return _Timer(self._families[name].child(labels))
+
+    def value(self, name, labels=()):
+        """
+        Returns:
+            int or tuple: A counter's value, or a histogram's (count, sum).
+        """
+        series = self._families[name].series.get(tuple(labels))
+        if series is None:
+            return 0 if self._families[name].kind == COUNTER else (0, 0.0)
+        if isinstance(series, _Counter):
+            return series.value
+        return sum(series.counts), series.sum
+
+    def render(self):
+        """
+        Returns:
+            str: Every family in the Prometheus text exposition format.
+        """
+        lines = []
+        for name, family in self._families.items():
+            lines.append(f"# HELP {name} {family.help}")
+            lines.append(f"# TYPE {name} {family.kind}")
+            with family.lock:
+                series_by_labels = sorted(family.series.items())
+            for values, series in series_by_labels:
+                if family.kind == COUNTER:
+                    lines.append(f"{name}{_label_text(family.labels, values)} {series.value}")
+                    continue
+                with series.lock:
+                    counts, total = list(series.counts), series.sum
+                cumulative = 0
+                for bound, count in zip(family.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = 'le="+Inf"' if bound == float("inf") else f'le="{_number(bound)}"'
+                    lines.append(f"{name}_bucket{_label_text(family.labels, values, le)} {cumulative}")
+                lines.append(f"{name}_sum{_label_text(family.labels, values)} {_number(total)}")
+                lines.append(f"{name}_count{_label_text(family.labels, values)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+
+class RequestTimer:
+    """
+    WSGI middleware timing every request into the app's metrics.
+
+    The app names the route it dispatched to in the environ under
+    ROUTE_KEY; requests that never reach a route count as "unmatched".
+    The method comes from the client, so one outside METHODS counts as
+    "other" rather than adding a series.
+
+    Args:
+        wsgi_app: The WSGI app to time.
+        metrics (Metrics): Registry holding ``histogram`` (route, method)
+            and ``counter`` (route, method, status).
+    """
+
+    ROUTE_KEY = "netquizzer.route"
+    METHODS = frozenset(("GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"))
+
+    def __init__(self, wsgi_app, metrics, histogram="netquizzer_request_seconds",
+                 counter="netquizzer_requests_total"):
+        self.wsgi_app = wsgi_app
+        self.metrics = metrics
+        self.histogram = histogram
+        self.counter = counter
+
+    def __call__(self, environ, start_response):
+        started = time.perf_counter()
+        status = []
+
+        def timed_start_response(status_line, headers, exc_info=None):
+            status.append(status_line[:3])
+            return start_response(status_line, headers, exc_info)
+
+        try:
+            return self.wsgi_app(environ, timed_start_response)
+        finally:
+            method = environ.get("REQUEST_METHOD", "")
+            labels = (environ.get(self.ROUTE_KEY) or "unmatched", method if method in self.METHODS else "other")
+            self.metrics.observe(self.histogram, labels, time.perf_counter() - started)
+            self.metrics.inc(self.counter, labels + (status[0] if status else "500",))
@@ -0,0 +1,92 @@
+import threading
+import unittest
+
+from app_testing import AppTestCase, make_app
+from metrics import Metrics, RequestTimer
+
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = Metrics()
+        self.metrics.histogram('latency_seconds', 'Latency.', ('route',), buckets=(0.1, 1.0))
+        self.metrics.counter('attempts_total', 'Attempts.', ('quiz',))
+
+    def test_histogram_buckets_are_cumulative(self):
+        for value in (0.05, 0.1, 0.5, 3.0):
+            self.metrics.observe('latency_seconds', ('main',), value)
+        text = self.metrics.render()
+        self.assertIn('# TYPE latency_seconds histogram', text)
+        self.assertIn('latency_seconds_bucket{route="main",le="0.1"} 2', text)
+        self.assertIn('latency_seconds_bucket{route="main",le="1.0"} 3', text)
+        self.assertIn('latency_seconds_bucket{route="main",le="+Inf"} 4', text)
+        self.assertIn('latency_seconds_count{route="main"} 4', text)
+        self.assertEqual(self.metrics.value('latency_seconds', ('main',)), (4, 3.65))
+
+    def test_counter_is_thread_safe(self):
+        def work():
+            for _ in range(1000):
+                self.metrics.inc('attempts_total', ('subnet_quiz',))
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.metrics.value('attempts_total', ('subnet_quiz',)), 8000)
+        self.assertIn('attempts_total{quiz="subnet_quiz"} 8000', self.metrics.render())
+
+    def test_label_values_are_escaped_and_checked(self):
+        self.metrics.inc('attempts_total', ('say "hi"\n',))
+        self.assertIn('attempts_total{quiz="say \\"hi\\"\\n"} 1', self.metrics.render())
+        with self.assertRaises(ValueError):
+            self.metrics.inc('attempts_total', ('a', 'b'))
+
+    def test_request_timer(self):
+        self.metrics.histogram('netquizzer_request_seconds', 'Requests.', ('route', 'method'))
+        self.metrics.counter('netquizzer_requests_total', 'Requests.', ('route', 'method', 'status'))
+
+        def wsgi_app(environ, start_response):
+            environ[RequestTimer.ROUTE_KEY] = 'main'
+            start_response('200 OK', [])
+            return [b'ok']
+
+        timer = RequestTimer(wsgi_app, self.metrics)
+        self.assertEqual(timer({'REQUEST_METHOD': 'GET'}, lambda status, headers, exc_info=None: None), [b'ok'])
+        self.assertEqual(self.metrics.value('netquizzer_requests_total', ('main', 'GET', '200')), 1)
+        self.assertEqual(self.metrics.value('netquizzer_request_seconds', ('main', 'GET'))[0], 1)
+
+
+class TestMetricsEndpoint(AppTestCase):
+
+    def test_quiz_round_is_measured(self):
+        self.client.get('/binary-to-decimal')
+        with self.client.session_transaction() as session:
+            answer = session['random_decimal']
+        self.client.post('/binary-to-decimal', data={'user_guess': str(answer)})
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith('text/plain; version=0.0.4'))
+        text = response.get_data(as_text=True)
+        for phase in ('generate', 'session_load', 'session_save', 'log', 'render'):
+            self.assertIn(f'netquizzer_phase_seconds_count{{route="binary_to_decimal",phase="{phase}"}}', text)
+        self.assertIn('netquizzer_requests_total{route="binary_to_decimal",method="POST",status="200"} 1', text)
+        self.assertIn('netquizzer_attempts_total{quiz="binary_to_decimal"} 1', text)
+        self.assertIn('netquizzer_correct_total{quiz="binary_to_decimal"} 1', text)
+        self.assertIn('netquizzer_game_over_total{quiz="binary_to_decimal"} 1', text)
+
+    def test_unknown_methods_share_one_series(self):
+        for index in range(5):
+            self.client.open('/', method=f'X{index}')
+        text = self.client.get('/metrics').get_data(as_text=True)
+        self.assertNotIn('method="X', text)
+        self.assertIn('netquizzer_requests_total{route="unmatched",method="other",status="405"} 5', text)
+
+    def test_disabled(self):
+        app = make_app(self, {'METRICS_ENABLED': False})
+        self.assertIsNone(app.extensions['metrics'])
+        self.assertEqual(app.test_client().get('/metrics').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,278 @@
+"""
+Sampled profiling of live quiz requests.
+
+A RequestProfiler profiles a random fraction (``rate``) of the requests it
+is asked about and aggregates the results in memory, per process:
+
+- ``collapsed`` (default): every ``interval`` seconds the stack of each
+  thread serving a sampled request is taken, and each distinct stack is
+  counted. The output, ``profile-<pid>.collapsed``, is
+  one ``route;file:function;... count`` line per stack, the input of
+  flamegraph.pl, speedscope and similar tools.
+- ``pstats``: sampled requests run under cProfile, and the stats of each
+  route are merged into ``<route>-<pid>.pstats`` for pstats or snakeviz.
+
+Stacks are taken by a SIGALRM handler on an ITIMER_REAL interval timer,
+which interrupts a request however short it is (a sampling thread would
+not get the GIL before a sub-millisecond request is over). The handler
+runs in the main thread, so the timer is used when sampling starts there
+(sync workers, the test client); elsewhere, or without setitimer, a
+background thread samples as soon as a sampled request starts and then
+every ``interval``. The timer stops itself after IDLE_TICKS ticks without a
+sampled request and the next one restarts it at a random phase, so an idle
+worker takes no signals and short requests are not skipped.
+
+Files are rewritten with the whole aggregate by flush(), which runs every
+``flush_every`` sampled requests, when profiling is switched off, and at
+exit. With ``rate`` at 0 a request costs one attribute check.
+"""
+import atexit
+import cProfile
+import os
+import pstats
+import random
+import signal
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+
+COLLAPSED = "collapsed"
+PSTATS = "pstats"
+FORMATS = (COLLAPSED, PSTATS)
+
+IDLE_TICKS = 100  # timer ticks without a sampled request before the timer stops
+
+
+def collapse_stack(frame, root):
+    """
+    Describe a stack in the collapsed-stack format.
+
+    Args:
+        frame: The innermost frame.
+        root (str): Name of the bottom entry, e.g. the route.
+
+    Returns:
+        str: Frames from outermost to innermost, separated by ';'.
+    """
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+        frame = frame.f_back
+    names.append(root)
+    return ";".join(reversed(names))
+
+
+class RequestProfiler:
+    """
+    Profile a sampled fraction of requests and aggregate the results.
+
+    Args:
+        directory (str): Where profile files are written.
+        rate (float): Fraction of requests to profile, 0 to 1.
+        output (str): COLLAPSED or PSTATS.
+        interval (float): Seconds between stack samples (COLLAPSED).
+        flush_every (int): Write the files after this many sampled requests.
+    """
+
+    def __init__(self, directory, rate=0.0, output=COLLAPSED, interval=0.001, flush_every=100):
+        if output not in FORMATS:
+            raise ValueError(f"Unknown profile format: {output!r}")
+        self.directory = directory
+        self.output = output
+        self.interval = interval
+        self.flush_every = flush_every
+        self.rate = 0.0
+        self._lock = threading.Lock()
+        self._stacks = Counter()
+        self._stats = {}
+        self._active = {}
+        self._sampled = 0
+        self._unflushed = 0
+        self._pid = None
+        self._thread = None
+        # the process whose SIGALRM handler is ours, and whether its timer runs
+        self._timer_pid = None
+        self._armed = False
+        self._idle_ticks = 0
+        self._previous_handler = None
+        self._stop = threading.Event()
+        # set while a profiled request runs; the sampling thread sleeps otherwise
+        self._busy = threading.Event()
+        self.set_rate(rate)
+        atexit.register(self.flush)
+
+    def set_rate(self, rate):
+        """
+        Change the sampled fraction. Setting it to 0 also writes the files.
+        """
+        rate = float(rate)
+        if not 0.0 <= rate <= 1.0:
+            raise ValueError(f"Sample rate must be between 0 and 1, got {rate}")
+        self.rate = rate
+        if rate == 0.0:
+            self._disarm()
+            self.flush()
+
+    def should_sample(self):
+        return self.rate > 0.0 and random.random() < self.rate
+
+    def _ensure_sampler(self):
+        # a forked worker inherits neither the parent's sampling thread nor its timer
+        pid = os.getpid()
+        if self._pid == pid and (self._armed or self._thread is not None and self._thread.is_alive()):
+            return
+        with self._lock:
+            if self._pid == pid and (self._armed or self._thread is not None and self._thread.is_alive()):
+                return
+            self._pid = pid
+            if (self._timer_pid != pid and hasattr(signal, "setitimer")
+                    and threading.current_thread() is threading.main_thread()):
+                self._previous_handler = signal.signal(signal.SIGALRM, self._on_timer)
+                self._timer_pid = pid
+            if self._timer_pid == pid:
+                # a random first tick, so requests shorter than interval are sampled too
+                self._idle_ticks = 0
+                signal.setitimer(signal.ITIMER_REAL, random.uniform(1e-6, self.interval), self.interval)
+                self._armed = True
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._sample_stacks, name="request-profiler", daemon=True)
+            self._thread.start()
+
+    def _disarm(self):
+        if self._armed and self._pid == os.getpid():
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        self._armed = False
+
+    def _on_timer(self, signum, frame):
+        # runs in the main thread between bytecodes; ``frame`` is the one it
+        # interrupted. No lock: the main thread may be holding it.
+        if not self._active:
+            self._idle_ticks += 1
+            if self._idle_ticks >= IDLE_TICKS:
+                self._disarm()
+            return
+        self._idle_ticks = 0
+        current = threading.get_ident()
+        frames = None
+        for thread_id, route in list(self._active.items()):
+            if thread_id == current:
+                sample = frame
+            else:
+                if frames is None:
+                    frames = sys._current_frames()
+                sample = frames.get(thread_id)
+            if sample is not None:
+                self._stacks[collapse_stack(sample, route)] += 1
+
+    def _sample_stacks(self):
+        while not self._stop.is_set():
+            if not self._active:
+                self._busy.clear()
+                # re-check: a request may have started before the clear
+                if not self._active:
+                    self._busy.wait()
+                    continue
+            # sample first: a sampled request may be over within one interval
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id, route in list(self._active.items()):
+                    frame = frames.get(thread_id)
+                    if frame is not None:
+                        self._stacks[collapse_stack(frame, route)] += 1
+            time.sleep(self.interval)
+
+    @contextmanager
+    def profile(self, route):
+        """
+        Profile the enclosed block as one request to ``route``.
+        """
+        if self.output == PSTATS:
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                yield
+            finally:
+                profile.disable()
+                with self._lock:
+                    stats = self._stats.get(route)
+                    if stats is None:
+                        self._stats[route] = pstats.Stats(profile)
+                    else:
+                        stats.add(profile)
+                self._finish()
+        else:
+            self._ensure_sampler()
+            thread_id = threading.get_ident()
+            self._active[thread_id] = route
+            self._busy.set()
+            try:
+                yield
+            finally:
+                self._active.pop(thread_id, None)
+                self._finish()
+
+    def _finish(self):
+        with self._lock:
+            self._sampled += 1
+            self._unflushed += 1
+            due = self._unflushed >= self.flush_every
+        if due:
+            self.flush()
+
+    def stats(self):
+        """
+        Returns:
+            dict: rate, output, sampled (requests profiled so far) and
+            stacks (distinct stacks seen, COLLAPSED only).
+        """
+        return {"rate": self.rate, "output": self.output, "sampled": self._sampled, "stacks": len(self._stacks)}
+
+    def flush(self):
+        """
+        Write the aggregated profiles of this process, if any request was
+        profiled since the last flush.
+
+        Returns:
+            list: Paths written.
+        """
+        with self._lock:
+            if not self._unflushed:
+                return []
+            self._unflushed = 0
+            stacks = sorted(self._stacks.items())
+            stats = dict(self._stats)
+        os.makedirs(self.directory, exist_ok=True)
+        pid = os.getpid()
+        written = []
+        if stacks:
+            path = os.path.join(self.directory, f"profile-{pid}.collapsed")
+            with open(path + ".tmp", "w", encoding="utf-8") as file:
+                file.writelines(f"{stack} {count}\n" for stack, count in stacks)
+            os.replace(path + ".tmp", path)
+            written.append(path)
+        for route, route_stats in stats.items():
+            path = os.path.join(self.directory, f"{route}-{pid}.pstats")
+            with self._lock:
+                route_stats.dump_stats(path + ".tmp")
+            os.replace(path + ".tmp", path)
+            written.append(path)
+        return written
+
+    def close(self):
+        """
+        Stop the sampling thread or timer and write the files.
+        """
+        self._disarm()
+        if self._timer_pid == os.getpid() and threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGALRM, self._previous_handler or signal.SIG_DFL)
+            self._timer_pid = None
+        self._stop.set()
+        self._busy.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
@@ -0,0 +1,114 @@
+import os
+import pstats
+import tempfile
+import time
+import unittest
+
+from app_testing import make_app
+from profiling import PSTATS, RequestProfiler
+
+
+def busy_quiz_work(seconds):
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+
+class TestRequestProfiler(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_disabled_never_samples(self):
+        profiler = RequestProfiler(self.directory.name)
+        self.assertFalse(any(profiler.should_sample() for _ in range(1000)))
+        self.assertEqual(profiler.flush(), [])
+        with self.assertRaises(ValueError):
+            profiler.set_rate(1.5)
+        with self.assertRaises(ValueError):
+            RequestProfiler(self.directory.name, output='svg')
+
+    def test_collapsed_stacks(self):
+        profiler = RequestProfiler(self.directory.name, rate=1.0, interval=0.001)
+        self.assertTrue(profiler.should_sample())
+        with profiler.profile('classful_quiz'):
+            busy_quiz_work(0.1)
+        profiler.close()
+        self.assertEqual(profiler.stats()['sampled'], 1)
+        path = os.path.join(self.directory.name, f'profile-{os.getpid()}.collapsed')
+        with open(path, encoding='utf-8') as file:
+            lines = file.read().splitlines()
+        self.assertTrue(lines)
+        stack, count = lines[0].rsplit(' ', 1)
+        self.assertTrue(stack.startswith('classful_quiz;'))
+        self.assertTrue(any('profiling_test.py:busy_quiz_work' in line for line in lines))
+        self.assertGreater(sum(int(line.rsplit(' ', 1)[1]) for line in lines), 10)
+
+    def test_pstats_are_merged_per_route(self):
+        profiler = RequestProfiler(self.directory.name, rate=1.0, output=PSTATS, flush_every=2)
+        for _ in range(2):
+            with profiler.profile('subnet_quiz_route'):
+                busy_quiz_work(0.001)
+        path = os.path.join(self.directory.name, f'subnet_quiz_route-{os.getpid()}.pstats')
+        self.assertTrue(os.path.exists(path))
+        calls = [stat[1] for function, stat in pstats.Stats(path).stats.items() if function[2] == 'busy_quiz_work']
+        self.assertEqual(calls, [2])
+        profiler.set_rate(0)
+        self.assertFalse(profiler.should_sample())
+
+
+class TestProfiledApp(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.app = make_app(self, {'PROFILE_SAMPLE_RATE': 1.0, 'PROFILE_ADMIN_TOKEN': 'secret',
+                                   'PROFILE_DIR': self.directory.name})
+        self.client = self.app.test_client()
+        self.profiler = self.app.extensions['profiler']
+
+    def test_short_quiz_requests_are_sampled(self):
+        for _ in range(300):
+            self.client.get('/classful_quiz')
+        self.assertEqual(self.profiler.stats()['sampled'], 300)
+        samples = dict(self.profiler._stacks)
+        # the view takes well under a millisecond; most requests should still be seen
+        self.assertGreater(sum(samples.values()), 30)
+        self.assertTrue(all(stack.startswith('classful_quiz;') for stack in samples))
+        self.assertTrue(any('app.py:classful_quiz' in stack for stack in samples))
+        self.profiler.close()
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, f'profile-{os.getpid()}.collapsed')))
+
+    def test_unprofiled_routes_are_not_wrapped(self):
+        self.client.get('/')
+        self.assertEqual(self.profiler.stats()['sampled'], 0)
+
+    def test_admin_rejects_a_wrong_token(self):
+        for headers in ({}, {'X-Admin-Token': 'wrong'}, {'X-Admin-Token': 'sécret'}):
+            response = self.client.post('/admin/profiling', json={'rate': 0.5}, headers=headers)
+            self.assertEqual(response.status_code, 403)
+        self.assertEqual(self.profiler.rate, 1.0)
+
+    def test_admin_changes_the_rate(self):
+        headers = {'X-Admin-Token': 'secret'}
+        self.assertEqual(self.client.get('/admin/profiling', headers=headers).get_json()['rate'], 1.0)
+        response = self.client.post('/admin/profiling', json={'rate': 0.25}, headers=headers)
+        self.assertEqual(response.get_json()['rate'], 0.25)
+        self.assertEqual(self.profiler.rate, 0.25)
+
+    def test_admin_rejects_a_bad_body(self):
+        headers = {'X-Admin-Token': 'secret'}
+        for body in ({'rate': 2}, {'rate': 'often'}, {}, [0.5]):
+            self.assertEqual(self.client.post('/admin/profiling', json=body, headers=headers).status_code, 400)
+        response = self.client.post('/admin/profiling', data='rate=0.5', headers=headers)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.profiler.rate, 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
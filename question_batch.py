@@ -0,0 +1,168 @@
+"""
+Bulk question generation for printed exams and pre-seeded question pools.
+
+generate_batch() produces N classful address questions at once as NumPy
+arrays (uint32 addresses, prefixes, masks, network and broadcast addresses)
+using vectorized integer operations, with the same distribution as
+generate_random_classful_address(): a uniformly chosen class A, B or C
+address and a prefix between the class default + 1 and /30.
+
+write_csv() and write_jsonl() stream a batch out in chunks, so the text for
+the whole batch is never held in memory at once.
+
+Requires NumPy (``pip install numpy``); the web app does not import this module.
+"""
+import csv
+import json
+from collections import namedtuple
+
+import numpy as np
+
+from address_engine import CLASSFUL_CLASSES
+from wildcard_mask import PREFIX_TABLE
+
+QuestionBatch = namedtuple(
+    "QuestionBatch",
+    "address class_index prefix_length mask network broadcast first_host last_host")
+
+# Columns written by write_csv() / keys written by write_jsonl()
+COLUMNS = [
+    "IP Address", "CIDR Prefix", "Address Class", "Leading Bit Pattern", "Native Address Map",
+    "Subnet Address Map", "Subnet Mask (SNM)", "Wildcard Mask (WCM)",
+    "Network Address", "Broadcast Address", "First Host", "Last Host",
+]
+
+# First-octet ranges and default prefixes of classes A, B and C
+_FIRST_OCTET_LOW = np.array([1, 128, 192], dtype=np.uint32)
+_FIRST_OCTET_HIGH = np.array([126, 191, 223], dtype=np.uint32)
+_DEFAULT_PREFIX = np.array([cls.default_prefix for cls in CLASSFUL_CLASSES], dtype=np.uint8)
+
+# Lookup arrays so answers can be gathered by index instead of computed per row
+_MASKS = np.array([info.mask for info in PREFIX_TABLE], dtype=np.uint32)
+_SUBNET_MASKS = np.array([info.subnet_mask for info in PREFIX_TABLE], dtype=object)
+_WILDCARD_MASKS = np.array([info.wildcard_mask for info in PREFIX_TABLE], dtype=object)
+_ADDRESS_MAPS = np.array([info.address_map for info in PREFIX_TABLE], dtype=object)
+_CLASS_NAMES = np.array([cls.name for cls in CLASSFUL_CLASSES], dtype=object)
+_LEADING_BITS = np.array([cls.leading_bits for cls in CLASSFUL_CLASSES], dtype=object)
+_NATIVE_MAPS = np.array([cls.native_address_map for cls in CLASSFUL_CLASSES], dtype=object)
+_OCTET_STRINGS = np.array([str(octet) for octet in range(256)], dtype=object)
+
+
+def generate_batch(count, rng=None):
+    """
+    Generate classful address questions and their answers in bulk.
+
+    Args:
+        count (int): Number of questions.
+        rng (numpy.random.Generator): Source of randomness. A fresh
+            default_rng() is used if omitted.
+
+    Returns:
+        QuestionBatch: One array per field, each of length ``count``.
+
+    Examples:
+        >>> batch = generate_batch(1000, np.random.default_rng(0))
+        >>> bool(((batch.address & batch.mask) == batch.network).all())
+        True
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    class_index = rng.integers(0, 3, size=count, dtype=np.uint8)
+    first_octet = rng.integers(_FIRST_OCTET_LOW[class_index], _FIRST_OCTET_HIGH[class_index],
+                               endpoint=True, dtype=np.uint32)
+    remaining = rng.integers(0, 1 << 24, size=count, dtype=np.uint32)
+    address = (first_octet << np.uint32(24)) | remaining
+
+    prefix_length = rng.integers(_DEFAULT_PREFIX[class_index] + 1, 30, endpoint=True, dtype=np.uint8)
+    mask = _MASKS[prefix_length]
+    network = address & mask
+    broadcast = network | ~mask
+    # prefixes stop at /30, so every subnet has at least two hosts
+    return QuestionBatch(address, class_index, prefix_length, mask, network, broadcast,
+                         network + np.uint32(1), broadcast - np.uint32(1))
+
+
+def dotted(addresses):
+    """
+    Format an array of uint32 addresses in dotted decimal notation.
+
+    Args:
+        addresses (numpy.ndarray): uint32 addresses.
+
+    Returns:
+        numpy.ndarray: Object array of address strings.
+    """
+    return (_OCTET_STRINGS[addresses >> 24] + "." + _OCTET_STRINGS[(addresses >> 16) & 0xFF] + "."
+            + _OCTET_STRINGS[(addresses >> 8) & 0xFF] + "." + _OCTET_STRINGS[addresses & 0xFF])
+
+
+def iter_chunks(batch, chunk_size=65536):
+    """
+    Render a batch as rows of answer strings, one chunk at a time.
+
+    Args:
+        batch (QuestionBatch): Questions from generate_batch().
+        chunk_size (int): Rows per chunk.
+
+    Yields:
+        list: Up to ``chunk_size`` rows, each a tuple in COLUMNS order.
+    """
+    for start in range(0, len(batch.address), chunk_size):
+        part = QuestionBatch(*(column[start:start + chunk_size] for column in batch))
+        yield list(zip(
+            dotted(part.address),
+            part.prefix_length.tolist(),
+            _CLASS_NAMES[part.class_index],
+            _LEADING_BITS[part.class_index],
+            _NATIVE_MAPS[part.class_index],
+            _ADDRESS_MAPS[part.prefix_length],
+            _SUBNET_MASKS[part.prefix_length],
+            _WILDCARD_MASKS[part.prefix_length],
+            dotted(part.network),
+            dotted(part.broadcast),
+            dotted(part.first_host),
+            dotted(part.last_host),
+        ))
+
+
+def write_csv(batch, file, chunk_size=65536):
+    """
+    Stream a batch to a CSV file with a header row.
+
+    Args:
+        batch (QuestionBatch): Questions from generate_batch().
+        file: Text file opened with newline=''.
+        chunk_size (int): Rows rendered at a time.
+    """
+    writer = csv.writer(file)
+    writer.writerow(COLUMNS)
+    for rows in iter_chunks(batch, chunk_size):
+        writer.writerows(rows)
+
+
+def write_jsonl(batch, file, chunk_size=65536):
+    """
+    Stream a batch to a JSON Lines file, one question object per line.
+
+    Args:
+        batch (QuestionBatch): Questions from generate_batch().
+        file: Text file.
+        chunk_size (int): Rows rendered at a time.
+    """
+    dumps = json.JSONEncoder(separators=(",", ":")).encode
+    for rows in iter_chunks(batch, chunk_size):
+        file.write("".join(dumps(dict(zip(COLUMNS, row))) + "\n" for row in rows))
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    parser = argparse.ArgumentParser(description="Generate classful address questions in bulk.")
+    parser.add_argument("count", type=int)
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    batch = generate_batch(args.count, np.random.default_rng(args.seed))
+    sys.stdout.reconfigure(newline="")
+    (write_csv if args.format == "csv" else write_jsonl)(batch, sys.stdout)
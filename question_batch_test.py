@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+import unittest
+from address_engine import analyze, int_to_ip, ip_to_int
+from classaddress import calculate_classful_analysis
+
+try:
+    import numpy as np
+    import question_batch
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestQuestionBatch(unittest.TestCase):
+
+    def setUp(self):
+        self.batch = question_batch.generate_batch(5000, np.random.default_rng(42))
+
+    def test_distribution_bounds(self):
+        first_octet = self.batch.address >> 24
+        self.assertTrue(((first_octet >= 1) & (first_octet <= 223) & (first_octet != 127)).all())
+        default_prefix = np.array([8, 16, 24])[self.batch.class_index]
+        self.assertTrue((self.batch.prefix_length > default_prefix).all())
+        self.assertTrue((self.batch.prefix_length <= 30).all())
+        self.assertEqual(set(self.batch.class_index.tolist()), {0, 1, 2})
+
+    def test_answers_match_scalar_engine(self):
+        for row in next(question_batch.iter_chunks(self.batch, chunk_size=500)):
+            answers = dict(zip(question_batch.COLUMNS, row))
+            analysis = calculate_classful_analysis(answers["IP Address"], None, answers["CIDR Prefix"])
+            for key, value in analysis.items():
+                self.assertEqual(answers[key], value)
+            result = analyze(ip_to_int(answers["IP Address"]), answers["CIDR Prefix"])
+            self.assertEqual(answers["Network Address"], int_to_ip(result.network))
+            self.assertEqual(answers["Broadcast Address"], int_to_ip(result.broadcast))
+            self.assertEqual(answers["First Host"], int_to_ip(result.first_host))
+            self.assertEqual(answers["Last Host"], int_to_ip(result.last_host))
+            self.assertEqual(answers["Subnet Address Map"], result.prefix.address_map)
+
+    def test_exporters(self):
+        small = question_batch.generate_batch(10, np.random.default_rng(1))
+        out = io.StringIO(newline="")
+        question_batch.write_csv(small, out, chunk_size=3)
+        rows = list(csv.reader(io.StringIO(out.getvalue())))
+        self.assertEqual(rows[0], question_batch.COLUMNS)
+        self.assertEqual(len(rows), 11)
+        out = io.StringIO()
+        question_batch.write_jsonl(small, out, chunk_size=4)
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(len(lines), 10)
+        self.assertEqual([line["IP Address"] for line in lines], [row[0] for row in rows[1:]])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""
+Pools of ready-made subnet and classful questions.
+
+A QuestionPool keeps questions with their answer keys already worked out,
+so a quiz page load takes one from a ring buffer instead of drawing an
+address and computing its answers. Questions are kept per key: None for a
+question drawn like generate_random_classful_address() does, or a prefix
+length for the questions the adaptive selection asks for. A ring for a
+prefix length is made the first time that prefix is asked for.
+
+Taking a question is O(1). When a ring falls below ``low_water`` a
+background thread tops every low ring up to ``size`` again; if a ring is
+empty, the question is generated on the spot. Each ring is a
+``collections.deque``, whose append and popleft are atomic, so takers and
+the refill thread need no lock.
+
+The thread starts on the first take. A forked worker drops the questions
+it inherited and starts its own thread, so workers never hand out the same
+questions.
+"""
+import os
+import random
+import threading
+import time
+from collections import deque
+
+from adaptive import classful_address_for_prefix
+from classaddress import calculate_classful_analysis, generate_random_classful_address
+from grading import subnet_answers
+
+
+def _address(prefix_length, rng):
+    if prefix_length is None:
+        return generate_random_classful_address(rng)
+    return classful_address_for_prefix(prefix_length, rng)
+
+
+def subnet_question(prefix_length=None, rng=random):
+    """
+    Draw a subnet quiz question.
+
+    Args:
+        prefix_length (int): The prefix to ask about, or None for any.
+        rng (random.Random): Source of randomness.
+
+    Returns:
+        tuple: (ip, default_mask, prefix_length, answers).
+    """
+    ip, default_mask, prefix_length = _address(prefix_length, rng)
+    return ip, default_mask, prefix_length, subnet_answers(ip, prefix_length)
+
+
+def classful_question(prefix_length=None, rng=random):
+    """
+    Draw a classful quiz question.
+
+    Args:
+        prefix_length (int): The prefix to ask about, or None for any.
+        rng (random.Random): Source of randomness.
+
+    Returns:
+        tuple: (ip, default_mask, prefix_length, answers).
+    """
+    ip, default_mask, prefix_length = _address(prefix_length, rng)
+    return ip, default_mask, prefix_length, calculate_classful_analysis(ip, default_mask, prefix_length)
+
+
+# question generator of each pooled quiz
+QUESTION_TYPES = {'subnet_quiz': subnet_question, 'classful_quiz': classful_question}
+
+
+class QuestionPool:
+    """
+    Ring buffers of pre-generated questions, refilled in the background.
+
+    Args:
+        generate (callable): Makes one question from a key.
+        size (int): Questions kept per key.
+        low_water (int): Refill a ring once it holds fewer than this.
+    """
+
+    def __init__(self, generate, size=64, low_water=16):
+        if not 0 <= low_water <= size:
+            raise ValueError(f"low_water must be between 0 and size ({size}), got {low_water}")
+        self.generate = generate
+        self.size = size
+        self.low_water = low_water
+        self.hits = 0
+        self.misses = 0
+        self._rings = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._pid = None
+
+    def _ensure_refiller(self):
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            # questions inherited from a parent process are the parent's
+            self._rings = {}
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._refill, name="question-pool", daemon=True)
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _refill(self):
+        while not self._stop.is_set():
+            self._wake.wait()
+            self._wake.clear()
+            for ring in list(self._rings.values()):
+                while len(ring) < self.size and not self._stop.is_set():
+                    ring.append(self.generate(ring.key))
+                    # let a waiting request thread have the GIL between questions
+                    time.sleep(0)
+
+    def take(self, key=None):
+        """
+        Hand out a question.
+
+        Args:
+            key: None or a prefix length; passed to ``generate``.
+
+        Returns:
+            The question, from the pool when one is ready.
+        """
+        self._ensure_refiller()
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = self._rings.setdefault(key, _Ring(key, self.size))
+        try:
+            question = ring.popleft()
+            self.hits += 1
+        except IndexError:
+            question = self.generate(key)
+            self.misses += 1
+        if len(ring) < self.low_water:
+            self._wake.set()
+        return question
+
+    def fill(self, key=None):
+        """
+        Fill the ring of a key now, in the calling thread.
+        """
+        self._ensure_refiller()
+        ring = self._rings.setdefault(key, _Ring(key, self.size))
+        while len(ring) < self.size:
+            ring.append(self.generate(key))
+
+    def stats(self):
+        """
+        Returns:
+            dict: hits and misses so far, and questions ready per key.
+        """
+        return {"hits": self.hits, "misses": self.misses,
+                "ready": {key: len(ring) for key, ring in self._rings.items()}}
+
+    def close(self):
+        """
+        Stop the refill thread.
+        """
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._pid = None
+
+
+class _Ring(deque):
+    # a deque that remembers the key its questions are generated for
+    def __init__(self, key, size):
+        super().__init__(maxlen=size)
+        self.key = key
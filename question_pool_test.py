@@ -0,0 +1,92 @@
+import itertools
+import threading
+import time
+import unittest
+
+from app_testing import AppTestCase, make_app
+from grading import subnet_answers
+from question_pool import QuestionPool, classful_question, subnet_question
+
+
+class TestQuestionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.counter = itertools.count()
+        self.generated = threading.Event()
+
+        def generate(key):
+            self.generated.set()
+            return key, next(self.counter)
+
+        self.pool = QuestionPool(generate, size=8, low_water=4)
+        self.addCleanup(self.pool.close)
+
+    def wait_for(self, condition):
+        deadline = time.monotonic() + 5
+        while not condition():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.001)
+
+    def test_empty_pool_generates_inline_then_refills(self):
+        self.assertEqual(self.pool.take(), (None, 0))
+        self.assertEqual(self.pool.stats()['misses'], 1)
+        self.wait_for(lambda: self.pool.stats()['ready'][None] == 8)
+        self.assertEqual(self.pool.take(), (None, 1))
+        self.assertEqual(self.pool.stats()['hits'], 1)
+
+    def test_refills_only_below_low_water(self):
+        self.pool.fill(24)
+        for _ in range(4):
+            self.pool.take(24)
+        self.assertEqual(self.pool.stats()['ready'][24], 4)
+        self.generated.clear()
+        self.pool.take(24)
+        self.wait_for(lambda: self.pool.stats()['ready'][24] == 8)
+        self.assertTrue(self.generated.is_set())
+
+    def test_keys_have_their_own_rings(self):
+        self.pool.fill(20)
+        self.pool.fill(None)
+        self.assertEqual(self.pool.take(20)[0], 20)
+        self.assertEqual(self.pool.take()[0], None)
+
+    def test_low_water_checked(self):
+        with self.assertRaises(ValueError):
+            QuestionPool(lambda key: key, size=4, low_water=5)
+
+
+class TestQuestions(unittest.TestCase):
+
+    def test_subnet_question(self):
+        ip, default_mask, prefix_length, answers = subnet_question(27)
+        self.assertEqual(prefix_length, 27)
+        self.assertLess(default_mask, 27)
+        self.assertEqual(answers, subnet_answers(ip, 27))
+
+    def test_classful_question(self):
+        ip, default_mask, prefix_length, answers = classful_question()
+        self.assertGreater(prefix_length, default_mask)
+        self.assertEqual(answers['Address Class'], {8: 'A', 16: 'B', 24: 'C'}[default_mask])
+
+
+class TestPooledQuiz(AppTestCase):
+
+    def test_quiz_answers_come_from_the_pool(self):
+        pool = self.app.extensions['question_pools']['subnet_quiz']
+        pool.fill()
+        ready = pool.take()
+        pool._rings[None].appendleft(ready)
+        self.client.get('/subnet-quiz')
+        with self.client.session_transaction() as session:
+            self.assertEqual(session['ip'], ready[0])
+            self.assertEqual(session['answers'], ready[3])
+        self.assertEqual(pool.stats()['hits'], 2)
+
+    def test_disabled(self):
+        app = make_app(self, {'QUESTION_POOL_SIZE': 0})
+        self.assertIsNone(app.extensions['question_pools'])
+        self.assertIn(b'Given the IP address', app.test_client().get('/classful_quiz').data)
+
+
+if __name__ == '__main__':
+    unittest.main()
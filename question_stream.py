@@ -0,0 +1,142 @@
+"""
+Reproducible question streams for exams and benchmarks.
+
+A QuestionStream numbers the questions of each quiz from 0 and draws
+question k from its own random generator, whose key is worked out from the
+stream's seed, an exam name, the quiz and k alone. Question k is therefore
+the same wherever and whenever it is asked for, without generating the
+k - 1 before it: two processes (or a printed exam and the web app) with the
+same seed hand out identical questions, and an exam can be generated in
+parallel by splitting its question numbers between workers.
+
+The generators are CounterRandom objects, whose n-th 64-bit output is the
+SplitMix64 finalizer applied to ``key + n * GOLDEN``. There is no state
+besides the key and the counter, so a generator per question costs next
+to nothing. CounterRandom has the randint(), randrange(), choice() and
+random() methods the app's generators call on their ``rng`` argument (the
+``random`` module by default), and derives them from its own outputs, so
+the questions do not change with the Python version.
+"""
+import hashlib
+
+MASK64 = (1 << 64) - 1
+GOLDEN = 0x9E3779B97F4A7C15  # 2**64 / golden ratio, the SplitMix64 increment
+RECIP_BPF = 2 ** -53
+
+
+def mix64(value):
+    """
+    The SplitMix64 finalizer: a bijection on 64-bit integers whose output
+    bits each depend on every input bit.
+
+    Examples:
+        >>> hex(mix64(GOLDEN))
+        '0xe220a8397b1dcdaf'
+    """
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK64
+    return value ^ (value >> 31)
+
+
+def _hash64(text):
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class CounterRandom:
+    """
+    A counter-based random generator with the parts of the ``random.Random``
+    interface the question generators use.
+
+    Args:
+        key (int): Selects the sequence; any integer, taken modulo 2**64.
+
+    Examples:
+        >>> CounterRandom(7).randint(0, 255) == CounterRandom(7).randint(0, 255)
+        True
+    """
+
+    __slots__ = ("key", "counter")
+
+    def __init__(self, key=0):
+        self.key = key & MASK64
+        self.counter = 0
+
+    def getstate(self):
+        return self.key, self.counter
+
+    def setstate(self, state):
+        self.key, self.counter = state
+
+    def _next(self):
+        self.counter += 1
+        return mix64((self.key + self.counter * GOLDEN) & MASK64)
+
+    def getrandbits(self, k):
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        bits, have = 0, 0
+        while have < k:
+            bits = (bits << 64) | self._next()
+            have += 64
+        return bits >> (have - k)
+
+    def random(self):
+        return (self._next() >> 11) * RECIP_BPF
+
+    def _below(self, n):
+        # uniform in [0, n): reject the top 2**64 % n outputs, then reduce
+        if n > MASK64:
+            return self.getrandbits(n.bit_length() + 64) % n
+        limit = (MASK64 + 1) - (MASK64 + 1) % n
+        value = self._next()
+        while value >= limit:
+            value = self._next()
+        return value % n
+
+    def randrange(self, start, stop=None):
+        if stop is None:
+            start, stop = 0, start
+        if stop <= start:
+            raise ValueError(f"empty range for randrange({start}, {stop})")
+        return start + self._below(stop - start)
+
+    def randint(self, a, b):
+        return self.randrange(a, b + 1)
+
+    def choice(self, seq):
+        if not seq:
+            raise IndexError("cannot choose from an empty sequence")
+        return seq[self._below(len(seq))]
+
+
+class QuestionStream:
+    """
+    Numbered, reproducible questions for each quiz of one exam.
+
+    Args:
+        seed: Any value; str(seed) selects the streams.
+        exam (str): Separates exams that share a seed.
+    """
+
+    def __init__(self, seed, exam=""):
+        self.seed = seed
+        self.exam = exam
+        self._base = _hash64(f"{seed}\0{exam}")
+        self._quiz_keys = {}
+
+    def rng(self, quiz, index):
+        """
+        The generator that draws question ``index`` of a quiz.
+
+        Args:
+            quiz (str): Quiz name, e.g. 'subnet_quiz'.
+            index (int): Question number, from 0.
+
+        Returns:
+            CounterRandom: A fresh generator; the same one for the same
+            seed, exam, quiz and index.
+        """
+        quiz_key = self._quiz_keys.get(quiz)
+        if quiz_key is None:
+            quiz_key = self._quiz_keys[quiz] = mix64(self._base ^ _hash64(quiz))
+        return CounterRandom(mix64((quiz_key + index * GOLDEN) & MASK64))
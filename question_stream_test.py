@@ -0,0 +1,102 @@
+import os
+import subprocess
+import sys
+import unittest
+from collections import Counter
+
+from adaptive import LearnerProfile
+from app_testing import AppTestCase
+from classaddress import generate_random_classful_address
+from question_stream import CounterRandom, QuestionStream
+
+
+class TestCounterRandom(unittest.TestCase):
+
+    def test_outputs_are_fixed(self):
+        # SplitMix64 seeded with 0; any change here breaks reproducibility
+        rng = CounterRandom(0)
+        self.assertEqual([rng.getrandbits(64) for _ in range(2)], [0xe220a8397b1dcdaf, 0x6e789e6aa1b965f4])
+        self.assertEqual(CounterRandom(7).randint(0, 255), 215)
+
+    def test_state_round_trip(self):
+        rng = CounterRandom(42)
+        rng.random()
+        state = rng.getstate()
+        first = [rng.randint(0, 255) for _ in range(5)]
+        rng.setstate(state)
+        self.assertEqual([rng.randint(0, 255) for _ in range(5)], first)
+
+    def test_roughly_uniform(self):
+        rng = CounterRandom(3)
+        counts = Counter(rng.randint(0, 7) for _ in range(8000))
+        self.assertEqual(set(counts), set(range(8)))
+        self.assertTrue(all(800 < count < 1200 for count in counts.values()))
+        self.assertTrue(0.0 <= rng.random() < 1.0)
+
+
+class TestQuestionStream(unittest.TestCase):
+
+    def test_question_k_without_the_ones_before(self):
+        stream = QuestionStream(1234)
+        in_order = [generate_random_classful_address(stream.rng('classful_quiz', k)) for k in range(50)]
+        fresh = QuestionStream(1234)
+        self.assertEqual(generate_random_classful_address(fresh.rng('classful_quiz', 37)), in_order[37])
+
+    def test_streams_are_separate(self):
+        def first(stream, quiz='subnet_quiz'):
+            return [stream.rng(quiz, k).getrandbits(64) for k in range(3)]
+
+        reference = first(QuestionStream(1))
+        self.assertNotEqual(first(QuestionStream(2)), reference)
+        self.assertNotEqual(first(QuestionStream(1, exam='retake')), reference)
+        self.assertNotEqual(first(QuestionStream(1), 'classful_quiz'), reference)
+
+    def test_same_questions_in_another_process(self):
+        code = ("from question_stream import QuestionStream; "
+                "print(QuestionStream('exam', 'B').rng('subnet_quiz', 99).randint(0, 10 ** 9))")
+        output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)),
+                                env=dict(os.environ, PYTHONHASHSEED='1')).stdout
+        self.assertEqual(int(output), QuestionStream('exam', 'B').rng('subnet_quiz', 99).randint(0, 10 ** 9))
+
+
+class TestSeededQuiz(AppTestCase):
+
+    CONFIG = {'QUESTION_SEED': 'midterm'}
+
+    def questions(self, learner=None):
+        client = self.app.test_client()
+        if learner is not None:
+            with client.session_transaction() as session:
+                session['learner'] = learner.to_dict()
+        asked = []
+        for _ in range(3):
+            for url, key in (('/subnet-quiz', 'question'), ('/classful_quiz', 'question'),
+                             ('/binary-to-decimal', 'random_decimal'), ('/decimal-to-binary', 'random_decimal')):
+                client.get(url)
+                with client.session_transaction() as session:
+                    asked.append(session[key])
+        return asked
+
+    def test_every_session_gets_the_same_exam(self):
+        self.assertEqual(self.questions(), self.questions())
+
+    def test_mistakes_do_not_change_the_exam(self):
+        learner = LearnerProfile()
+        for _ in range(4):
+            learner.record_prefix(27, 0, 3)
+            learner.record_conversion(0b00001000, 0)
+        self.assertEqual(self.questions(learner), self.questions())
+
+    def test_matches_the_api(self):
+        client = self.app.test_client()
+        client.get('/classful_quiz')
+        client.get('/classful_quiz')
+        with client.session_transaction() as session:
+            ip, prefix = session['ip'], session['cidr_prefix']
+        body = client.get('/api/v1/quiz/classful/question?seed=midterm&start=1').get_json()
+        self.assertEqual(body['questions'], [{'ip': ip, 'prefix': prefix}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,320 @@
+"""
+Instructor reports over the quiz result logs.
+
+    python reports.py [--state reports_state.json] [--json] [log.csv ...]
+
+Streams each CSV result log (its rotated segments oldest first, then the
+live file) line by line and keeps only running totals, so memory does not
+depend on how much history there is:
+
+- accuracy per quiz: attempts, fully correct attempts and, for the subnet
+  and classful quizzes, the share of individual questions answered right;
+- error rate per prefix length for the subnet and classful quizzes;
+- attempts-to-correct for the conversion quizzes: how many students got
+  a number right on the first, second or third try, or not at all.
+
+Segments archived by archive.py are read from their ``.qar`` file once
+the CSV segment is gone, so history moved by ``compact --remove`` still
+counts.
+
+With ``--state``, the totals and the byte offset reached in every file are
+saved after each run, and the next run only reads rows appended since.
+Files are tracked by inode, so a live log that has since been rotated into
+a segment is not read twice, and the rows read of each segment are kept so
+that its archive continues where the CSV file left off. A file that shrank
+was replaced, and its quiz is recomputed from scratch, as it is when an
+archive turns up for a segment whose progress is not known.
+
+The conversion logs do not record who answered, so attempts are matched to
+questions by the question value: two students working on the same number
+at the same time are counted as one.
+"""
+import csv
+import json
+import os
+from itertools import islice
+
+from archive import ARCHIVE_EXT, ArchiveReader, log_segments
+
+# The four logs written by app.py
+RESULT_FILES = [
+    "binary_to_decimal_results.csv",
+    "decimal_to_binary_results.csv",
+    "subnet_quiz_results.csv",
+    "classful_quiz_results.csv",
+]
+
+CONVERSION = "conversion"  # one row per guess, up to 3 guesses per question
+SCORED = "scored"          # one row per submission, scored "n/total"
+
+
+def log_kind(header):
+    """
+    Tell what a log records from its header row.
+
+    Args:
+        header (list): Column names.
+
+    Returns:
+        str: CONVERSION, SCORED, or None for a layout reports do not read.
+
+    Examples:
+        >>> log_kind(['Random Binary', 'Correct Decimal', 'User Guess', 'Result'])
+        'conversion'
+    """
+    if header[-1:] == ["Result"] and len(header) == 4:
+        return CONVERSION
+    if "Score" in header and ("Prefix Length" in header or "CIDR Prefix" in header):
+        return SCORED
+    return None
+
+
+class QuizReport:
+    """
+    Running totals for one result log.
+
+    Args:
+        state (dict): Totals saved by to_dict(), to continue from.
+    """
+
+    def __init__(self, state=None):
+        state = state or {}
+        self.attempts = state.get("attempts", 0)
+        self.correct = state.get("correct", 0)
+        self.questions = state.get("questions", 0)
+        self.questions_correct = state.get("questions_correct", 0)
+        self.skipped = state.get("skipped", 0)
+        # prefix length -> [questions asked, questions answered wrong]
+        self.by_prefix = {int(prefix): counts for prefix, counts in state.get("by_prefix", {}).items()}
+        # "1", "2", "3" or "failed" -> questions
+        self.attempts_to_correct = state.get("attempts_to_correct", {})
+        # question value -> wrong guesses so far, for questions still being played
+        self.open = state.get("open", {})
+        # byte offset reached in each CSV file, by "device:inode"
+        self.files = state.get("files", {})
+        # rows read from each file, by "device:inode"
+        self.rows = state.get("rows", {})
+        # rows read from each closed segment, by segment number
+        self.segments = state.get("segments", {})
+
+    def to_dict(self):
+        return {
+            "attempts": self.attempts,
+            "correct": self.correct,
+            "questions": self.questions,
+            "questions_correct": self.questions_correct,
+            "skipped": self.skipped,
+            "by_prefix": {str(prefix): counts for prefix, counts in sorted(self.by_prefix.items())},
+            "attempts_to_correct": self.attempts_to_correct,
+            "open": self.open,
+            "files": self.files,
+            "rows": self.rows,
+            "segments": self.segments,
+        }
+
+    def add_conversion(self, row):
+        question, result = row[0], row[3]
+        self.attempts += 1
+        if result.startswith("Congratulations"):
+            self.correct += 1
+            tries = str(self.open.pop(question, 0) + 1)
+            self.attempts_to_correct[tries] = self.attempts_to_correct.get(tries, 0) + 1
+        elif result.startswith("Sorry"):
+            self.open.pop(question, None)
+            self.attempts_to_correct["failed"] = self.attempts_to_correct.get("failed", 0) + 1
+        else:
+            self.open[question] = self.open.get(question, 0) + 1
+
+    def add_scored(self, prefix, score):
+        right, _, total = score.partition("/")
+        right, total, prefix = int(right), int(total), int(prefix)
+        self.attempts += 1
+        self.correct += right == total
+        self.questions += total
+        self.questions_correct += right
+        counts = self.by_prefix.setdefault(prefix, [0, 0])
+        counts[0] += total
+        counts[1] += total - right
+
+    def summary(self):
+        """
+        Returns:
+            dict: attempts, accuracy (share of fully correct attempts),
+            question_accuracy, error_rate_by_prefix, attempts_to_correct,
+            and skipped (rows in a layout reports do not read).
+        """
+        return {
+            "attempts": self.attempts,
+            "accuracy": self.correct / self.attempts if self.attempts else None,
+            "question_accuracy": self.questions_correct / self.questions if self.questions else None,
+            "error_rate_by_prefix": {prefix: wrong / asked for prefix, (asked, wrong) in sorted(self.by_prefix.items())
+                                     if asked},
+            "attempts_to_correct": dict(sorted(self.attempts_to_correct.items())),
+            "skipped": self.skipped,
+        }
+
+
+def _file_id(path):
+    info = os.stat(path)
+    return f"{info.st_dev}:{info.st_ino}"
+
+
+def _row_adder(report, header):
+    # a function adding one row of a log with this header to the report
+    kind = log_kind(header)
+    if kind == SCORED:
+        prefix_index = header.index("Prefix Length" if "Prefix Length" in header else "CIDR Prefix")
+        score_index = header.index("Score")
+
+    def add(row):
+        try:
+            if kind == CONVERSION and len(row) == 4:
+                report.add_conversion(row)
+            elif kind == SCORED and len(row) == len(header):
+                report.add_scored(row[prefix_index], row[score_index])
+            else:
+                report.skipped += 1
+        except (TypeError, ValueError):
+            report.skipped += 1
+    return add
+
+
+def _scan(report, path, offset):
+    """
+    Add the complete lines of a CSV file past ``offset`` to a report.
+
+    Returns:
+        tuple: (offset after the last complete line, rows added).
+    """
+    rows = 0
+    with open(path, "rb") as file:
+        add = _row_adder(report, next(csv.reader([file.readline().decode("utf-8-sig")]), []))
+        if offset == 0:
+            offset = file.tell()
+        file.seek(offset)
+        for line in file:
+            if not line.endswith(b"\n"):
+                # the writer is still appending this row; read it next time
+                break
+            offset += len(line)
+            rows += 1
+            add(next(csv.reader([line.decode("utf-8")]), None))
+    return offset, rows
+
+
+def _scan_archive(report, path, start):
+    """
+    Add the rows of an archived segment from row ``start`` on to a report.
+
+    Returns:
+        int: Rows in the archive.
+    """
+    reader = ArchiveReader(path)
+    add = _row_adder(report, reader.columns)
+    for row in islice(reader.scan(), start, None):
+        # typed values convert back to the text they were logged as
+        add([str(value) for value in row])
+    return reader.rows
+
+
+def update_report(filename, state=None):
+    """
+    Bring the report of one log up to date.
+
+    Args:
+        filename (str): Path of the live log, e.g. 'subnet_quiz_results.csv'.
+        state (dict): What a previous call returned, or None to start over.
+
+    Returns:
+        dict: The report state, for summary() via QuizReport(state) or for
+        the next call.
+    """
+    report = QuizReport(state)
+    sources = log_segments(filename)
+    if os.path.exists(filename):
+        sources.append((None, filename))
+    for number, path in sources:
+        if path.endswith(ARCHIVE_EXT):
+            # rows already counted from the segment's CSV file are unknown
+            stale = report.rows and _file_id(path) not in report.rows and str(number) not in report.segments
+        else:
+            stale = os.path.getsize(path) < report.files.get(_file_id(path), 0)
+        if stale:
+            report = QuizReport()
+            break
+    for number, path in sources:
+        file_id = _file_id(path)
+        if path.endswith(ARCHIVE_EXT):
+            # an archive never changes, so it is read at most once
+            if file_id not in report.rows:
+                report.rows[file_id] = _scan_archive(report, path, report.segments.get(str(number), 0))
+        else:
+            offset = report.files.get(file_id, 0)
+            if not offset or offset != os.path.getsize(path):
+                report.files[file_id], rows = _scan(report, path, offset)
+                report.rows[file_id] = report.rows.get(file_id, 0) + rows
+        if number is not None:
+            report.segments[str(number)] = report.rows.get(file_id, 0)
+    # forget files and segments that no longer exist
+    live = {_file_id(path) for _, path in sources}
+    numbers = {str(number) for number, _ in sources}
+    report.files = {file_id: offset for file_id, offset in report.files.items() if file_id in live}
+    report.rows = {file_id: rows for file_id, rows in report.rows.items() if file_id in live}
+    report.segments = {number: rows for number, rows in report.segments.items() if number in numbers}
+    return report.to_dict()
+
+
+def build_reports(filenames, state_path=None):
+    """
+    Update the reports of several logs, incrementally if a state file is given.
+
+    Args:
+        filenames (list): Live log paths.
+        state_path (str): JSON file holding the state between runs.
+
+    Returns:
+        dict: filename -> QuizReport.
+    """
+    states = {}
+    if state_path and os.path.exists(state_path):
+        with open(state_path, encoding="utf-8") as file:
+            states = json.load(file)
+    states = {filename: update_report(filename, states.get(filename)) for filename in filenames}
+    if state_path:
+        with open(state_path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(states, file)
+        os.replace(state_path + ".tmp", state_path)
+    return {filename: QuizReport(state) for filename, state in states.items()}
+
+
+def format_summary(filename, summary):
+    lines = [f"{filename}: {summary['attempts']} attempts"]
+    if summary["accuracy"] is not None:
+        lines.append(f"  correct attempts   {summary['accuracy']:.1%}")
+    if summary["question_accuracy"] is not None:
+        lines.append(f"  questions correct  {summary['question_accuracy']:.1%}")
+    for prefix, rate in summary["error_rate_by_prefix"].items():
+        lines.append(f"  /{prefix:<2} error rate     {rate:.1%}")
+    for tries, count in summary["attempts_to_correct"].items():
+        label = "never correct" if tries == "failed" else f"correct on try {tries}"
+        lines.append(f"  {label:<18} {count}")
+    if summary["skipped"]:
+        lines.append(f"  skipped rows       {summary['skipped']}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Summarize the quiz result logs.")
+    parser.add_argument("logs", nargs="*", default=RESULT_FILES)
+    parser.add_argument("--state", help="JSON file that makes reruns incremental")
+    parser.add_argument("--json", action="store_true", help="print the summaries as JSON")
+    args = parser.parse_args()
+
+    reports = build_reports(args.logs, args.state)
+    summaries = {filename: report.summary() for filename, report in reports.items()}
+    if args.json:
+        print(json.dumps(summaries, indent=2))
+    else:
+        print("\n\n".join(format_summary(filename, summary) for filename, summary in summaries.items()))
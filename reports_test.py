@@ -0,0 +1,107 @@
+import os
+import tempfile
+import unittest
+
+from archive import compact
+from reports import QuizReport, build_reports, update_report
+from result_log import ResultLog
+
+CLASSFUL_COLUMNS = ['IP Address', 'CIDR Prefix', 'Score']
+CONVERSION_COLUMNS = ['Random Binary', 'Correct Decimal', 'User Guess', 'Result']
+WRONG = 'Good Effort! Please try again.'
+RIGHT = 'Congratulations! You got it right!'
+FAILED = "Sorry, you've used all 3 tries! Correct answer: 5."
+
+
+class TestReports(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.scored = os.path.join(self.directory.name, 'classful_quiz_results.csv')
+        self.conversion = os.path.join(self.directory.name, 'binary_to_decimal_results.csv')
+        self.state = os.path.join(self.directory.name, 'state.json')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_scored_summary(self):
+        log = ResultLog(self.scored, CLASSFUL_COLUMNS)
+        log.extend([['10.0.0.1', 20, '5/5'], ['10.0.0.2', 20, '3/5'], ['192.168.0.1', 26, '0/5']])
+        log.close()
+        summary = QuizReport(update_report(self.scored)).summary()
+        self.assertEqual(summary['attempts'], 3)
+        self.assertAlmostEqual(summary['accuracy'], 1 / 3)
+        self.assertAlmostEqual(summary['question_accuracy'], 8 / 15)
+        self.assertEqual(summary['error_rate_by_prefix'], {20: 0.2, 26: 1.0})
+
+    def test_attempts_to_correct(self):
+        log = ResultLog(self.conversion, CONVERSION_COLUMNS)
+        log.extend([['00000101', 5, 1, WRONG], ['00000110', 6, 6, RIGHT], ['00000101', 5, 2, WRONG],
+                    ['00000101', 5, 5, RIGHT], ['00000111', 7, 1, WRONG], ['00000111', 7, 1, WRONG],
+                    ['00000111', 7, 1, FAILED]])
+        log.close()
+        summary = QuizReport(update_report(self.conversion)).summary()
+        self.assertEqual(summary['attempts_to_correct'], {'1': 1, '3': 1, 'failed': 1})
+
+    def test_incremental_run_matches_full_run_across_rotation(self):
+        log = ResultLog(self.scored, CLASSFUL_COLUMNS, max_bytes=200)
+        for index in range(30):
+            log.append([f'10.0.0.{index}', 9 + index % 5, f'{index % 6}/5'])
+            if index % 7 == 0:
+                build_reports([self.scored], self.state)
+        log.close()
+        incremental = build_reports([self.scored], self.state)[self.scored].summary()
+        full = QuizReport(update_report(self.scored)).summary()
+        self.assertEqual(incremental, full)
+        self.assertEqual(full['attempts'], 30)
+
+    def test_archived_segments_are_still_counted(self):
+        log = ResultLog(self.scored, CLASSFUL_COLUMNS, max_bytes=200)
+        for index in range(30):
+            log.append([f'10.0.0.{index}', 9 + index % 5, f'{index % 6}/5'])
+            if index == 12:
+                build_reports([self.scored], self.state)
+                self.assertTrue(compact(self.scored, remove=True))
+        log.close()
+        incremental = build_reports([self.scored], self.state)[self.scored].summary()
+        compact(self.scored, remove=True)
+        after_compact = build_reports([self.scored], self.state)[self.scored].summary()
+        full = QuizReport(update_report(self.scored)).summary()
+        self.assertEqual(full['attempts'], 30)
+        self.assertEqual(incremental, full)
+        self.assertEqual(after_compact, full)
+
+    def test_archive_of_a_segment_read_only_while_live_is_recomputed(self):
+        log = ResultLog(self.scored, CLASSFUL_COLUMNS)
+        log.extend([['10.0.0.1', 20, '5/5'], ['10.0.0.2', 20, '3/5']])
+        state = update_report(self.scored)
+        log.rotate()
+        log.append(['10.0.0.3', 24, '1/5'])
+        log.close()
+        compact(self.scored, remove=True)
+        self.assertEqual(update_report(self.scored, state)['attempts'], 3)
+
+    def test_partial_line_is_left_for_the_next_run(self):
+        log = ResultLog(self.scored, CLASSFUL_COLUMNS)
+        log.append(['10.0.0.1', 20, '5/5'])
+        log.close()
+        with open(self.scored, 'a', newline='') as file:
+            file.write('10.0.0.2,20,3/')
+        state = update_report(self.scored)
+        self.assertEqual(state['attempts'], 1)
+        with open(self.scored, 'a', newline='') as file:
+            file.write('5\r\n')
+        self.assertEqual(update_report(self.scored, state)['attempts'], 2)
+
+    def test_replaced_file_is_recomputed(self):
+        log = ResultLog(self.scored, CLASSFUL_COLUMNS)
+        log.extend([['10.0.0.1', 20, '5/5'], ['10.0.0.2', 20, '3/5']])
+        log.close()
+        state = update_report(self.scored)
+        with open(self.scored, 'w', newline='') as file:
+            file.write('IP Address,CIDR Prefix,Score\r\n10.0.0.3,24,1/5\r\n')
+        self.assertEqual(update_report(self.scored, state)['attempts'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+Append-only result logging for the quiz routes.
+
+Every quiz attempt is written as a single CSV row at the end of the current
+log file. History is never reread or rewritten, so the cost of logging an
+attempt stays the same no matter how many attempts came before it.
+
+When a log grows past ``max_bytes`` it is closed and renamed to a numbered
+segment (``subnet_quiz_results.000001.csv``) and a fresh file is started.
+"""
+import csv
+import os
+import threading
+import time
+
+FSYNC_NEVER = "never"        # flush to the OS, let it decide when to hit disk
+FSYNC_ALWAYS = "always"      # fsync after every appended row
+FSYNC_INTERVAL = "interval"  # fsync at most once every fsync_interval seconds
+FSYNC_POLICIES = (FSYNC_NEVER, FSYNC_ALWAYS, FSYNC_INTERVAL)
+
+
+def segment_name(filename, number):
+    """
+    Build the file name of a closed log segment.
+
+    Args:
+        filename (str): Path of the live log file.
+        number (int): Segment number, starting at 1.
+
+    Returns:
+        str: Path of the segment.
+
+    Examples:
+        >>> segment_name('subnet_quiz_results.csv', 3)
+        'subnet_quiz_results.000003.csv'
+    """
+    stem, ext = os.path.splitext(filename)
+    return f"{stem}.{number:06d}{ext}"
+
+
+def list_segments(filename):
+    """
+    List the closed segments of a log, oldest first.
+
+    Args:
+        filename (str): Path of the live log file.
+
+    Returns:
+        list: Tuples of (segment number, segment path).
+    """
+    directory = os.path.dirname(filename) or "."
+    stem, ext = os.path.splitext(os.path.basename(filename))
+    segments = []
+    for name in os.listdir(directory):
+        if not (name.startswith(stem + ".") and name.endswith(ext)):
+            continue
+        number = name[len(stem) + 1:len(name) - len(ext)]
+        if number.isdigit():
+            segments.append((int(number), os.path.join(directory, name)))
+    return sorted(segments)
+
+
+class ResultLog:
+    """
+    Append-only CSV log of quiz attempts with optional rotation.
+
+    Args:
+        filename (str): Path of the live log file.
+        columns (list): Header row written at the top of every file.
+        fsync (str): One of FSYNC_NEVER, FSYNC_ALWAYS or FSYNC_INTERVAL.
+        fsync_interval (float): Seconds between fsyncs for FSYNC_INTERVAL.
+        max_bytes (int): Rotate once the live file reaches this size.
+            0 or None disables rotation.
+    """
+
+    def __init__(self, filename, columns, fsync=FSYNC_NEVER, fsync_interval=1.0, max_bytes=None):
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync!r}")
+        self.filename = filename
+        self.columns = list(columns)
+        self.fsync = fsync
+        self.fsync_interval = fsync_interval
+        self.max_bytes = max_bytes or 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._writer = None
+        self._size = 0
+        self._last_fsync = 0.0
+        self._next_segment = None
+
+    def _open(self):
+        # Only the header line of an existing file is ever read back. A file
+        # written with different columns is moved aside as a closed segment.
+        if os.path.exists(self.filename) and os.path.getsize(self.filename) > 0:
+            with open(self.filename, newline="", encoding="utf-8") as file:
+                header = next(csv.reader(file), None)
+            if header != self.columns:
+                self._rotate_file()
+
+        self._file = open(self.filename, "a", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._size = self._file.tell()
+        if self._size == 0:
+            self._writer.writerow(self.columns)
+            self._file.flush()
+            self._size = self._file.tell()
+
+    def _rotate_file(self):
+        if self._next_segment is None:
+            # archived segments (archive.py) count too, so a number is never
+            # reused after its CSV segment was archived and removed
+            stem = os.path.splitext(self.filename)[0]
+            segments = list_segments(self.filename) + list_segments(stem + ".qar")
+            self._next_segment = max(segments)[0] + 1 if segments else 1
+        os.replace(self.filename, segment_name(self.filename, self._next_segment))
+        self._next_segment += 1
+
+    def _sync(self):
+        if self.fsync == FSYNC_ALWAYS:
+            os.fsync(self._file.fileno())
+        elif self.fsync == FSYNC_INTERVAL:
+            now = time.monotonic()
+            if now - self._last_fsync >= self.fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_fsync = now
+
+    def append(self, row):
+        """
+        Append a single attempt to the log.
+
+        Args:
+            row (list or dict): Values in column order, or a dict keyed by
+                column name (missing columns are written empty).
+        """
+        self.extend([row])
+
+    def extend(self, rows):
+        """
+        Append several attempts to the log with a single flush.
+
+        Args:
+            rows (iterable): Rows accepted by append().
+        """
+        with self._lock:
+            if self._file is None:
+                self._open()
+            for row in rows:
+                if isinstance(row, dict):
+                    row = [row.get(column, "") for column in self.columns]
+                self._writer.writerow(row)
+            self._file.flush()
+            self._sync()
+            self._size = self._file.tell()
+            if self.max_bytes and self._size >= self.max_bytes:
+                self._close_segment()
+
+    def _close_segment(self):
+        if self._file is None:
+            return
+        if self.fsync != FSYNC_NEVER:
+            os.fsync(self._file.fileno())
+        self._file.close()
+        self._file = None
+        self._rotate_file()
+
+    def rotate(self):
+        """
+        Close the live file as a numbered segment and start a new one.
+        """
+        with self._lock:
+            self._close_segment()
+
+    def close(self):
+        """
+        Flush and close the live file. The log reopens on the next append.
+        """
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                if self.fsync != FSYNC_NEVER:
+                    os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
@@ -0,0 +1,67 @@
+import csv
+import os
+import tempfile
+import unittest
+from result_log import ResultLog, FSYNC_ALWAYS, list_segments, segment_name
+
+class TestResultLog(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "results.csv")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def read_rows(self, filename):
+        with open(filename, newline="", encoding="utf-8") as file:
+            return list(csv.reader(file))
+
+    def test_append_writes_header_once(self):
+        log = ResultLog(self.filename, ["A", "B"])
+        log.append(["1", "2"])
+        log.append({"B": "4", "A": "3"})
+        log.close()
+        log.append(["5", "6"])
+        log.close()
+        self.assertEqual(self.read_rows(self.filename),
+                         [["A", "B"], ["1", "2"], ["3", "4"], ["5", "6"]])
+
+    def test_fsync_always(self):
+        log = ResultLog(self.filename, ["A"], fsync=FSYNC_ALWAYS)
+        log.append(["1"])
+        log.close()
+        self.assertEqual(self.read_rows(self.filename), [["A"], ["1"]])
+
+    def test_unknown_fsync_policy(self):
+        with self.assertRaises(ValueError):
+            ResultLog(self.filename, ["A"], fsync="sometimes")
+
+    def test_rotation(self):
+        log = ResultLog(self.filename, ["A"], max_bytes=20)
+        for i in range(10):
+            log.append([f"row{i}"])
+        log.close()
+        segments = list_segments(self.filename)
+        self.assertEqual([number for number, _ in segments], list(range(1, len(segments) + 1)))
+        rows = []
+        for _, path in segments:
+            segment_rows = self.read_rows(path)
+            self.assertEqual(segment_rows[0], ["A"])
+            rows.extend(segment_rows[1:])
+        if os.path.exists(self.filename):
+            rows.extend(self.read_rows(self.filename)[1:])
+        self.assertEqual(rows, [[f"row{i}"] for i in range(10)])
+
+    def test_mismatched_header_is_moved_aside(self):
+        with open(self.filename, "w", encoding="utf-8") as file:
+            file.write("Old,Header\n1,2\n")
+        log = ResultLog(self.filename, ["A"])
+        log.append(["x"])
+        log.close()
+        self.assertEqual(self.read_rows(self.filename), [["A"], ["x"]])
+        self.assertEqual(self.read_rows(segment_name(self.filename, 1)),
+                         [["Old", "Header"], ["1", "2"]])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+"""
+SQLite storage for quiz results shared by every worker process.
+
+All four quizzes write to one ``attempts`` table. The columns every quiz
+has in common (IP, prefix, user answer, correct answer, result) are stored
+as real columns so they can be queried; the full row is kept as JSON in
+``payload``.
+
+The database runs in WAL mode, so readers never block the writer, and each
+thread of each process opens its own connection. Inserts take the write
+lock with ``BEGIN IMMEDIATE`` and wait up to ``timeout`` seconds for it,
+which makes concurrent inserts from many processes safe.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS attempts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    quiz TEXT NOT NULL,
+    recorded_at REAL NOT NULL,
+    ip TEXT,
+    prefix INTEGER,
+    user_answer TEXT,
+    correct_answer TEXT,
+    result TEXT,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS attempts_quiz ON attempts (quiz, id);
+"""
+
+# Shared columns a quiz can fill in from its own row
+SHARED_FIELDS = ("ip", "prefix", "user_answer", "correct_answer", "result")
+
+
+class SQLiteResultStore:
+    """
+    Connection manager for the results database.
+
+    Args:
+        path (str): Database file, created if missing.
+        timeout (float): Seconds to wait for another writer to finish.
+    """
+
+    def __init__(self, path, timeout=30.0):
+        self.path = path
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def connect(self):
+        """
+        Return this thread's connection, opening it on first use.
+
+        Returns:
+            sqlite3.Connection: Connection in autocommit mode.
+        """
+        pid = os.getpid()
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == pid:
+            return connection
+        connection = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.executescript(SCHEMA)
+        self._local.connection = connection
+        self._local.pid = pid
+        return connection
+
+    def insert(self, quiz, records):
+        """
+        Insert attempts in a single transaction.
+
+        Args:
+            quiz (str): Quiz name, e.g. 'classful_quiz'.
+            records (list): Dicts with any of SHARED_FIELDS plus a
+                'payload' dict holding the full row.
+        """
+        now = time.time()
+        params = [
+            (quiz, now, *(record.get(field) for field in SHARED_FIELDS),
+             json.dumps(record["payload"]))
+            for record in records
+        ]
+        connection = self.connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.executemany(
+                "INSERT INTO attempts (quiz, recorded_at, ip, prefix, user_answer,"
+                " correct_answer, result, payload) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                params)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def count(self, quiz=None):
+        """
+        Count stored attempts.
+
+        Args:
+            quiz (str): Only count this quiz. None counts all quizzes.
+
+        Returns:
+            int: Number of attempts.
+        """
+        connection = self.connect()
+        if quiz is None:
+            return connection.execute("SELECT COUNT(*) FROM attempts").fetchone()[0]
+        return connection.execute("SELECT COUNT(*) FROM attempts WHERE quiz = ?", (quiz,)).fetchone()[0]
+
+    def rows(self, quiz):
+        """
+        Iterate over the stored rows of one quiz, oldest first.
+
+        Args:
+            quiz (str): Quiz name.
+
+        Yields:
+            dict: The row as it was logged.
+        """
+        cursor = self.connect().execute("SELECT payload FROM attempts WHERE quiz = ? ORDER BY id", (quiz,))
+        for (payload,) in cursor:
+            yield json.loads(payload)
+
+    def table(self, quiz, columns, fields=None):
+        """
+        Sink for one quiz with the same interface as ResultLog.
+
+        Args:
+            quiz (str): Quiz name stored with every row.
+            columns (list): Column names of the quiz's rows.
+            fields (dict): Maps SHARED_FIELDS to the quiz's column names.
+
+        Returns:
+            QuizTable: The sink.
+        """
+        return QuizTable(self, quiz, columns, fields or {})
+
+    def close(self):
+        """
+        Close this thread's connection.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+class QuizTable:
+    """
+    Rows of one quiz in a SQLiteResultStore.
+
+    Accepts the same rows as ResultLog: lists in column order or dicts keyed
+    by column name.
+    """
+
+    def __init__(self, store, quiz, columns, fields):
+        unknown = set(fields) - set(SHARED_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown shared fields: {sorted(unknown)}")
+        self.store = store
+        self.quiz = quiz
+        self.columns = list(columns)
+        self.fields = fields
+
+    def _record(self, row):
+        if not isinstance(row, dict):
+            row = dict(zip(self.columns, row))
+        record = {field: row.get(column) for field, column in self.fields.items()}
+        record["payload"] = {column: row.get(column, "") for column in self.columns}
+        return record
+
+    def append(self, row):
+        """
+        Insert a single row.
+        """
+        self.extend([row])
+
+    def extend(self, rows):
+        """
+        Insert several rows in one transaction.
+        """
+        self.store.insert(self.quiz, [self._record(row) for row in rows])
+
+    def close(self):
+        """
+        Close the calling thread's database connection.
+        """
+        self.store.close()
@@ -0,0 +1,72 @@
+import multiprocessing
+import os
+import tempfile
+import threading
+import unittest
+from result_store import SQLiteResultStore
+
+COLUMNS = ['IP Address', 'CIDR Prefix', 'User Answers', 'Correct Answers', 'Score']
+FIELDS = {'ip': 'IP Address', 'prefix': 'CIDR Prefix', 'user_answer': 'User Answers',
+          'correct_answer': 'Correct Answers', 'result': 'Score'}
+
+
+def insert_rows(path, worker, threads, rows):
+    store = SQLiteResultStore(path)
+    table = store.table('classful_quiz', COLUMNS, FIELDS)
+
+    def client(number):
+        for i in range(rows):
+            table.append([f"10.{worker}.{number}.{i}", 24, "{}", "{}", "0/5"])
+        store.close()
+
+    workers = [threading.Thread(target=client, args=(n,)) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+
+
+class TestSQLiteResultStore(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "results.db")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_rows_round_trip(self):
+        store = SQLiteResultStore(self.path)
+        table = store.table('classful_quiz', COLUMNS, FIELDS)
+        table.append(["192.168.1.0", 28, "{'a': 1}", "{'a': 2}", "0/1"])
+        table.append({'IP Address': "10.0.0.1", 'Score': "1/1"})
+        self.assertEqual(store.count(), 2)
+        self.assertEqual(store.count('classful_quiz'), 2)
+        self.assertEqual(store.count('subnet_quiz'), 0)
+        rows = list(store.rows('classful_quiz'))
+        self.assertEqual(rows[0]['IP Address'], "192.168.1.0")
+        self.assertEqual(rows[1]['CIDR Prefix'], "")
+        prefix = store.connect().execute("SELECT prefix FROM attempts ORDER BY id").fetchone()[0]
+        self.assertEqual(prefix, 28)
+        self.assertEqual(store.connect().execute("PRAGMA journal_mode").fetchone()[0], "wal")
+        store.close()
+
+    def test_unknown_field(self):
+        store = SQLiteResultStore(self.path)
+        with self.assertRaises(ValueError):
+            store.table('classful_quiz', COLUMNS, {'score': 'Score'})
+
+    def test_concurrent_processes_lose_no_rows(self):
+        context = multiprocessing.get_context("spawn")
+        processes = [context.Process(target=insert_rows, args=(self.path, worker, 4, 25)) for worker in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+            self.assertEqual(process.exitcode, 0)
+        store = SQLiteResultStore(self.path)
+        self.assertEqual(store.count('classful_quiz'), 3 * 4 * 25)
+        store.close()
+
+if __name__ == "__main__":
+    unittest.main()
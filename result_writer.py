@@ -0,0 +1,244 @@
+"""
+Background batched writing of quiz results.
+
+Routes hand their result rows to a BatchWriter, which queues them in memory
+and lets a single writer thread append them to their logs in batches. A
+batch is written once it holds ``batch_size`` rows or ``flush_interval``
+seconds after its first row arrived, whichever comes first, so request
+latency no longer includes disk writes.
+
+The queue is bounded. When it is full, submit() blocks until the writer
+catches up (or drops the row after ``put_timeout`` seconds) and the event is
+counted in stats().
+"""
+import atexit
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+_FLUSH = object()
+
+
+class BatchWriter:
+    """
+    Queue of (sink, row) pairs drained by one background thread.
+
+    A sink is anything with an ``extend(rows)`` method, such as ResultLog.
+
+    Args:
+        batch_size (int): Write a batch once it holds this many rows.
+        flush_interval (float): Write a partial batch after this many seconds.
+        max_queue (int): Number of rows that may wait in memory.
+        put_timeout (float): Seconds submit() waits on a full queue before
+            dropping the row. None waits forever.
+    """
+
+    def __init__(self, batch_size=100, flush_interval=0.05, max_queue=10000, put_timeout=None):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.put_timeout = put_timeout
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._pid = None
+        self._thread = None
+        self._queue = None
+        self._reset_stats()
+        atexit.register(self.close)
+
+    def _reset_stats(self):
+        self._pending = 0
+        self._stats = {
+            "submitted": 0,
+            "written": 0,
+            "batches": 0,
+            "blocked": 0,
+            "dropped": 0,
+            "errors": 0,
+            "max_depth": 0,
+        }
+
+    def _ensure_started(self):
+        # The thread is started lazily, and again in a forked worker process,
+        # since threads do not survive fork().
+        pid = os.getpid()
+        if self._pid == pid and self._thread is not None:
+            return
+        with self._lock:
+            if self._pid == pid and self._thread is not None:
+                return
+            self._pid = pid
+            self._queue = queue.Queue(self.max_queue)
+            self._reset_stats()
+            self._thread = threading.Thread(target=self._run, name="result-writer", daemon=True)
+            self._thread.start()
+
+    def submit(self, sink, row):
+        """
+        Queue a row to be appended to a sink.
+
+        Args:
+            sink: Object with an ``extend(rows)`` method.
+            row: Row accepted by the sink.
+
+        Returns:
+            bool: False if the row was dropped because the queue stayed full.
+        """
+        self._ensure_started()
+        with self._lock:
+            self._pending += 1
+            self._stats["submitted"] += 1
+        try:
+            self._queue.put_nowait((sink, row))
+        except queue.Full:
+            with self._lock:
+                self._stats["blocked"] += 1
+            try:
+                self._queue.put((sink, row), timeout=self.put_timeout)
+            except queue.Full:
+                with self._lock:
+                    self._stats["dropped"] += 1
+                    self._finish(1)
+                return False
+        depth = self._queue.qsize()
+        with self._lock:
+            if depth > self._stats["max_depth"]:
+                self._stats["max_depth"] = depth
+        return True
+
+    def _finish(self, count):
+        # Caller holds self._lock
+        self._pending -= count
+        if self._pending <= 0:
+            self._idle.notify_all()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            if item is _FLUSH:
+                continue
+            batch = [item]
+            deadline = time.monotonic() + self.flush_interval
+            stop = False
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                if item is _FLUSH:
+                    break
+                batch.append(item)
+            self._write(batch)
+            if stop:
+                return
+
+    def _write(self, batch):
+        # Group rows by sink, keeping their order, so each sink sees one extend()
+        by_sink = {}
+        for sink, row in batch:
+            by_sink.setdefault(id(sink), (sink, []))[1].append(row)
+        errors = 0
+        for sink, rows in by_sink.values():
+            try:
+                sink.extend(rows)
+            except Exception:
+                errors += len(rows)
+                logger.exception("Failed to write %d result rows", len(rows))
+        with self._lock:
+            self._stats["written"] += len(batch) - errors
+            self._stats["errors"] += errors
+            self._stats["batches"] += 1
+            self._finish(len(batch))
+
+    def flush(self, timeout=None):
+        """
+        Wait until every submitted row has been written.
+
+        Args:
+            timeout (float): Maximum seconds to wait. None waits forever.
+
+        Returns:
+            bool: True if the queue drained in time.
+        """
+        if self._queue is not None:
+            # Cut the batch being collected short instead of waiting it out
+            try:
+                self._queue.put_nowait(_FLUSH)
+            except queue.Full:
+                pass
+        with self._lock:
+            return self._idle.wait_for(lambda: self._pending <= 0, timeout)
+
+    def close(self, timeout=None):
+        """
+        Write everything still queued and stop the writer thread.
+        """
+        if self._thread is None or self._pid != os.getpid():
+            return
+        self.flush(timeout)
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def stats(self):
+        """
+        Snapshot of the writer's backpressure counters.
+
+        Returns:
+            dict: submitted, written, batches, blocked, dropped and errors
+            counts, the current queue depth and the deepest it has been.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats["depth"] = self._queue.qsize() if self._queue is not None else 0
+        stats["pending"] = max(self._pending, 0)
+        return stats
+
+
+class QueuedLog:
+    """
+    Route rows for one sink through a BatchWriter.
+
+    Has the same ``append`` method as ResultLog, so it can stand in for one.
+
+    Args:
+        sink: Object with an ``extend(rows)`` method.
+        writer (BatchWriter): Writer that owns the background thread.
+    """
+
+    def __init__(self, sink, writer):
+        self.sink = sink
+        self.writer = writer
+
+    def append(self, row):
+        """
+        Queue a single row for the sink.
+        """
+        return self.writer.submit(self.sink, row)
+
+    def extend(self, rows):
+        """
+        Queue several rows for the sink.
+        """
+        for row in rows:
+            self.writer.submit(self.sink, row)
+
+    def close(self):
+        """
+        Write everything queued so far and close the sink.
+        """
+        self.writer.flush()
+        self.sink.close()
@@ -0,0 +1,88 @@
+import threading
+import time
+import unittest
+from result_writer import BatchWriter, QueuedLog
+
+class ListSink:
+
+    def __init__(self, delay=0):
+        self.rows = []
+        self.batches = 0
+        self.closed = False
+        self.delay = delay
+
+    def extend(self, rows):
+        time.sleep(self.delay)
+        self.rows.extend(rows)
+        self.batches += 1
+
+    def close(self):
+        self.closed = True
+
+class FailingSink:
+
+    def extend(self, rows):
+        raise OSError("disk full")
+
+class TestBatchWriter(unittest.TestCase):
+
+    def test_rows_are_written_in_order(self):
+        writer = BatchWriter(batch_size=10, flush_interval=0.01)
+        sink = ListSink()
+        for i in range(95):
+            writer.submit(sink, i)
+        self.assertTrue(writer.flush(timeout=5))
+        writer.close()
+        self.assertEqual(sink.rows, list(range(95)))
+        self.assertGreaterEqual(sink.batches, 10)
+
+    def test_concurrent_submitters_lose_nothing(self):
+        writer = BatchWriter(batch_size=50, flush_interval=0.01, max_queue=100)
+        sink = ListSink()
+
+        def submit(start):
+            for i in range(start, start + 100):
+                writer.submit(sink, i)
+
+        threads = [threading.Thread(target=submit, args=(n * 100,)) for n in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        writer.close()
+        self.assertEqual(sorted(sink.rows), list(range(2000)))
+        stats = writer.stats()
+        self.assertEqual(stats["written"], 2000)
+        self.assertLessEqual(stats["max_depth"], 100)
+
+    def test_full_queue_drops_after_timeout(self):
+        writer = BatchWriter(batch_size=1, flush_interval=0, max_queue=1, put_timeout=0.001)
+        sink = ListSink(delay=0.05)
+        results = [writer.submit(sink, i) for i in range(5)]
+        writer.close()
+        stats = writer.stats()
+        self.assertIn(False, results)
+        self.assertEqual(stats["dropped"], results.count(False))
+        self.assertGreater(stats["blocked"], 0)
+        self.assertEqual(len(sink.rows) + stats["dropped"], 5)
+
+    def test_sink_errors_are_counted(self):
+        writer = BatchWriter(batch_size=5, flush_interval=0.01)
+        writer.submit(FailingSink(), "row")
+        self.assertTrue(writer.flush(timeout=5))
+        writer.close()
+        self.assertEqual(writer.stats()["errors"], 1)
+
+    def test_queued_log_close_flushes(self):
+        writer = BatchWriter(batch_size=100, flush_interval=10)
+        sink = ListSink()
+        log = QueuedLog(sink, writer)
+        log.append("a")
+        log.extend(["b", "c"])
+        log.close()
+        writer.close()
+        self.assertEqual(sink.rows, ["a", "b", "c"])
+        self.assertTrue(sink.closed)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+"""
+Production launcher for the quiz app.
+
+    python serve.py --bind 0.0.0.0:8000 --workers 4 --threads 8
+
+Builds the app with app.create_app() and warms it with preload() before
+any worker starts: every template is compiled, the static fragments are
+rendered and the URL map is built in the parent process, so pre-forked workers share that memory instead of each
+paying for it on their first requests. The answer tables (PREFIX_TABLE,
+the first-octet class table, the valid mask sets) are built when the app's
+modules are imported, so they are loaded by then as well.
+
+With gunicorn installed this runs ``--workers`` pre-forked processes with
+``--threads`` request threads each (gthread workers). Without gunicorn it
+falls back to Werkzeug's threaded server in a single process.
+
+More than one worker needs storage that every process can see: set
+FLASK_RESULT_BACKEND=sqlite and FLASK_SESSION_BACKEND=sqlite (or cookie).
+Worker and thread counts default to FLASK_SERVE_WORKERS and
+FLASK_SERVE_THREADS.
+"""
+import argparse
+import gc
+import importlib.util
+
+from app import create_app
+from template_cache import cached_fragment
+
+
+def preload(app):
+    """
+    Warm the app before workers are forked.
+
+    Args:
+        app (Flask): The app from create_app().
+
+    Returns:
+        list: Names of the templates that were compiled.
+    """
+    names = [name for name in app.jinja_env.list_templates() if name.endswith('.html')]
+    for name in names:
+        app.jinja_env.get_template(name)
+    app.url_map.bind('localhost').match('/')
+    with app.test_request_context():
+        for name in names:
+            if name.startswith('_'):
+                cached_fragment(name)
+    return names
+
+
+def check_workers(app, workers):
+    """
+    Refuse worker counts the configured storage cannot serve.
+
+    Args:
+        app (Flask): The app from create_app().
+        workers (int): Number of worker processes.
+
+    Raises:
+        ValueError: If results or sessions live in one process but more
+            than one worker was asked for.
+    """
+    if workers < 1:
+        raise ValueError("need at least one worker")
+    if workers > 1 and app.config['RESULT_BACKEND'] == 'csv':
+        raise ValueError("the csv result backend supports one worker; set FLASK_RESULT_BACKEND=sqlite")
+    if workers > 1 and app.config['SESSION_BACKEND'] == 'memory':
+        raise ValueError("the memory session backend supports one worker; set FLASK_SESSION_BACKEND=sqlite")
+
+
+def gunicorn_options(app, bind, workers, threads):
+    """
+    Gunicorn settings for a launch.
+
+    Returns:
+        dict: Setting names and values for gunicorn's config.
+    """
+    writer = app.extensions['result_writer']
+    return {
+        'bind': bind,
+        'workers': workers,
+        'threads': threads,
+        'worker_class': 'gthread',
+        'backlog': 4096,
+        'preload_app': True,
+        # flush queued result rows before a worker exits
+        'worker_exit': lambda server, worker: writer.close(),
+    }
+
+
+def run_gunicorn(app, options):
+    from gunicorn.app.base import BaseApplication
+
+    class Launcher(BaseApplication):
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            return app
+
+    Launcher().run()
+
+
+def run_werkzeug(app, bind):
+    from werkzeug.serving import run_simple
+
+    host, _, port = bind.rpartition(':')
+    run_simple(host or '127.0.0.1', int(port), app, threaded=True)
+
+
+if __name__ == '__main__':
+    app = create_app()
+    app.config.setdefault('SERVE_WORKERS', 1)
+    app.config.setdefault('SERVE_THREADS', 8)
+
+    parser = argparse.ArgumentParser(description="Serve the quiz app in production.")
+    parser.add_argument('--bind', default='127.0.0.1:8000', help="host:port to listen on")
+    parser.add_argument('--workers', type=int, default=int(app.config['SERVE_WORKERS']))
+    parser.add_argument('--threads', type=int, default=int(app.config['SERVE_THREADS']))
+    parser.add_argument('--no-preload', action='store_true',
+                        help="skip warming templates before forking (for comparison)")
+    parser.add_argument('--server', choices=['auto', 'gunicorn', 'werkzeug'], default='auto')
+    args = parser.parse_args()
+
+    server = args.server
+    if server == 'auto':
+        server = 'gunicorn' if importlib.util.find_spec('gunicorn') else 'werkzeug'
+    if server == 'werkzeug' and args.workers != 1:
+        parser.error("the werkzeug server runs one worker; install gunicorn for more")
+    try:
+        check_workers(app, args.workers)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if not args.no_preload:
+        preload(app)
+        # keep the warmed objects out of the collector so workers do not copy them
+        gc.freeze()
+    if server == 'gunicorn':
+        run_gunicorn(app, gunicorn_options(app, args.bind, args.workers, args.threads))
+    else:
+        run_werkzeug(app, args.bind)
@@ -0,0 +1,41 @@
+import unittest
+
+from app_testing import make_app
+from serve import check_workers, gunicorn_options, preload
+
+
+class TestServe(unittest.TestCase):
+
+    def test_create_app_builds_independent_apps(self):
+        first = make_app(self, {'SESSION_BACKEND': 'cookie'})
+        second = make_app(self)
+        self.assertEqual(first.config['SESSION_BACKEND'], 'cookie')
+        self.assertIsNot(first.extensions['result_writer'], second.extensions['result_writer'])
+        self.assertTrue({'main', 'decimal_to_binary', 'binary_to_decimal', 'subnet_quiz_route', 'classful_quiz'}
+                        <= set(first.view_functions))
+
+    def test_preload_compiles_every_template(self):
+        app = make_app(self)
+        names = preload(app)
+        self.assertIn('classfuladdress.html', names)
+        cached = {name for _, name in app.jinja_env.cache.keys()}
+        self.assertTrue(set(names) <= cached)
+        self.assertIn(('_header.html', ''), app.extensions['fragment_cache'])
+
+    def test_check_workers(self):
+        csv = make_app(self, {'RESULT_BACKEND': 'csv'})
+        check_workers(csv, 1)
+        with self.assertRaises(ValueError):
+            check_workers(csv, 2)
+        with self.assertRaises(ValueError):
+            check_workers(make_app(self), 2)
+        check_workers(make_app(self, {'SESSION_BACKEND': 'cookie'}), 4)
+
+    def test_gunicorn_options(self):
+        options = gunicorn_options(make_app(self), '127.0.0.1:8000', 4, 8)
+        self.assertEqual((options['workers'], options['threads'], options['worker_class']), (4, 8, 'gthread'))
+        self.assertTrue(options['preload_app'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,285 @@
+"""
+Server-side quiz sessions.
+
+Flask's default session signs and ships the whole session dict in a cookie
+on every request. The quiz routes keep answers, questions and wrong guesses
+there, so that cookie grows with every attempt. ServerSideSessionInterface
+keeps the data on the server instead and only sends a short random session
+id to the browser.
+
+Two stores are provided:
+
+- MemorySessionStore: LRU dict with TTL eviction, for a single process.
+- SQLiteSessionStore: SQLite table shared by every worker process.
+"""
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from flask import has_request_context, request as current_request
+from flask.sessions import SessionInterface, SessionMixin
+from flask.json.tag import TaggedJSONSerializer
+from werkzeug.datastructures import CallbackDict
+
+
+def new_session_id():
+    """
+    Generate an unguessable session id.
+
+    Returns:
+        str: 22 URL-safe characters (128 random bits).
+    """
+    return secrets.token_urlsafe(16)
+
+
+class MemorySessionStore:
+    """
+    In-process session store with LRU and TTL eviction.
+
+    Args:
+        max_entries (int): Least recently used sessions are evicted past this.
+        ttl (float): Seconds a session lives after it was last saved.
+    """
+
+    def __init__(self, max_entries=10000, ttl=3600):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data = OrderedDict()
+
+    def get(self, sid):
+        """
+        Look up a session.
+
+        Args:
+            sid (str): Session id.
+
+        Returns:
+            dict: Session data, or None if unknown or expired.
+        """
+        with self._lock:
+            entry = self._data.get(sid)
+            if entry is None:
+                return None
+            expires, data = entry
+            if expires < time.monotonic():
+                del self._data[sid]
+                return None
+            self._data.move_to_end(sid)
+            return dict(data)
+
+    def set(self, sid, data):
+        """
+        Save a session and reset its TTL.
+        """
+        with self._lock:
+            self._data[sid] = (time.monotonic() + self.ttl, dict(data))
+            self._data.move_to_end(sid)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, sid):
+        """
+        Forget a session.
+        """
+        with self._lock:
+            self._data.pop(sid, None)
+
+    def __len__(self):
+        return len(self._data)
+
+
+class SQLiteSessionStore:
+    """
+    Session store shared by several worker processes through SQLite.
+
+    Expired sessions are purged every ``purge_every`` saves.
+
+    Args:
+        path (str): Database file, created if missing.
+        ttl (float): Seconds a session lives after it was last saved.
+        purge_every (int): Number of saves between purges.
+    """
+
+    def __init__(self, path, ttl=3600, purge_every=1000):
+        self.path = path
+        self.ttl = ttl
+        self.purge_every = purge_every
+        self.serializer = TaggedJSONSerializer()
+        self._local = threading.local()
+        self._saves = 0
+
+    def connect(self):
+        """
+        Return this thread's connection, opening it on first use.
+        """
+        pid = os.getpid()
+        connection = getattr(self._local, "connection", None)
+        if connection is not None and self._local.pid == pid:
+            return connection
+        connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "sid TEXT PRIMARY KEY, data TEXT NOT NULL, expires REAL NOT NULL)")
+        self._local.connection = connection
+        self._local.pid = pid
+        return connection
+
+    def get(self, sid):
+        """
+        Look up a session.
+
+        Returns:
+            dict: Session data, or None if unknown or expired.
+        """
+        row = self.connect().execute(
+            "SELECT data FROM sessions WHERE sid = ? AND expires >= ?", (sid, time.time())).fetchone()
+        return self.serializer.loads(row[0]) if row else None
+
+    def set(self, sid, data):
+        """
+        Save a session and reset its TTL.
+        """
+        connection = self.connect()
+        connection.execute(
+            "INSERT OR REPLACE INTO sessions (sid, data, expires) VALUES (?, ?, ?)",
+            (sid, self.serializer.dumps(dict(data)), time.time() + self.ttl))
+        self._saves += 1
+        if self._saves % self.purge_every == 0:
+            connection.execute("DELETE FROM sessions WHERE expires < ?", (time.time(),))
+
+    def delete(self, sid):
+        """
+        Forget a session.
+        """
+        self.connect().execute("DELETE FROM sessions WHERE sid = ?", (sid,))
+
+    def __len__(self):
+        return self.connect().execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+
+class ServerSideSession(CallbackDict, SessionMixin):
+    """
+    Session dict that remembers its id and whether it changed.
+    """
+
+    def __init__(self, initial=None, sid=None, new=False):
+        def on_update(self):
+            self.modified = True
+
+        super().__init__(initial, on_update)
+        self.sid = sid
+        self.new = new
+        self.modified = False
+        self.accessed = False
+
+    def __getitem__(self, key):
+        self.accessed = True
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.accessed = True
+        return super().get(key, default)
+
+    def setdefault(self, key, default=None):
+        self.accessed = True
+        return super().setdefault(key, default)
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """
+    Flask session interface that keeps session data in a store.
+
+    The cookie only holds the session id. It is sent when a session is
+    created (or refreshed, for permanent sessions), not on every response.
+
+    Args:
+        store: MemorySessionStore, SQLiteSessionStore or any object with
+            get(sid), set(sid, data) and delete(sid).
+    """
+
+    session_class = ServerSideSession
+
+    def __init__(self, store):
+        self.store = store
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            data = self.store.get(sid)
+            if data is not None:
+                return self.session_class(data, sid=sid)
+        return self.session_class(sid=new_session_id(), new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.accessed:
+            response.vary.add("Cookie")
+
+        if not session:
+            if session.modified and not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path)
+            return
+
+        # Routes mutate nested lists in place (wrong_guesses), which the
+        # CallbackDict cannot see, so any accessed session is written back.
+        if session.modified or session.accessed:
+            self.store.set(session.sid, session)
+
+        if session.new or (session.permanent and app.config["SESSION_REFRESH_EACH_REQUEST"]):
+            response.set_cookie(
+                name,
+                session.sid,
+                expires=self.get_expiration_time(app, session),
+                httponly=self.get_cookie_httponly(app),
+                domain=domain,
+                path=path,
+                secure=self.get_cookie_secure(app),
+                samesite=self.get_cookie_samesite(app),
+            )
+
+
+class TimedSessionInterface:
+    """
+    Wrap a session interface to time loading and saving sessions.
+
+    A session is loaded before the request is routed, so the load time is
+    left in the WSGI environ under SESSION_LOAD_KEY for the app to record
+    against the route. Saves are recorded directly. Every other attribute
+    comes from the wrapped interface.
+
+    Args:
+        interface: The Flask session interface to wrap.
+        metrics (Metrics): Registry holding ``histogram``.
+        histogram (str): Histogram labelled (route, phase).
+    """
+
+    SESSION_LOAD_KEY = "netquizzer.session_load_seconds"
+
+    def __init__(self, interface, metrics, histogram):
+        self.interface = interface
+        self.metrics = metrics
+        self.histogram = histogram
+
+    def __getattr__(self, name):
+        return getattr(self.interface, name)
+
+    def open_session(self, app, request):
+        started = time.perf_counter()
+        session = self.interface.open_session(app, request)
+        request.environ[self.SESSION_LOAD_KEY] = time.perf_counter() - started
+        return session
+
+    def save_session(self, app, session, response):
+        route = (current_request.endpoint if has_request_context() else None) or "unmatched"
+        with self.metrics.timer(self.histogram, (route, "session_save")):
+            return self.interface.save_session(app, session, response)
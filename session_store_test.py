@@ -0,0 +1,86 @@
+import os
+import tempfile
+import time
+import unittest
+from flask import Flask, session
+from session_store import MemorySessionStore, SQLiteSessionStore, ServerSideSessionInterface
+
+
+def make_app(store):
+    app = Flask(__name__)
+    app.secret_key = 'test'
+    app.session_interface = ServerSideSessionInterface(store)
+
+    @app.route('/add/<value>')
+    def add(value):
+        session.setdefault('guesses', [])
+        session['guesses'].append(value)
+        return ','.join(session['guesses'])
+
+    @app.route('/clear')
+    def clear():
+        session.clear()
+        return ''
+
+    @app.route('/static-page')
+    def static_page():
+        return 'hello'
+
+    return app
+
+
+class TestMemorySessionStore(unittest.TestCase):
+
+    def test_lru_eviction(self):
+        store = MemorySessionStore(max_entries=2)
+        store.set('a', {'n': 1})
+        store.set('b', {'n': 2})
+        store.get('a')
+        store.set('c', {'n': 3})
+        self.assertIsNone(store.get('b'))
+        self.assertEqual(store.get('a'), {'n': 1})
+        self.assertEqual(len(store), 2)
+
+    def test_ttl_expiry(self):
+        store = MemorySessionStore(ttl=0.01)
+        store.set('a', {'n': 1})
+        time.sleep(0.02)
+        self.assertIsNone(store.get('a'))
+
+
+class TestServerSideSessions(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def check_store(self, store):
+        client = make_app(store).test_client()
+        first = client.get('/add/1')
+        cookie = first.headers['Set-Cookie']
+        self.assertLess(len(cookie.split(';')[0]), 40)
+        second = client.get('/add/2')
+        self.assertEqual(second.get_data(as_text=True), '1,2')
+        self.assertNotIn('Set-Cookie', second.headers)
+        self.assertEqual(len(store), 1)
+        client.get('/clear')
+        self.assertEqual(len(store), 0)
+        self.assertEqual(client.get('/add/3').get_data(as_text=True), '3')
+
+    def test_memory_store(self):
+        self.check_store(MemorySessionStore())
+
+    def test_sqlite_store(self):
+        self.check_store(SQLiteSessionStore(os.path.join(self.tmpdir.name, 'sessions.db')))
+
+    def test_untouched_session_is_not_saved(self):
+        store = MemorySessionStore()
+        client = make_app(store).test_client()
+        response = client.get('/static-page')
+        self.assertNotIn('Set-Cookie', response.headers)
+        self.assertEqual(len(store), 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,14 @@
+import subprocess
+import sys
+import unittest
+
+class TestStartup(unittest.TestCase):
+
+    def test_app_import_skips_heavy_modules(self):
+        output = subprocess.run(
+            [sys.executable, "-c", "import sys, app; print(sorted({'pandas', 'numpy'} & set(sys.modules)))"],
+            capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "[]")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+// Submit quiz answers without reloading the page: the form is POSTed with
+// the X-Partial-Page header, the server renders only the page content, and
+// that HTML replaces the content of <main>. Without JavaScript the forms
+// submit normally and the server returns the full page.
+document.addEventListener('submit', async (event) => {
+    const form = event.target;
+    if (form.method.toLowerCase() !== 'post') {
+        return;
+    }
+    event.preventDefault();
+    try {
+        const response = await fetch(form.action, {
+            method: 'POST',
+            body: new URLSearchParams(new FormData(form)),
+            headers: {'X-Partial-Page': '1'},
+        });
+        document.querySelector('main').innerHTML = await response.text();
+    } catch (error) {
+        form.submit();
+    }
+});
@@ -0,0 +1,260 @@
+"""
+VLSM subnet planning for practice problems and for checking student plans.
+
+    python subnet_planner.py 192.168.10.0/24 60 28 12 2
+
+plan_vlsm() splits a parent block into one subnet per host requirement,
+each the smallest that holds its hosts plus the network and broadcast
+addresses. Subnets are handed out largest first from the start of the
+block: every block size is a power of two no bigger than the one before,
+so each subnet starts on a multiple of its own size and the plan needs no
+search or backtracking. When the requirements do not fit, ValueError says
+by how many addresses.
+
+Masks come from PREFIX_TABLE in wildcard_mask and addresses are 32-bit
+ints, as in address_engine, so a subnet costs a few integer operations
+and strings are only made by describe().
+
+check_plan() grades a student's plan, one reason code (or None) per
+requirement, and random_problem() draws a problem that always fits.
+"""
+import random
+from collections import namedtuple
+
+from address_engine import int_to_ip, ip_to_int
+from classaddress import generate_random_classful_address
+from wildcard_mask import PREFIX_TABLE
+
+# Reasons a subnet of a student's plan is wrong
+BAD_FORMAT = "bad_format"        # not an a.b.c.d/n block
+NOT_ALIGNED = "not_aligned"      # the address is not the network address of the block
+TOO_SMALL = "too_small"          # fewer usable hosts than required
+OVERSIZED = "oversized"          # holds the hosts, but a smaller block would too
+OUTSIDE_BLOCK = "outside_block"  # not inside the parent block
+OVERLAPS = "overlaps"            # shares addresses with another subnet of the plan
+
+# index: position of the requirement in the hosts list; prefix: PrefixInfo
+Subnet = namedtuple("Subnet", "index hosts prefix network broadcast first_host last_host")
+
+
+def prefix_for_hosts(hosts):
+    """
+    The longest prefix whose subnet holds a number of hosts.
+
+    Args:
+        hosts (int): Usable addresses needed, at least 1.
+
+    Returns:
+        int: The prefix length, at most 30.
+
+    Raises:
+        ValueError: If hosts is below 1 or more than an IPv4 block holds.
+
+    Examples:
+        >>> prefix_for_hosts(2), prefix_for_hosts(3), prefix_for_hosts(62), prefix_for_hosts(63)
+        (30, 29, 26, 25)
+    """
+    if hosts < 1:
+        raise ValueError(f"A subnet needs at least 1 host, got {hosts}")
+    # hosts + network + broadcast addresses, rounded up to a power of two
+    host_bits = max(2, (hosts + 1).bit_length())
+    if host_bits > 32:
+        raise ValueError(f"No IPv4 subnet holds {hosts} hosts")
+    return 32 - host_bits
+
+
+def parse_block(text, strict=True):
+    """
+    Parse an a.b.c.d/n block.
+
+    Args:
+        text (str): The block, e.g. "10.0.0.0/22".
+        strict (bool): Reject an address with host bits set.
+
+    Returns:
+        tuple: (address as an int, prefix length).
+
+    Raises:
+        ValueError: If the block is malformed, or not aligned when strict.
+
+    Examples:
+        >>> parse_block('10.0.4.0/22')
+        (167773184, 22)
+    """
+    ip, slash, prefix = text.strip().partition("/")
+    if not slash or not prefix.isdigit() or int(prefix) > 32:
+        raise ValueError(f"Invalid block: {text!r}")
+    address, prefix_length = ip_to_int(ip), int(prefix)
+    if strict and address & PREFIX_TABLE[prefix_length].mask != address:
+        raise ValueError(f"{text!r} has host bits set")
+    return address, prefix_length
+
+
+def plan_vlsm(network, prefix_length, hosts):
+    """
+    Allocate one subnet per host requirement inside a parent block.
+
+    Args:
+        network (int): The parent block's network address.
+        prefix_length (int): The parent block's prefix length.
+        hosts (list): Usable hosts needed by each subnet.
+
+    Returns:
+        list: A Subnet per requirement, in allocation order (largest
+        first; equal sizes in the order given).
+
+    Raises:
+        ValueError: If the parent block is not aligned, a requirement is
+            invalid, or the subnets do not fit.
+
+    Examples:
+        >>> plan = plan_vlsm(ip_to_int('192.168.10.0'), 24, [28, 60, 2])
+        >>> [(subnet.hosts, int_to_ip(subnet.network), subnet.prefix.prefix_length) for subnet in plan]
+        [(60, '192.168.10.0', 26), (28, '192.168.10.64', 27), (2, '192.168.10.96', 30)]
+    """
+    if not 0 <= prefix_length <= 32 or network & PREFIX_TABLE[prefix_length].mask != network:
+        raise ValueError(f"{int_to_ip(network)}/{prefix_length} is not a network address and prefix")
+    prefixes = [prefix_for_hosts(count) for count in hosts]
+    order = sorted(range(len(hosts)), key=prefixes.__getitem__)
+    end = network + (1 << (32 - prefix_length))
+    needed = sum(1 << (32 - prefixes[index]) for index in order)
+    if network + needed > end:
+        raise ValueError(f"The subnets need {needed} addresses; "
+                         f"{int_to_ip(network)}/{prefix_length} has {end - network}")
+    subnets = []
+    address = network
+    for index in order:
+        prefix = PREFIX_TABLE[prefixes[index]]
+        broadcast = address | (prefix.mask ^ 0xFFFFFFFF)
+        subnets.append(Subnet(index, hosts[index], prefix, address, broadcast, address + 1, broadcast - 1))
+        address = broadcast + 1
+    return subnets
+
+
+def plan(block, hosts):
+    """
+    plan_vlsm() for a block written as text, e.g. plan('10.0.0.0/22', [500, 200]).
+    """
+    return plan_vlsm(*parse_block(block), hosts)
+
+
+def describe(subnet):
+    """
+    The answers for one planned subnet, as the quiz pages show them.
+
+    Returns:
+        dict: Hosts Needed, Usable Hosts, Network Address, Prefix, Subnet
+        Mask, Wildcard Mask, First Host, Last Host and Broadcast Address.
+    """
+    prefix = subnet.prefix
+    return {
+        "Hosts Needed": subnet.hosts,
+        "Usable Hosts": subnet.broadcast - subnet.network - 1,
+        "Network Address": int_to_ip(subnet.network),
+        "Prefix": f"/{prefix.prefix_length}",
+        "Subnet Mask": prefix.subnet_mask,
+        "Wildcard Mask": prefix.wildcard_mask,
+        "First Host": int_to_ip(subnet.first_host),
+        "Last Host": int_to_ip(subnet.last_host),
+        "Broadcast Address": int_to_ip(subnet.broadcast),
+    }
+
+
+def check_plan(block, hosts, answers):
+    """
+    Grade a student's VLSM plan.
+
+    Args:
+        block (str): The parent block, e.g. "10.0.0.0/22".
+        hosts (list): Usable hosts needed by each subnet.
+        answers (list): The student's a.b.c.d/n block for each requirement,
+            in the same order as hosts.
+
+    Returns:
+        list: None for each correct subnet, otherwise one of the reason
+        codes above. A subnet that overlaps another is OVERLAPS even if it
+        is also wrong in another way, since it is the easier to miss.
+
+    Examples:
+        >>> check_plan('192.168.10.0/24', [60, 28], ['192.168.10.0/26', '192.168.10.64/26'])
+        [None, 'oversized']
+    """
+    network, prefix_length = parse_block(block)
+    end = network + (1 << (32 - prefix_length))
+    # a missing answer is graded like a malformed one
+    answers = list(answers) + [None] * (len(hosts) - len(answers))
+    reasons = [None] * len(hosts)
+    spans = []
+    for index, (count, answer) in enumerate(zip(hosts, answers)):
+        try:
+            address, length = parse_block(answer, strict=False)
+        except (ValueError, AttributeError):
+            reasons[index] = BAD_FORMAT
+            continue
+        mask = PREFIX_TABLE[length].mask
+        if address & mask != address:
+            reasons[index] = NOT_ALIGNED
+            continue
+        last = address | (mask ^ 0xFFFFFFFF)
+        spans.append((address, last, index))
+        if address < network or last >= end:
+            reasons[index] = OUTSIDE_BLOCK
+        elif length > prefix_for_hosts(count):
+            reasons[index] = TOO_SMALL
+        elif length < prefix_for_hosts(count):
+            reasons[index] = OVERSIZED
+    # in address order, a block overlaps an earlier one iff it starts before
+    # the furthest end reached so far
+    spans.sort()
+    reach, holder = -1, None
+    for start, last, index in spans:
+        if start <= reach:
+            reasons[index] = reasons[holder] = OVERLAPS
+        if last > reach:
+            reach, holder = last, index
+    return reasons
+
+
+def random_problem(rng=random, min_prefix=20, max_prefix=26, max_subnets=6):
+    """
+    Draw a VLSM problem that fits its parent block.
+
+    Args:
+        rng (random.Random): Source of randomness.
+        min_prefix (int): Shortest parent prefix.
+        max_prefix (int): Longest parent prefix; at most 28.
+        max_subnets (int): Most host requirements.
+
+    Returns:
+        tuple: (parent block as "a.b.c.d/n", list of host requirements).
+    """
+    prefix_length = rng.randint(min_prefix, max_prefix)
+    ip = generate_random_classful_address(rng)[0]
+    network = ip_to_int(ip) & PREFIX_TABLE[prefix_length].mask
+    free = 1 << (32 - prefix_length)
+    hosts = []
+    for _ in range(rng.randint(2, max_subnets)):
+        # a block of at most half the parent and at most what is left
+        host_bits = rng.randint(2, min(31 - prefix_length, free.bit_length() - 1))
+        free -= 1 << host_bits
+        # any count that needs exactly this block size
+        hosts.append(rng.randint((1 << (host_bits - 1)) - 1 if host_bits > 2 else 1, (1 << host_bits) - 2))
+        if free < 4:
+            break
+    return f"{int_to_ip(network)}/{prefix_length}", hosts
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Plan VLSM subnets inside a block.")
+    parser.add_argument("block", help="parent block, e.g. 192.168.10.0/24")
+    parser.add_argument("hosts", type=int, nargs="+", help="hosts needed by each subnet")
+    args = parser.parse_args()
+
+    columns = ["Hosts Needed", "Usable Hosts", "Network Address", "Prefix", "Subnet Mask",
+               "First Host", "Last Host", "Broadcast Address"]
+    print("  ".join(f"{column:<17}" for column in columns))
+    for subnet in plan(args.block, args.hosts):
+        row = describe(subnet)
+        print("  ".join(f"{row[column]!s:<17}" for column in columns))
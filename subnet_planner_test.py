@@ -0,0 +1,73 @@
+import ipaddress
+import random
+import unittest
+
+from address_engine import ip_to_int
+from subnet_planner import (BAD_FORMAT, NOT_ALIGNED, OUTSIDE_BLOCK, OVERLAPS, OVERSIZED, TOO_SMALL, check_plan,
+                            describe, plan, plan_vlsm, prefix_for_hosts, random_problem)
+
+
+class TestPlanner(unittest.TestCase):
+
+    def test_prefix_for_hosts(self):
+        for hosts in range(1, 5000):
+            prefix_length = prefix_for_hosts(hosts)
+            usable = (1 << (32 - prefix_length)) - 2
+            self.assertGreaterEqual(usable, hosts)
+            if prefix_length < 30:
+                self.assertLess((usable + 2) // 2 - 2, hosts)
+        with self.assertRaises(ValueError):
+            prefix_for_hosts(0)
+
+    def test_plans_match_ipaddress(self):
+        rng = random.Random(5)
+        for _ in range(300):
+            block, hosts = random_problem(rng)
+            parent = ipaddress.ip_network(block)
+            subnets = plan(block, hosts)
+            self.assertEqual(sorted(subnet.index for subnet in subnets), list(range(len(hosts))))
+            networks = []
+            for subnet in subnets:
+                network = ipaddress.ip_network((subnet.network, subnet.prefix.prefix_length))
+                self.assertTrue(network.subnet_of(parent))
+                self.assertEqual(subnet.broadcast, int(network.broadcast_address))
+                self.assertEqual(subnet.first_host, int(next(network.hosts())))
+                self.assertEqual(subnet.last_host, int(network.broadcast_address) - 1)
+                self.assertGreaterEqual(network.num_addresses - 2, hosts[subnet.index])
+                networks.append(network)
+            for first, second in zip(networks, networks[1:]):
+                self.assertFalse(first.overlaps(second))
+            answers = [None] * len(hosts)
+            for subnet in subnets:
+                answers[subnet.index] = describe(subnet)['Network Address'] + describe(subnet)['Prefix']
+            self.assertEqual(check_plan(block, hosts, answers), [None] * len(hosts))
+
+    def test_describe(self):
+        subnet = plan('10.0.0.0/22', [500, 200])[1]
+        self.assertEqual(describe(subnet), {
+            'Hosts Needed': 200, 'Usable Hosts': 254, 'Network Address': '10.0.2.0', 'Prefix': '/24',
+            'Subnet Mask': '255.255.255.0', 'Wildcard Mask': '0.0.0.255', 'First Host': '10.0.2.1',
+            'Last Host': '10.0.2.254', 'Broadcast Address': '10.0.2.255'})
+
+    def test_does_not_fit(self):
+        with self.assertRaises(ValueError):
+            plan('192.168.10.0/26', [60, 28])
+        with self.assertRaises(ValueError):
+            plan_vlsm(ip_to_int('192.168.10.5'), 24, [10])
+        with self.assertRaises(ValueError):
+            plan('192.168.10.5/24', [10])
+
+    def test_check_plan_reasons(self):
+        block, hosts = '192.168.10.0/24', [60, 28, 12, 2, 2, 5]
+        answers = ['192.168.10.0/26', '192.168.10.64/28', '192.168.10.96/27',
+                   '192.168.10.120/31/2', '192.168.10.130/30']
+        self.assertEqual(check_plan(block, hosts, answers),
+                         [None, TOO_SMALL, OVERSIZED, BAD_FORMAT, NOT_ALIGNED, BAD_FORMAT])
+        self.assertEqual(check_plan(block, [60, 28, 2], ['192.168.11.0/26', '192.168.10.0/27', '192.168.10.28/30']),
+                         [OUTSIDE_BLOCK, OVERLAPS, OVERLAPS])
+        self.assertEqual(check_plan(block, [100, 2, 2], ['192.168.10.0/25', '192.168.10.4/30', '192.168.10.64/30']),
+                         [OVERLAPS, OVERLAPS, OVERLAPS])
+
+
+if __name__ == '__main__':
+    unittest.main()
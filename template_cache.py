@@ -0,0 +1,98 @@
+"""
+Template caching for the quiz pages.
+
+Every page extends base.html, whose head and header (and the 128..1 bit
+value table of the binary quizzes) are static fragments: they are rendered
+once per app and mount point by cached_fragment() and reused as markup, so
+their url_for() calls do not run on every request.
+
+Compiled templates are also kept in a Jinja bytecode cache on disk, so a
+fresh worker process loads them without reparsing the template source.
+
+render_page() renders a whole page, or, for a POST sent with the
+X-Partial-Page header (see static/js/partial.js), only the page's
+``content`` block: the result of a submission without the head and header.
+"""
+from flask import current_app, render_template, request
+from jinja2 import FileSystemBytecodeCache
+from markupsafe import Markup
+
+PARTIAL_HEADER = 'X-Partial-Page'
+
+
+def init_templates(app):
+    """
+    Set up the bytecode and fragment caches of an app.
+
+    Must run before the app's Jinja environment is first used.
+
+    Args:
+        app (Flask): The app.
+    """
+    app.config.setdefault('TEMPLATE_BYTECODE_CACHE', True)
+    # None means Jinja's per-user directory under the system temp dir
+    app.config.setdefault('TEMPLATE_BYTECODE_DIR', None)
+    app.config.setdefault('TEMPLATE_FRAGMENT_CACHE', True)
+    app.config.setdefault('PARTIAL_RENDERING', True)
+    if app.config['TEMPLATE_BYTECODE_CACHE']:
+        app.jinja_options = dict(app.jinja_options,
+                                 bytecode_cache=FileSystemBytecodeCache(app.config['TEMPLATE_BYTECODE_DIR']))
+    app.extensions['fragment_cache'] = {}
+    app.jinja_env.globals['cached_fragment'] = cached_fragment
+
+
+def cached_fragment(name):
+    """
+    Render a static template fragment once and reuse it.
+
+    A fragment may only depend on url_for(), never on the request or the
+    session. The cache is bypassed while templates auto-reload (debug mode).
+
+    Args:
+        name (str): Template name of the fragment, e.g. '_header.html'.
+
+    Returns:
+        Markup: The rendered fragment.
+    """
+    app = current_app._get_current_object()
+    if not app.config['TEMPLATE_FRAGMENT_CACHE'] or app.jinja_env.auto_reload:
+        return Markup(render_template(name))
+    cache = app.extensions['fragment_cache']
+    # url_for() output depends on where the app is mounted
+    key = (name, request.script_root)
+    html = cache.get(key)
+    if html is None:
+        html = cache[key] = Markup(render_template(name))
+    return html
+
+
+def wants_partial():
+    """
+    Returns:
+        bool: True if this request asks for only the page content.
+    """
+    return (request.method == 'POST' and PARTIAL_HEADER in request.headers
+            and current_app.config['PARTIAL_RENDERING'])
+
+
+def render_page(template_name, **context):
+    """
+    Render a quiz page, or only its content block for a partial update.
+
+    Args:
+        template_name (str): A template that extends base.html.
+        **context: Template variables.
+
+    Returns:
+        Response: The rendered HTML, varying on the partial-page header.
+    """
+    app = current_app._get_current_object()
+    if wants_partial():
+        template = app.jinja_env.get_template(template_name)
+        app.update_template_context(context)
+        html = ''.join(template.blocks['content'](template.new_context(context)))
+    else:
+        html = render_template(template_name, **context)
+    response = app.make_response(html)
+    response.vary.add(PARTIAL_HEADER)
+    return response
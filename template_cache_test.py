@@ -0,0 +1,44 @@
+import unittest
+
+from markupsafe import Markup
+
+from app_testing import AppTestCase, make_app
+from template_cache import PARTIAL_HEADER
+
+
+class TestTemplateCache(AppTestCase):
+
+    CONFIG = {'SESSION_BACKEND': 'memory'}
+
+    def test_fragments_render_once(self):
+        first = self.client.get('/binary-to-decimal').data
+        cache = self.app.extensions['fragment_cache']
+        self.assertEqual({name for name, _ in cache}, {'_head.html', '_header.html', '_bit_table_head.html'})
+        cache[('_header.html', '')] = Markup('<header>cached</header>')
+        second = self.client.get('/decimal-to-binary').data
+        self.assertIn(b'<th scope="col">128</th>', first)
+        self.assertIn(b'<header>cached</header>', second)
+
+    def test_fragment_cache_off_matches_cached_page(self):
+        app = make_app(self, {'SESSION_BACKEND': 'memory', 'TEMPLATE_FRAGMENT_CACHE': False})
+        self.assertEqual(self.client.get('/').data, app.test_client().get('/').data)
+        self.assertEqual(app.extensions['fragment_cache'], {})
+
+    def test_partial_post_renders_content_only(self):
+        self.client.get('/classful_quiz')
+        full = self.client.post('/classful_quiz', data={'Address Class': 'A'})
+        self.client.get('/classful_quiz')
+        partial = self.client.post('/classful_quiz', data={'Address Class': 'A'}, headers={PARTIAL_HEADER: '1'})
+        self.assertIn(b'<header>', full.data)
+        self.assertNotIn(b'<header>', partial.data)
+        self.assertNotIn(b'<html', partial.data)
+        self.assertIn(b'Address Class', partial.data)
+        self.assertIn(PARTIAL_HEADER, partial.headers['Vary'])
+
+    def test_partial_header_ignored_on_get(self):
+        response = self.client.get('/subnet-quiz', headers={PARTIAL_HEADER: '1'})
+        self.assertIn(b'<header>', response.data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -7,6 +7,9 @@ Created on Thu Oct 17 22:39:19 2024
 
 import random
 import csv
+import os
+import time
+from collections import namedtuple
 
 # Define the list of subnets with their associated prefix lengths
 subList = [
@@ -32,34 +35,46 @@ subList = [
     ("49.49.218.206", 21)
 ]
 
-def generate_ip_and_prefix():
+def generate_ip_and_prefix(rng=random):
     """
     Generate a random valid Class A, B, or C IP address with a valid prefix length.
+
+    Args:
+        rng (random.Random): Source of randomness; the random module by default.
     
     Returns:
         tuple: A tuple containing a valid IP (str) and prefix length (int).
     """
     while True:
         # Generate a random IP
-        first_octet = random.choice(range(1, 224))  # Class A, B, or C
-        ip = f"{first_octet}.{random.randint(0, 255)}.{random.randint(0, 255)}.{random.randint(0, 255)}"
+        first_octet = rng.choice(range(1, 224))  # Class A, B, or C
+        ip = f"{first_octet}.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(0, 255)}"
         
         # Generate a valid prefix length
-        prefix_length = random.randint(1, 32)
+        prefix_length = rng.randint(1, 32)
         
         return ip, prefix_length
 
-def calculate_subnet_address_map(ip, prefix_length):
+class PrefixInfo(namedtuple("PrefixInfo", "prefix_length mask subnet_mask wildcard_mask address_map network_bits host_bits")):
     """
-    Calculate the Subnet Address Map (SAM) for a given IP and prefix length.
+    Every answer that depends only on a prefix length.
+
+    Attributes:
+        prefix_length (int): The prefix length (0-32).
+        mask (int): The subnet mask as a 32-bit integer.
+        subnet_mask (str): The subnet mask in dotted decimal format.
+        wildcard_mask (str): The wildcard mask in dotted decimal format.
+        address_map (str): The Subnet Address Map (e.g. "N.N.N.H").
+        network_bits (str): The number of network bits as a string.
+        host_bits (str): The number of host bits as a string.
+    """
+    __slots__ = ()
 
-    Args:
-        ip (str): The IP address.
-        prefix_length (int): The prefix length.
 
-    Returns:
-        str: SAM with N/H per octet (e.g., "N.N.N.H").
-    """
+def _build_prefix_info(prefix_length):
+    mask = (0xFFFFFFFF >> (32 - prefix_length)) << (32 - prefix_length)
+    octets = [(mask >> (24 - i * 8)) & 0xFF for i in range(4)]
+
     sam_octets = []
     for i in range(0, 32, 8):
         # Calculate bits in the current octet
@@ -76,8 +91,56 @@ def calculate_subnet_address_map(ip, prefix_length):
                 sam_octets.append('H')
             else:
                 sam_octets.append('S')
-    
-    return '.'.join(sam_octets)
+
+    return PrefixInfo(
+        prefix_length=prefix_length,
+        mask=mask,
+        subnet_mask='.'.join(str(octet) for octet in octets),
+        wildcard_mask='.'.join(str(255 - octet) for octet in octets),
+        address_map='.'.join(sam_octets),
+        network_bits=str(prefix_length),
+        host_bits=str(32 - prefix_length),
+    )
+
+
+# Answers for every prefix length, built once at import and indexed by prefix
+PREFIX_TABLE = tuple(_build_prefix_info(prefix_length) for prefix_length in range(33))
+
+
+def prefix_info(prefix_length):
+    """
+    Look up the precomputed answers for a prefix length.
+
+    Args:
+        prefix_length (int): The prefix length (0-32).
+
+    Returns:
+        PrefixInfo: The table entry.
+
+    Raises:
+        ValueError: If the prefix length is outside 0-32.
+
+    Examples:
+        >>> prefix_info(26).subnet_mask
+        '255.255.255.192'
+    """
+    if not 0 <= prefix_length <= 32:
+        raise ValueError(f"Invalid prefix length: {prefix_length}")
+    return PREFIX_TABLE[prefix_length]
+
+
+def calculate_subnet_address_map(ip, prefix_length):
+    """
+    Calculate the Subnet Address Map (SAM) for a given IP and prefix length.
+
+    Args:
+        ip (str): The IP address.
+        prefix_length (int): The prefix length.
+
+    Returns:
+        str: SAM with N/H per octet (e.g., "N.N.N.H").
+    """
+    return prefix_info(prefix_length).address_map
 
 
 def prefix_length_to_subnet_mask(prefix_length):   
@@ -92,9 +155,7 @@ def prefix_length_to_subnet_mask(prefix_length):
       str: The subnet mask in dotted decimal format. (ex. 255.255.255.0)
   """
     
-    mask = (0xFFFFFFFF >> (32 - prefix_length)) << (32 - prefix_length)
-    octets = [(mask >> (24 - i * 8)) & 0xFF for i in range(4)]
-    return '.'.join(str(octet) for octet in octets)
+    return prefix_info(prefix_length).subnet_mask
 
 # determines buts for subnet mask. Question 5
 
@@ -112,10 +173,7 @@ def prefix_network_bits(prefix_length):
   """
     
     # The number of network bits is simply the prefix length
-    network_bits = prefix_length
-    
-    # Return only the network bits
-    return str(network_bits)
+    return prefix_info(prefix_length).network_bits
 
 def prefix_host_bits(prefix_length):
     
@@ -129,11 +187,7 @@ def prefix_host_bits(prefix_length):
         str: The number of host bits as a string.
     """
     
-    # The number of network bits is simply the prefix length
-    network_bits = prefix_length
-    host_bits = 32 - network_bits
-    # Return only the network bits
-    return str(host_bits)
+    return prefix_info(prefix_length).host_bits
 
 
 # Function to calculate wildcard mask as inverse of the subnet mask
@@ -149,8 +203,7 @@ def calculate_wildcard_mask(prefix_length):
        str: The wildcard mask in dotted decimal format. (ex. "0.0.0.255")
    """
     
-    subnet_mask = prefix_length_to_subnet_mask(prefix_length)
-    return '.'.join(str(255 - int(octet)) for octet in subnet_mask.split('.'))
+    return prefix_info(prefix_length).wildcard_mask
 
 # Function to determine the class and pattern of an IP address
 
@@ -167,16 +220,13 @@ def get_address_class_and_pattern(ip):
       tuple: A tuple containing the class ('A', 'B', 'C', or 'Unknown') 
       and the pattern ('0', '10', '110', or 'Unknown').
   """
-    
-    first_octet = int(ip.split('.')[0])
-    if 1 <= first_octet <= 126:
-        return 'A', '0'
-    if 128 <= first_octet <= 191:
-        return 'B', '10'
-    if 192 <= first_octet <= 223:
-        return 'C', '110'
-    else:
+    # address_engine imports PREFIX_TABLE from this module
+    from address_engine import CLASSFUL_CLASSES, classify, ip_to_int
+
+    address_class = classify(ip_to_int(ip))
+    if address_class not in CLASSFUL_CLASSES:
         return 'Unknown', 'Unknown'
+    return address_class.name, address_class.leading_bits
 
 # Load questions from the CSV file (only the question text)
 
@@ -202,10 +252,116 @@ def load_questions_from_csv(filename):
             questions.append({"question": question})
     return questions
 
+# Question kinds, checked in order against the template text, with the
+# function that answers each kind for an (ip, prefix_length) pair
+QUESTION_KINDS = (
+    ("address_class", "Address Class",
+     lambda ip, prefix_length: " / ".join(get_address_class_and_pattern(ip))),
+    ("prefix_length", "the prefix length", lambda ip, prefix_length: str(prefix_length)),
+    ("wildcard_mask", "wildcard mask", lambda ip, prefix_length: calculate_wildcard_mask(prefix_length)),
+    ("subnet_mask", "the subnet mask", lambda ip, prefix_length: prefix_length_to_subnet_mask(prefix_length)),
+    ("network_bits", "network bits", lambda ip, prefix_length: prefix_network_bits(prefix_length)),
+    ("host_bits", "host bits", lambda ip, prefix_length: prefix_host_bits(prefix_length)),
+)
+
+QuestionTemplate = namedtuple("QuestionTemplate", "text kind answer")
+
+
+def compile_question(text):
+    """
+    Work out which kind of question a template asks, once.
+
+    Args:
+        text (str): Question template with {ip}, {prefix_length} and
+            {subnet_mask} placeholders.
+
+    Returns:
+        QuestionTemplate: The template, its kind, and its answer function.
+
+    Examples:
+        >>> template = compile_question("What would the wildcard mask be for a prefix length of {prefix_length}")
+        >>> template.kind, template.answer("10.0.0.0", 24)
+        ('wildcard_mask', '0.0.0.255')
+    """
+    for kind, keyword, answer in QUESTION_KINDS:
+        if keyword in text:
+            return QuestionTemplate(text, kind, answer)
+    return QuestionTemplate(text, "unknown", lambda ip, prefix_length: "Unknown")
+
+
+class QuestionBank:
+    """
+    Question templates parsed once from a CSV file.
+
+    The file's modification time is checked at most every ``check_interval``
+    seconds and the templates are reparsed only when it changed.
+
+    Args:
+        filename (str): The path to the CSV file containing the questions.
+        check_interval (float): Seconds between modification time checks.
+    """
+
+    def __init__(self, filename, check_interval=1.0):
+        self.filename = filename
+        self.check_interval = check_interval
+        self.templates = ()
+        self._mtime = None
+        self._checked = float("-inf")
+        self.reload()
+
+    def reload(self):
+        """
+        Parse the CSV file if it changed since it was last parsed.
+        """
+        self._checked = time.monotonic()
+        mtime = os.stat(self.filename).st_mtime_ns
+        if mtime == self._mtime:
+            return
+        with open(self.filename, mode='r', encoding='utf-8-sig') as file:
+            self.templates = tuple(compile_question(row[0]) for row in csv.reader(file) if row)
+        self._mtime = mtime
+
+    def pick(self, rng=random):
+        """
+        Pick a random question template.
+
+        Returns:
+            QuestionTemplate: The chosen template.
+        """
+        if time.monotonic() - self._checked >= self.check_interval:
+            self.reload()
+        return rng.choice(self.templates)
+
+    def generate(self, ip, prefix_length, rng=random):
+        """
+        Pick a random question and fill it in for an IP and prefix length.
+
+        Returns:
+            dict: 'question', 'answer', 'kind', 'ip' and 'prefix_length'.
+        """
+        template = self.pick(rng)
+        question = template.text.replace("{ip}", ip).replace("{prefix_length}", str(prefix_length)) \
+            .replace("{subnet_mask}", prefix_length_to_subnet_mask(prefix_length))
+        return {"question": question, "answer": template.answer(ip, prefix_length),
+                "kind": template.kind, "ip": ip, "prefix_length": prefix_length}
+
+
+_question_banks = {}
+
+
+def get_question_bank(filename):
+    """
+    Return the shared QuestionBank for a file, creating it on first use.
+    """
+    bank = _question_banks.get(filename)
+    if bank is None:
+        bank = _question_banks[filename] = QuestionBank(filename)
+    return bank
+
 # Generate a random subnet and pick a question from the CSV
 
 
-def generate_question_from_csv(filename):
+def generate_question_from_csv(filename, rng=random):
      
     """
     Randomly select a question from a CSV file.
@@ -213,46 +369,16 @@ def generate_question_from_csv(filename):
 
     Args:
         filename (str): The path to the CSV file containing the questions.
+        rng (random.Random): Source of randomness; the random module by default.
 
     Returns:
         dict: A dictionary containing 'question' and 'answer' keys.
     """
-    # Load the questions from the CSV file
-    questions = load_questions_from_csv(filename)
-
     # Pick a random subnet and prefix length from subList
-    ip, prefix_length = random.choice(subList)
-
-    # Pick a random question from the loaded questions
-    selected_question = random.choice(questions)
-
-    sub_func = prefix_length_to_subnet_mask(prefix_length)
-
-    # Replace placeholders with the correct output
-    question_with_subnet = selected_question["question"].replace("{ip}", ip).replace("{prefix_length}",
-                                            str(prefix_length)).replace("{subnet_mask}", sub_func)
-
-    # Dynamically generate the correct answer
-    if "Address Class" in question_with_subnet:
-        correct_answer=f"{get_address_class_and_pattern(ip)[0]} / " \
-                 f"{get_address_class_and_pattern(ip)[1]}"
-    elif "the prefix length" in question_with_subnet:
-        correct_answer=str(prefix_length)
-    elif "wildcard mask" in question_with_subnet:
-        correct_answer=calculate_wildcard_mask(prefix_length)
-    elif "the subnet mask" in question_with_subnet:
-        correct_answer=prefix_length_to_subnet_mask(prefix_length)
-    elif "network bits" in question_with_subnet:
-        # Get network and host bits using the prefix_bits function
-        correct_answer=prefix_network_bits(prefix_length)
-    elif "host bits" in question_with_subnet:
-        # Get network and host bits using the prefix_bits function
-        correct_answer=prefix_host_bits(prefix_length)
-    else:
-        correct_answer="Unknown"
-
-    return {"question": question_with_subnet, "answer": correct_answer,
-            "ip": ip, "prefix_length": prefix_length}
+    ip, prefix_length = rng.choice(subList)
+
+    # The bank is parsed once and answers through each template's compiled kind
+    return get_question_bank(filename).generate(ip, prefix_length, rng)
 
 # Ask the question and check the user's answer
 def ask_question(question_data):
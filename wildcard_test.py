@@ -11,8 +11,14 @@ from wildcard_mask import (
     generate_ip_and_prefix,
     get_address_class_and_pattern,
     prefix_network_bits,
-    prefix_host_bits
+    prefix_host_bits,
+    calculate_subnet_address_map,
+    PREFIX_TABLE,
+    QuestionBank
 )
+import ipaddress
+import os
+import tempfile
 
 class TestWildcardMask(unittest.TestCase):
 
@@ -47,5 +53,47 @@ class TestWildcardMask(unittest.TestCase):
         self.assertEqual(prefix_host_bits(16), "16")
         self.assertEqual(prefix_host_bits(8), "24")
 
+    def test_prefix_table_matches_ipaddress(self):
+        for prefix_length, info in enumerate(PREFIX_TABLE):
+            network = ipaddress.ip_network(f"0.0.0.0/{prefix_length}")
+            self.assertEqual(info.prefix_length, prefix_length)
+            self.assertEqual(info.subnet_mask, str(network.netmask))
+            self.assertEqual(info.wildcard_mask, str(network.hostmask))
+            self.assertEqual(info.mask, int(network.netmask))
+
+    def test_calculate_subnet_address_map(self):
+        self.assertEqual(calculate_subnet_address_map("10.0.0.1", 8), "N.H.H.H")
+        self.assertEqual(calculate_subnet_address_map("10.0.0.1", 20), "N.N.S.H")
+        self.assertEqual(calculate_subnet_address_map("10.0.0.1", 28), "N.N.N.S")
+        self.assertEqual(calculate_subnet_address_map("10.0.0.1", 0), "H.H.H.H")
+
+    def test_invalid_prefix_length(self):
+        with self.assertRaises(ValueError):
+            prefix_length_to_subnet_mask(33)
+        with self.assertRaises(ValueError):
+            calculate_wildcard_mask(-1)
+
+    def test_question_bank(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "questions.csv")
+            with open(filename, "w", encoding="utf-8-sig") as file:
+                file.write("Enter the Address Class for {ip}\n")
+            bank = QuestionBank(filename, check_interval=0)
+            question = bank.generate("172.16.0.1", 12)
+            self.assertEqual(question["question"], "Enter the Address Class for 172.16.0.1")
+            self.assertEqual(question["answer"], "B / 10")
+            self.assertEqual(question["kind"], "address_class")
+
+            with open(filename, "w", encoding="utf-8") as file:
+                file.write("How many host bits are used with {subnet_mask}\n")
+            os.utime(filename, ns=(0, 10**9))
+            question = bank.generate("172.16.0.1", 12)
+            self.assertEqual(question["question"], "How many host bits are used with 255.240.0.0")
+            self.assertEqual(question["answer"], "20")
+
+    def test_question_bank_file_kinds(self):
+        bank = QuestionBank(os.path.join(os.path.dirname(os.path.abspath(__file__)), "questions.csv"))
+        self.assertNotIn("unknown", [template.kind for template in bank.templates])
+
 if __name__ == "__main__":
     unittest.main()